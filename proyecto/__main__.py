@@ -2,16 +2,20 @@ from .modelos.menu import *
 from .modelos.grafo import *
 from .modelos.dfs import AlgoritmoDFS
 from .modelos.bfs import AlgoritmoBFS
+from .modelos.rutas import AlgoritmoDijkstra
+from .modelos.tareas import Tarea
+from .modelos import instrumentacion
+from .almacenamiento import *
 import os
 import platform
 import shutil 
 import subprocess
-from typing import List
-import json 
-import csv
+import sys
+import contextlib
 
-carpetaGrafos = 'datos_grafos' # Esta es la carpeta donde se guardan los grafos del programa
-carpetaExportar = 'csv' # Esta es la carpeta donde se exportan los datos de los grafos
+consolaPreparada = False # En Windows se activan las secuencias ANSI la primera vez que se limpia la consola
+rutaCacheTitulos = os.path.join(os.path.dirname(__file__), '.titulos.json') # Títulos de los menús ya dibujados con art
+limiteAlgoritmos = 600 # Segundos que puede tardar un recorrido o árbol del menú antes de detenerse
 
 # Para utilizar editores graficos, se verifica si la maquina es windows
 def esWindows() -> bool:
@@ -42,160 +46,103 @@ def abrirArchivoConEditor(nombreArchivo: str) -> bool:
     except Exception as e:
         return False 
 
-def limpiarConsola():
-    '''
-    Este metodo puede limpiar la consola de sistema basados en Unix (Linux, macOS) o en Nt (Windows)
-    '''
-    try:
-
-        sistemaOperativo = os.name
-
-        if sistemaOperativo == 'posix':
-            # Si el sistema operativo es UNIX (Linux, macOS)
-            os.system('clear')
-        elif sistemaOperativo == 'nt':
-            # Si el sistema operativo es Windows
-            os.system('cls')
-
-    except Exception as e:
-        pass 
-
-def eliminarArchivo(nombreArchivo: str) -> bool:
+def archivoEditable(nombreGrafo: str) -> Union[str, None]:
     '''
-    Elimina un archivo (archivo.extension) del almacenamiento del programa.
+    Devuelve el archivo en el que está (o en el que se guardará) el grafo si es JSON sin comprimir, el único formato que se puede abrir con un editor de texto. En otro caso devuelve None.
     '''
-    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
-    try:
-        if existeArchivo(nombreArchivo):
-            os.remove(ruta)
-            return True 
-        return False 
-    except OSError as e:
-        return False 
+    archivo = obtenerArchivoGrafo(nombreGrafo)
+    if archivo == None:
+        archivo = nombreGrafo if separarExtension(nombreGrafo)[1] != '' else nombreGrafo + '.json' # Así guarda guardarGrafo un grafo nuevo
+    return archivo if archivo.endswith('.json') else None
 
-def eliminarGrafo(nombreGrafo: str) -> bool:
-    f'''
-    Elimina un archivo que guarda la informacion de un grafo en el almacenamiento del programa.
+def limpiarConsola():
     '''
-    archivo = nombreGrafo + '.json'
-    return eliminarArchivo(archivo)
+    Este metodo limpia la consola escribiendo las secuencias ANSI que usan "clear" y "cls" (mover el cursor al inicio y borrar la pantalla y el historial), sin abrir un proceso cada vez.
 
-def obtenerArchivos() -> List[str]:
-    '''
-    Devuelve una lista de todos los archivos dentro del almacenamiento del programa.
+    En Windows la primera llamada ejecuta un comando vacío, que activa las secuencias ANSI en la consola.
     '''
-    carpeta = os.path.join(os.path.dirname(__file__), carpetaGrafos)
-    if os.path.exists(carpeta) and os.path.isdir(carpeta):
-        archivos = os.listdir(carpeta)
-        return archivos 
-    return []
+    global consolaPreparada
+    try:
+        if os.name == 'nt' and not consolaPreparada:
+            os.system('')
+        consolaPreparada = True
+        sys.stdout.write('\033[H\033[2J\033[3J')
+        sys.stdout.flush()
+    except Exception as e:
+        pass 
 
-def existeArchivo(nombreArchivo: str) -> bool:
+def mostrarProgresoCarga(bytesLeidos: int, bytesTotales: int):
     '''
-    Devuelve un booleano respondiendo a la pregunta si existe un archivo con el nombre nombreArchivo dentro del almacenamiento del programa.
+    Muestra en una sola línea de la consola el porcentaje cargado de un grafo.
     '''
-    carpeta = os.path.join(os.path.dirname(__file__), carpetaGrafos)
-    if os.path.exists(carpeta) and os.path.isdir(carpeta):
-        archivos = os.listdir(carpeta)
-        return nombreArchivo in archivos
-    return False 
+    if bytesTotales > 0:
+        print(f'\rCargando grafo... {min(100, bytesLeidos * 100 // bytesTotales)}%', end='', flush=True)
 
-def existenGrafos() -> bool:
+@contextlib.contextmanager
+def teclasSinEnter():
     '''
-    Esta funcion indica si existe al menos un grafo almacenado en el programa
+    Mientras está activo, las teclas presionadas se pueden leer con teclaPresionada sin esperar a que se presione enter. En Windows no hace falta cambiar la consola.
     '''
-    archivos = obtenerArchivos()
-    grafos = [grafo for grafo in archivos if grafo.endswith('.json')]
-    return len(grafos) > 0
+    if os.name == 'nt' or not sys.stdin.isatty():
+        yield
+        return
+    import termios
+    import tty
+    descriptor = sys.stdin.fileno()
+    configuracion = termios.tcgetattr(descriptor)
+    try:
+        tty.setcbreak(descriptor)
+        yield
+    finally:
+        termios.tcsetattr(descriptor, termios.TCSADRAIN, configuracion)
 
-def obtenerGrafos() -> List[str]:
+def teclaPresionada() -> str:
     '''
-    Esta funcion devuelve una lista de los nombres de los grafos disponibles.
+    Devuelve la tecla presionada o una cadena vacía si no se presionó ninguna, sin bloquear.
     '''
-    archivos = obtenerArchivos()
-    grafos = [grafo[:-5] for grafo in archivos if grafo.endswith('.json')]
-    return grafos 
-
-def guardarGrafo(grafo: 'Grafo', nombre: str):
+    if os.name == 'nt':
+        import msvcrt
+        return msvcrt.getwch() if msvcrt.kbhit() else ''
+    if not sys.stdin.isatty():
+        return ''
+    import select
+    listos, _, _ = select.select([sys.stdin], [], [], 0)
+    return sys.stdin.read(1) if listos else ''
+
+def ejecutarAlgoritmo(funcion, *args) -> 'Tarea':
     '''
-    Esta funcion guarda el grafo que se pasa como parámetro en un archivo .json, no es necesario pasarle el nombre con la extensión ya que lo agrega automáticamente.
+    Ejecuta un recorrido, ruta o árbol en segundo plano y muestra en una línea los nodos visitados, el tamaño de la cola o pila y el tiempo transcurrido. Con la tecla C (o Ctrl+C) se cancela y, igual que al pasar limiteAlgoritmos, queda disponible el resultado parcial en la tarea.
     '''
-    grafoDiccionario = grafo.to_dict() # Se convierte al grafo en un diccionario
-    nombreArchivo = nombre + '.json'
-    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
-    with open(ruta, 'w') as archivo:
-        json.dump(grafoDiccionario, archivo, indent=4)
-
-def exportarGrafo(grafo: 'Grafo', nombreGrafo: str) -> bool:
+    tarea = Tarea(instrumentacion.perfilado(funcion), *args, limite=limiteAlgoritmos)
+    print('\nPresione C para cancelar...', end='', flush=True)
+    with teclasSinEnter():
+        while True:
+            try:
+                if tarea.esperar(0.2):
+                    break
+                print(f'\rNodos visitados: {tarea.visitados} | Por revisar: {tarea.frontera} | {tarea.tiempo:.1f} s | Presione C para cancelar...', end='', flush=True)
+                if teclaPresionada().lower() == 'c':
+                    tarea.cancelar()
+            except KeyboardInterrupt:
+                tarea.cancelar()
+    print()
+    if tarea.estado == 'cancelada':
+        print(f'Cancelado después de {tarea.tiempo:.1f} s y {tarea.visitados} nodos visitados. Se muestra el resultado parcial.')
+    elif tarea.estado == 'vencida':
+        print(f'Se detuvo al pasar el límite de {limiteAlgoritmos} s con {tarea.visitados} nodos visitados. Se muestra el resultado parcial.')
+    return tarea
+
+def pedirPeso() -> Union[float, None]:
     '''
-    Esta funcion recibe un grafo y crea dos archivos csv dentro de la carpeta "csv" del proyecto, estos archivos estan agrupados en una carpeta con el nombre del grafo, los archivos tienen la extensión csv.
-    Un archivo almacena los nodos, mientras que otro almacena las aristas.
-
-    ---
-    Returns:
-    - True: Si se logró exportar el grafo exitosamente
-    - False: Si no se puedo exportar el grafo
+    Pide el peso de una arista por consola. Si no se escribe nada el peso es 1, si lo escrito no es un número devuelve None.
     '''
+    peso = input('Escriba el peso de la arista, presione enter para peso 1: ')
+    if peso.strip() == '':
+        return 1
     try:
-        rutaCarpeta = os.path.join(os.path.dirname(__file__), carpetaExportar, nombreGrafo)
-
-        # Se crea la carpeta
-        os.makedirs(rutaCarpeta)
-
-        # Se extraen los nodos del grafo
-        nodosEncabezado = [['Id','Label']] # Es el encabezado del archivo que guardará lo nodos
-        nodos = [[nodo.identificador, nodo.contenido] for nodo in grafo.nodos]
-        nodos = nodosEncabezado + nodos 
-
-        # Se extraen las aristas del grafo
-        tipo = 'Directed' if grafo.esDirigido() else 'Undirected'
-        aristasEncabezado = [['Source','Target','Type','Id']]
-        aristas = [[arista.a, arista.b, tipo, arista.identificador] for arista in grafo.aristas]
-        aristas = aristasEncabezado + aristas
-        
-        # Se obtienen las rutas para guardar los archivos
-        rutaArchivoNodos = os.path.join(rutaCarpeta, 'nodos.csv')
-        rutaArchivoAristas = os.path.join(rutaCarpeta, 'aristas.csv')
-
-        # Se guardan los archivos
-        with open(rutaArchivoNodos, 'w', newline='') as file:
-            writter = csv.writer(file, delimiter=',')
-            writter.writerows(nodos)
-
-        with open(rutaArchivoAristas, 'w', newline='') as file:
-            writter = csv.writer(file, delimiter=',')
-            writter.writerows(aristas)
-
-        return True 
-
-    except Exception as e:
-        return False 
-
-def obtenerGrafo(nombreGrafo: str) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
-    '''
-    Esta funcion devuelve un grafo guardado en alguno de los archivos del almacenamiento del programa.
-    '''
-    nombreArchivo = nombreGrafo + '.json'
-    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
-    with open(ruta, 'r') as archivo:
-        grafoDict = json.load(archivo)
-    
-    # Primero se crea el grafo sea dirigido o no dirigido
-    if grafoDict['dirigido']:
-        grafoRecuperado = GrafoDirigido()
-    else:
-        grafoRecuperado = GrafoNoDirigido()
-    
-    # Se reconstruyen los nodos
-    for nodoData in grafoDict['nodos']:
-        nodo = Nodo(nodoData['identificador'], nodoData['contenido'])
-        grafoRecuperado.agregarNodo(nodo)
-    
-    # Se reconstruyen las aristas
-    for aristaData in grafoDict['aristas']:
-        grafoRecuperado.agregarArista(aristaData['a'], aristaData['b'], aristaData['identificador'])
-    
-    return grafoRecuperado
+        return float(peso)
+    except ValueError:
+        return None
 
 def seleccionarGrafo() -> str:
     '''
@@ -203,22 +150,27 @@ def seleccionarGrafo() -> str:
     '''
     limpiarConsola()
     grafos = obtenerGrafos()
-    menuAuxiliar = MenuSinGrafo(grafos, 'Seleccionar un grafo') # Se crea un menu auxiliar
+    menuAuxiliar = MenuSinGrafo([describirGrafo(grafo) for grafo in grafos], 'Seleccionar un grafo') # Se crea un menu auxiliar
     print(menuAuxiliar.textoPorConsola(FUENTE_STANDARD))
     menuAuxiliar.pedirOpcion()
-    return menuAuxiliar.opciones[menuAuxiliar.opcion]
+    return grafos[menuAuxiliar.opcion]
 
     
 
 def main():
-    menuPrincipal = MenuSinGrafo(['Salir', 'Grafos', 'Algoritmos'], 'Proyecto EDA II')
-    menuGrafos = MenuSinGrafo(['Atrás', 'Crear grafo', 'Seleccionar grafo existente'], 'GRAFOS')
-    menuAlgoritmos = MenuConGrafo(['Atrás', 'BFS', 'DFS'], 'Algoritmos')
+    activarCacheTitulos(rutaCacheTitulos)
+    instrumentacion.activarDesdeEntorno()
+    obtenerCatalogo().refrescar() # Una vez al empezar, por si se copiaron o borraron grafos a mano mientras el programa estaba cerrado
+    menuPrincipal = MenuSinGrafo(['Salir', 'Grafos', 'Algoritmos', 'Instrumentación'], 'Proyecto EDA II')
+    menuGrafos = MenuSinGrafo(['Atrás', 'Crear grafo', 'Seleccionar grafo existente', 'Importar grafo (lista de aristas o CSV)'], 'GRAFOS')
+    menuAlgoritmos = MenuConGrafo(['Atrás', 'BFS', 'DFS', 'Dijkstra'], 'Algoritmos')
     menuCrearGrafo = MenuConGrafo(['Atrás y crear','Atrás y descartar','Añadir nodo','Añadir arista','Eliminar nodo', 'Eliminar arista','Abrir editor de texto* Solo disponible en Windows'], 'Crear Grafo')
-    menuGrafoSeleccionado = MenuConGrafo(['Atrás','Mostrar grafo completo','Editar grafo','Eliminar grafo','Obtener nodos','Obtener bordes','Exportar grafo a csv'], 'Grafo Seleccionado')
-    menuEditarGrafo = MenuConGrafo(['Atrás','Añadir nodo','Añadir arista','Eliminar nodo','Eliminar arista','Abrir editor de texto* Solo disponible en Windows'], 'Editar Grafo')
+    menuGrafoSeleccionado = MenuConGrafo(['Atrás','Mostrar grafo completo','Editar grafo','Eliminar grafo','Obtener nodos','Obtener bordes','Exportar grafo (CSV, GraphML o GEXF)','Calcular centralidades'], 'Grafo Seleccionado')
+    menuEditarGrafo = MenuConGrafo(['Atrás','Añadir nodo','Añadir arista','Eliminar nodo','Eliminar arista','Abrir editor de texto* Solo disponible en Windows','Atrás y descartar'], 'Editar Grafo')
     menuAlgoritmoBFS = MenuConGrafo(['Atrás','Mostrar recorrido', 'Mostrar ruta más corta','Generar árbol BFS'], 'Algoritmo BFS')
     menuAlgoritmoDFS = MenuConGrafo(['Atrás','Mostrar recorrido', 'Mostrar ruta DFS','Generar árbol DFS'], 'Algoritmo DFS')
+    menuAlgoritmoDijkstra = MenuConGrafo(['Atrás','Mostrar distancias', 'Mostrar ruta de menor costo'], 'Algoritmo Dijkstra')
+    menuInstrumentacion = MenuSinGrafo(['Atrás','Activar contadores','Activar contadores, memoria y perfil','Desactivar','Mostrar reporte','Reiniciar contadores'], 'Instrumentacion')
     
     while menuPrincipal.opcion != 0:
         try:
@@ -234,7 +186,7 @@ def main():
                     if menuGrafos.opcion == 1:
 
                         nombreGrafo = input('Escriba el nombre del grafo que desea crear: ')
-                        if existeArchivo(nombreGrafo+'.json'):
+                        if existeGrafo(separarExtension(nombreGrafo)[0]):
                             input('Ese nombre ya existe. Presiona una tecla para continuar...')
                         else:
                             dirigido = input('¿El grafo es dirigido? (S|N): ')
@@ -264,9 +216,10 @@ def main():
                                     print('NOTA: en un grafo dirigido el primer nodo ingresado es el nodo origen mientras que el segundo es el nodo de destino.')
                                     nodo1 = input('Escriba el id del primer nodo: ')
                                     nodo2 = input('Escriba el id del segundo nodo: ')
+                                    peso = pedirPeso()
                                     r = False 
-                                    if nodo1.isdigit() and nodo2.isdigit():
-                                        r = grafo1.agregarArista(int(nodo1),int(nodo2))
+                                    if nodo1.isdigit() and nodo2.isdigit() and peso != None:
+                                        r = grafo1.agregarArista(int(nodo1),int(nodo2),peso=peso)
                                     if not r:
                                         print('No se pudo agregar la arista, revise los datos.\nPresione una tecla para continuar...', end="")
                                         input()
@@ -289,9 +242,12 @@ def main():
                                         print('No se pudo eliminar la arista, revise los datos.\nPresione una tecla para continuar...', end="")
                                         input()
                                 if menuCrearGrafo.opcion == 6: # Abrir editor grafico
-                                    if esWindows():
-                                        guardarGrafo(grafo1, nombreGrafo)
-                                        r = abrirArchivoConEditor(nombreGrafo + '.json')
+                                    archivo = archivoEditable(nombreGrafo) if esWindows() else None
+                                    if esWindows() and archivo == None:
+                                        input('El editor solo abre grafos guardados en JSON sin comprimir. Presione una tecla para continuar...')
+                                    elif esWindows():
+                                        guardarGrafo(grafo1, nombreGrafo, completo=True) # El editor necesita el grafo completo en el archivo
+                                        r = abrirArchivoConEditor(archivo)
                                         if not r:
                                             input('No se pudo abrir el archivo. Presione una tecla para continuar...')
                                         else:
@@ -308,7 +264,7 @@ def main():
                             input('No tiene grafos disponibles. Presione enter para continuar...')
                         else:
                             nombreGrafo = seleccionarGrafo() # Se pide seleccionar un grafo de los archivos
-                            grafo1 = obtenerGrafo(nombreGrafo) # Se carga el grafo de los archivos
+                            grafo1 = abrirGrafo(nombreGrafo, mostrarProgresoCarga) # Se abre el grafo de los archivos, mapeado si es posible
                             menuGrafoSeleccionado.nombreGrafo = nombreGrafo
                             menuEditarGrafo.nombreGrafo = nombreGrafo
 
@@ -317,12 +273,19 @@ def main():
                                 print(menuGrafoSeleccionado.textoPorConsola(FUENTE_CYBERLARGE))
                                 menuGrafoSeleccionado.pedirOpcion()
                                 if menuGrafoSeleccionado.opcion == 0: # Atras guardando grafo
-                                    guardarGrafo(grafo1, nombreGrafo)
+                                    if isinstance(grafo1, GrafoMapeado): # Un grafo mapeado no se modifica, no hace falta guardarlo
+                                        cerrarGrafo(grafo1)
+                                    else:
+                                        guardarGrafo(grafo1, nombreGrafo)
+                                        cerrarGrafo(grafo1)
                                 if menuGrafoSeleccionado.opcion == 1: # Mostrar grafo completo
                                     limpiarConsola()
                                     print(grafo1)
                                     input('Presione una tecla para continuar...')
                                 elif menuGrafoSeleccionado.opcion == 2: # Editar grafo
+                                    if isinstance(grafo1, GrafoMapeado): # Para editarlo se necesita el grafo completo en memoria
+                                        cerrarGrafo(grafo1)
+                                        grafo1 = obtenerGrafo(nombreGrafo, mostrarProgresoCarga)
                                     
                                     while menuEditarGrafo.opcion != 0:
                                         limpiarConsola()
@@ -339,9 +302,10 @@ def main():
                                             print('NOTA: en un grafo dirigido el primer nodo ingresado es el nodo origen mientras que el segundo es el nodo de destino.')
                                             nodo1 = input('Escriba el id del primer nodo: ')
                                             nodo2 = input('Escriba el id del segundo nodo: ')
+                                            peso = pedirPeso()
                                             r = False 
-                                            if nodo1.isdigit() and nodo2.isdigit():
-                                                r = grafo1.agregarArista(int(nodo1),int(nodo2))
+                                            if nodo1.isdigit() and nodo2.isdigit() and peso != None:
+                                                r = grafo1.agregarArista(int(nodo1),int(nodo2),peso=peso)
                                             if not r:
                                                 print('No se pudo agregar la arista, revise los datos.\nPresione una tecla para continuar...', end="")
                                                 input()
@@ -364,9 +328,12 @@ def main():
                                                 print('No se pudo eliminar la arista, revise los datos.\nPresione una tecla para continuar...', end="")
                                                 input()
                                         elif menuEditarGrafo.opcion == 5: # Abrir editor gráfico
-                                            if esWindows():
-                                                guardarGrafo(grafo1, nombreGrafo)
-                                                r = abrirArchivoConEditor(nombreGrafo + '.json')
+                                            archivo = archivoEditable(nombreGrafo) if esWindows() else None
+                                            if esWindows() and archivo == None:
+                                                input('El editor solo abre grafos guardados en JSON sin comprimir. Presione una tecla para continuar...')
+                                            elif esWindows():
+                                                guardarGrafo(grafo1, nombreGrafo, completo=True) # El editor necesita el grafo completo en el archivo
+                                                r = abrirArchivoConEditor(archivo)
                                                 if not r:
                                                     input('No se pudo abrir el archivo. Presione una tecla para continuar...')
                                                 else:
@@ -374,10 +341,14 @@ def main():
                                                     menuGrafoSeleccionado.opcion = 0 
                                             else:
                                                 input('No tiene acceso a esta opcion. Presione una tecla para continuar...')
+                                        elif menuEditarGrafo.opcion == 6: # Descartar los cambios de esta edición y salir
+                                            grafo1 = descartarCambios(grafo1, nombreGrafo, mostrarProgresoCarga)
+                                            menuEditarGrafo.opcion = 0
 
                                     menuEditarGrafo.opcion = -1 # Se restablece la opcion de menuEditarGrafo
 
                                 elif menuGrafoSeleccionado.opcion == 3: # Eliminar grafo
+                                    cerrarGrafo(grafo1)
                                     eliminarGrafo(nombreGrafo)
                                     menuGrafoSeleccionado.opcion = 0 # Para que salga del menu ya que el grafo ya no existe
                                     input('Presione una tecla para continuar...')
@@ -388,13 +359,44 @@ def main():
                                     print(grafo1.aristas)
                                     input('Presione una tecla para continuar...')
                                 elif menuGrafoSeleccionado.opcion == 6: # Exportar grafo
-                                    r = exportarGrafo(grafo1, nombreGrafo)
+                                    formato = input('Escriba el formato (csv, graphml, gexf), presione enter para csv: ').strip().lower() or 'csv'
+                                    compresion = input(f'Escriba la compresión de los archivos ({", ".join(COMPRESORES)}), presione enter para no comprimir: ').strip()
+                                    if compresion != '' and not compresion.startswith('.'):
+                                        compresion = '.' + compresion
+                                    r = compresion in COMPRESORES or compresion == ''
+                                    if r:
+                                        r = exportarGrafo(grafo1, nombreGrafo, compresion, formato)
                                     if not r:
-                                        print('No se pudo exportar el grafo. ', ends='')
+                                        print('No se pudo exportar el grafo. ', end='')
+                                    input('Presione una tecla para continuar...')
+                                elif menuGrafoSeleccionado.opcion == 7: # Calcular centralidades
+                                    resultados = calcularMetricas(grafo1, nombreGrafo)
+                                    for nombreMetrica, resultado in resultados.items():
+                                        print(f'{nombreMetrica}: {resultado.iteraciones} iteraciones en {resultado.tiempo:.3f} segundos')
+                                    print(f'Métricas guardadas en {nombreGrafo}.metricas.csv')
                                     input('Presione una tecla para continuar...')
 
                             menuGrafoSeleccionado.opcion = -1 # Se restablece la opcion de menuGrafoSeleccionado
 
+                    elif menuGrafos.opcion == 3:
+
+                        ruta = input('Escriba la ruta del archivo o de la carpeta con nodos.csv y aristas.csv: ').strip().strip('"')
+                        nombreGrafo = input('Escriba el nombre del grafo importado: ')
+                        if existeGrafo(separarExtension(nombreGrafo)[0]): # En cualquier formato, comparten el diario de edición
+                            input('Ese nombre ya existe. Presiona una tecla para continuar...')
+                        else:
+                            dirigido = input('¿El grafo es dirigido? Las tablas de Gephi con la columna Type lo indican solas (S|N): ')
+                            procesos = input('Escriba la cantidad de procesos para leer el archivo, presione enter para usar todos los CPUs: ')
+                            resultado = importarGrafo(ruta, nombreGrafo, dirigido.upper() != 'N', int(procesos) if procesos.isdigit() else None, mostrarProgresoCarga)
+                            print()
+                            if resultado == None:
+                                input('No se pudo importar el grafo, revise la ruta y el formato. Presione una tecla para continuar...')
+                            else:
+                                print(f'{len(resultado.grafo.nodos)} nodos y {len(resultado.grafo.aristas)} aristas importados en {resultado.tiempo:.2f} segundos ({resultado.filasPorSegundo:.0f} filas por segundo).')
+                                if resultado.descartadas:
+                                    print(f'Se descartaron {resultado.descartadas} filas que no se pudieron interpretar.')
+                                input('Presione una tecla para continuar...')
+
                 menuGrafos.opcion = -1 # Se restablece la opcion de menuGrafos
 
             elif menuPrincipal.opcion == 2:
@@ -403,10 +405,11 @@ def main():
                     input('No tiene grafos disponibles. Presione enter para continuar...')
                 else:
                     nombreGrafo = seleccionarGrafo() # Se pide seleccionar un grafo de los archivos
-                    grafo1 = obtenerGrafo(nombreGrafo) # Se carga el grafo de los archivos
+                    grafo1 = abrirGrafo(nombreGrafo, mostrarProgresoCarga) # Se abre el grafo de los archivos, mapeado si es posible
                     menuAlgoritmos.nombreGrafo = nombreGrafo
                     menuAlgoritmoBFS.nombreGrafo = nombreGrafo
                     menuAlgoritmoDFS.nombreGrafo = nombreGrafo
+                    menuAlgoritmoDijkstra.nombreGrafo = nombreGrafo
 
                     while menuAlgoritmos.opcion != 0:
                         limpiarConsola()
@@ -423,7 +426,7 @@ def main():
                                     print(grafo1)
                                     idNodo = input('\n\nEscriba el numero identificador del nodo de inicio: ')
                                     if idNodo.isdigit():
-                                        print(f'\nRecorrido BFS: {AlgoritmoBFS.obtenerRecorridoEnOrden(grafo1, int(idNodo))}')
+                                        print(f'\nRecorrido BFS: {ejecutarAlgoritmo(AlgoritmoBFS.obtenerRecorridoEnOrden, grafo1, int(idNodo)).obtenerResultado()}')
                                     else:
                                         print('Identificador inválido. Revise los datos...', end="")
                                     input('Presione una tecla para continuar...')
@@ -434,7 +437,7 @@ def main():
                                     nodoDestino = input('Escriba el id del nodo de destino: ')
                                     r = False 
                                     if nodoInicio.isdigit() and nodoDestino.isdigit():
-                                        print(f'\nRuta más corta: {AlgoritmoBFS.encontrarRutaMasCorta(grafo1, int(nodoInicio), int(nodoDestino))}')
+                                        print(f'\nRuta más corta: {ejecutarAlgoritmo(AlgoritmoBFS.encontrarRutaMasCorta, grafo1, int(nodoInicio), int(nodoDestino)).obtenerResultado()}')
                                         r = True 
                                     if not r:
                                         print('Identificador inválido. Revise los datos...', end="")
@@ -444,14 +447,14 @@ def main():
                                     print(grafo1)
                                     raiz = input('\n\nEscriba el numero identificador del nodo raiz: ')
                                     if raiz.isdigit():
-                                        arbol = AlgoritmoBFS.generarArbolBFS(grafo1, int(raiz))
+                                        arbol = ejecutarAlgoritmo(AlgoritmoBFS.generarArbolBFS, grafo1, int(raiz)).obtenerResultado()
                                         print(f'\nArbol BFS: \n{arbol}')
 
-                                        # Opcion para guardar el arbol
-                                        guardarArbol = input('¿Desea guardar el árbol generado? (S|N): ')
+                                        # Opcion para guardar el arbol, si se canceló antes de empezar no hay árbol
+                                        guardarArbol = input('¿Desea guardar el árbol generado? (S|N): ') if arbol != None else 'N'
                                         if guardarArbol.upper() == 'S':
                                             nombreArbol = input('Escriba el nombre del arbol: ')
-                                            if existeArchivo(nombreArbol +'.json'):
+                                            if existeGrafo(separarExtension(nombreArbol)[0]):
                                                 input('Ese nombre ya existe. Presiona una tecla para continuar...')
                                             else:
                                                 guardarGrafo(arbol, nombreArbol)
@@ -473,7 +476,7 @@ def main():
                                     print(grafo1)
                                     idNodo = input('\n\nEscriba el numero identificador del nodo de inicio: ')
                                     if idNodo.isdigit():
-                                        print(f'\nRecorrido DFS: {AlgoritmoDFS.obtenerRecorridoEnOrden(grafo1, int(idNodo))}')
+                                        print(f'\nRecorrido DFS: {ejecutarAlgoritmo(AlgoritmoDFS.obtenerRecorridoEnOrden, grafo1, int(idNodo)).obtenerResultado()}')
                                     else:
                                         print('Identificador inválido. Revise los datos...', end="")
                                     input('Presione una tecla para continuar...')
@@ -484,7 +487,7 @@ def main():
                                     nodoDestino = input('Escriba el id del nodo de destino: ')
                                     r = False 
                                     if nodoInicio.isdigit() and nodoDestino.isdigit():
-                                        print(f'\nRuta más corta: {AlgoritmoDFS.encontrarRuta(grafo1, int(nodoInicio), int(nodoDestino))}')
+                                        print(f'\nRuta más corta: {ejecutarAlgoritmo(AlgoritmoDFS.encontrarRuta, grafo1, int(nodoInicio), int(nodoDestino)).obtenerResultado()}')
                                         r = True 
                                     if not r:
                                         print('Identificador inválido. Revise los datos...', end="")
@@ -494,14 +497,14 @@ def main():
                                     print(grafo1)
                                     raiz = input('\n\nEscriba el numero identificador del nodo raiz: ')
                                     if raiz.isdigit():
-                                        arbol = AlgoritmoDFS.generarArbolDFS(grafo1, int(raiz))
+                                        arbol = ejecutarAlgoritmo(AlgoritmoDFS.generarArbolDFS, grafo1, int(raiz)).obtenerResultado()
                                         print(f'\nArbol BFS: \n{arbol}')
 
-                                        # Opcion para guardar el arbol
-                                        guardarArbol = input('¿Desea guardar el árbol generado? (S|N): ')
+                                        # Opcion para guardar el arbol, si se canceló antes de empezar no hay árbol
+                                        guardarArbol = input('¿Desea guardar el árbol generado? (S|N): ') if arbol != None else 'N'
                                         if guardarArbol.upper() == 'S':
                                             nombreArbol = input('Escriba el nombre del arbol: ')
-                                            if existeArchivo(nombreArbol +'.json'):
+                                            if existeGrafo(separarExtension(nombreArbol)[0]):
                                                 input('Ese nombre ya existe. Presiona una tecla para continuar...')
                                             else:
                                                 guardarGrafo(arbol, nombreArbol)
@@ -512,10 +515,68 @@ def main():
 
                             menuAlgoritmoDFS.opcion = -1 # Se restablece la opcion de menuAlgoritmoDFS
 
+                        elif menuAlgoritmos.opcion == 3:
+
+                            while menuAlgoritmoDijkstra.opcion != 0:
+                                limpiarConsola()
+                                print(menuAlgoritmoDijkstra.textoPorConsola(FUENTE_CYBERLARGE))
+                                menuAlgoritmoDijkstra.pedirOpcion()
+                                if menuAlgoritmoDijkstra.opcion == 1: # Mostrar distancias
+                                    limpiarConsola()
+                                    print(grafo1)
+                                    idNodo = input('\n\nEscriba el numero identificador del nodo de inicio: ')
+                                    if idNodo.isdigit():
+                                        print(f'\nDistancias: {AlgoritmoDijkstra.calcularDistancias(grafo1, int(idNodo))}')
+                                    else:
+                                        print('Identificador inválido. Revise los datos...', end="")
+                                    input('Presione una tecla para continuar...')
+                                elif menuAlgoritmoDijkstra.opcion == 2: # Mostrar ruta de menor costo
+                                    limpiarConsola()
+                                    print(grafo1)
+                                    nodoInicio = input('\n\nEscriba el id del nodo de inicio: ')
+                                    nodoDestino = input('Escriba el id del nodo de destino: ')
+                                    if nodoInicio.isdigit() and nodoDestino.isdigit():
+                                        resultado = AlgoritmoDijkstra.encontrarRutaMasCorta(grafo1, int(nodoInicio), int(nodoDestino))
+                                        if resultado != None:
+                                            print(f'\nRuta de menor costo: {resultado[0]} \nCosto: {resultado[1]}')
+                                        else:
+                                            print('\nNo existe una ruta entre los nodos.')
+                                    else:
+                                        print('Identificador inválido. Revise los datos...', end="")
+                                    input('Presione una tecla para continuar...')
+
+                            menuAlgoritmoDijkstra.opcion = -1 # Se restablece la opcion de menuAlgoritmoDijkstra
+
+                    cerrarGrafo(grafo1)
                     menuAlgoritmos.opcion = -1 # Se restablece la opcion de menuAlgoritmos
 
+            elif menuPrincipal.opcion == 3:
+
+                while menuInstrumentacion.opcion != 0:
+                    limpiarConsola()
+                    print(menuInstrumentacion.textoPorConsola(FUENTE_CYBERLARGE))
+                    print('Estado:', 'activa' if instrumentacion.estaActiva() else 'desactivada')
+                    menuInstrumentacion.pedirOpcion()
+                    if menuInstrumentacion.opcion == 1: # Solo contadores, casi no cambia los tiempos
+                        instrumentacion.activar()
+                    elif menuInstrumentacion.opcion == 2: # tracemalloc y cProfile hacen mas lentos los algoritmos
+                        instrumentacion.activar(memoria=True, perfil=True)
+                    elif menuInstrumentacion.opcion == 3:
+                        instrumentacion.desactivar()
+                    elif menuInstrumentacion.opcion == 4:
+                        limpiarConsola()
+                        print(instrumentacion.reporte())
+                        input('\nPresione una tecla para continuar...')
+                    elif menuInstrumentacion.opcion == 5:
+                        instrumentacion.reiniciar()
+
+                menuInstrumentacion.opcion = -1 # Se restablece la opcion de menuInstrumentacion
+
         except Exception as e:
             input('Ocurrio un error. Presione enter para continuar...')
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1: # python -m proyecto bfs --grafo grafo1 --desde 1 ...
+        from .cli import main as ejecutarComando
+        sys.exit(ejecutarComando())
     main()
@@ -0,0 +1,511 @@
+'''
+Funciones para guardar, leer, importar y exportar los grafos del programa en la carpeta datos_grafos.
+
+No dependen de la interfaz de consola (ni de la librería art), así las usan tanto el menú interactivo como la línea de comandos (proyecto.cli) y los benchmarks.
+'''
+from .modelos.grafo import *
+from .modelos.adyacencia import Adyacencia
+from .modelos.centralidad import AnalisisCentralidad
+from .modelos.triangulos import AlgoritmoTriangulos
+from .modelos.binario import EXTENSION_BINARIA, BANDERA_DIRIGIDO, CABECERA, TAMANO_LOTE, escribirGrafoBinario, escribirGrafoBinarioPorPartes, leerCabecera, leerGrafoBinario
+from .modelos.lectorJson import LectorGrafoJson
+from .modelos.mapeado import GrafoMapeado
+from .modelos.grafoSqlite import EXTENSION_SQLITE, GrafoDirigidoSqlite, GrafoNoDirigidoSqlite, abrirGrafoSqlite
+from .modelos.diario import DiarioEdicion, UMBRAL_COMPACTACION
+from .modelos.compresion import COMPRESORES, comprimir, separarCompresion
+from .modelos.escritorJson import escribirElementosJson
+from .modelos.catalogo import CatalogoGrafos
+from .modelos.cache import CacheGrafos
+from .modelos.importacion import ImportadorGrafos, ResultadoImportacion
+from .modelos.generacion import GeneradorGrafos
+from .modelos.exportacion import ENCABEZADO_ARISTAS, ENCABEZADO_NODOS, escribirCsv, escribirGexf, escribirGraphML, filasAristas, filasNodos
+from .modelos.instrumentacion import fase
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+import csv
+import io
+
+carpetaGrafos = 'datos_grafos' # Esta es la carpeta donde se guardan los grafos del programa
+carpetaExportar = 'csv' # Esta es la carpeta donde se exportan los datos de los grafos
+# Extensiones de los formatos en los que se puede guardar un grafo, cada formato también se puede guardar comprimido (grafo1.json.gz, grafo1.grafo.xz, ...)
+extensionesGrafo = [formato + compresion for formato in ('.json', EXTENSION_BINARIA) for compresion in ['', *COMPRESORES]] + [EXTENSION_SQLITE] # Las bases de datos no se comprimen
+
+catalogo: Union['CatalogoGrafos', None] = None # Indice de los grafos guardados, se crea la primera vez que se necesita
+cacheGrafos = CacheGrafos(capacidad=4, memoriaMaxima=1 << 30) # Grafos ya cargados, hasta 4 grafos y cerca de 1 GiB
+
+def eliminarArchivo(nombreArchivo: str) -> bool:
+    '''
+    Elimina un archivo (archivo.extension) del almacenamiento del programa.
+    '''
+    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
+    try:
+        if existeArchivo(nombreArchivo):
+            os.remove(ruta)
+            return True 
+        return False 
+    except OSError as e:
+        return False 
+
+def separarExtension(nombreArchivo: str) -> Tuple[str, str]:
+    '''
+    Separa el nombre de un archivo de grafo de su extensión. Si el nombre no termina en una extensión de grafo conocida la extensión devuelta es una cadena vacía.
+
+    >>> separarExtension('grafo1.grafo')
+    ('grafo1', '.grafo')
+    >>> separarExtension('grafo1')
+    ('grafo1', '')
+    '''
+    for extension in extensionesGrafo:
+        if nombreArchivo.endswith(extension):
+            return nombreArchivo[:-len(extension)], extension
+    return nombreArchivo, ''
+
+def obtenerArchivoGrafo(nombreGrafo: str) -> Union[str, None]:
+    '''
+    Devuelve el nombre del archivo (con extensión) en el que está guardado el grafo, o None si no está guardado. El nombre del grafo puede incluir la extensión para buscar un formato en particular.
+    '''
+    if separarExtension(nombreGrafo)[1] != '':
+        candidatos = [nombreGrafo]
+    else:
+        candidatos = [nombreGrafo + extension for extension in extensionesGrafo]
+    catalogo = obtenerCatalogo()
+    for candidato in candidatos:
+        if catalogo.existeArchivo(candidato):
+            return candidato
+    return None
+
+def existeGrafo(nombreGrafo: str) -> bool:
+    '''
+    Indica si existe un grafo guardado con ese nombre en cualquiera de los formatos.
+    '''
+    return obtenerArchivoGrafo(nombreGrafo) != None
+
+def eliminarGrafo(nombreGrafo: str) -> bool:
+    f'''
+    Elimina los archivos que guardan la informacion de un grafo en el almacenamiento del programa.
+    '''
+    nombreGrafo = separarExtension(nombreGrafo)[0]
+    obtenerDiario(nombreGrafo).eliminar()
+    eliminarArchivo(nombreGrafo + '.metricas.csv') # Las metricas calculadas dejan de tener sentido sin el grafo
+    eliminados = [eliminarArchivo(nombreGrafo + extension) for extension in extensionesGrafo]
+    for extension in extensionesGrafo:
+        obtenerCatalogo().quitar(nombreGrafo + extension)
+        cacheGrafos.invalidar(nombreGrafo + extension)
+    return any(eliminados)
+
+def obtenerArchivos() -> List[str]:
+    '''
+    Devuelve una lista de todos los archivos dentro del almacenamiento del programa.
+    '''
+    carpeta = os.path.join(os.path.dirname(__file__), carpetaGrafos)
+    if os.path.exists(carpeta) and os.path.isdir(carpeta):
+        archivos = os.listdir(carpeta)
+        return archivos 
+    return []
+
+def existeArchivo(nombreArchivo: str) -> bool:
+    '''
+    Devuelve un booleano respondiendo a la pregunta si existe un archivo con el nombre nombreArchivo dentro del almacenamiento del programa.
+    '''
+    return os.path.isfile(os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo))
+
+def nombreGrafoDeArchivo(nombreArchivo: str) -> Union[str, None]:
+    '''
+    Devuelve el nombre del grafo guardado en el archivo o None si el archivo no es de un grafo.
+    '''
+    nombreGrafo, extension = separarExtension(nombreArchivo)
+    return nombreGrafo if extension != '' else None
+
+def describirArchivoGrafo(nombreArchivo: str) -> Dict[str, Any]:
+    '''
+    Devuelve si es dirigido y la cantidad de nodos y aristas del grafo guardado en el archivo. En los archivos binarios sin cambios en el diario basta con leer la cabecera, los demás se tienen que leer completos.
+    '''
+    nombreGrafo, extension = separarExtension(nombreArchivo)
+    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
+    if extension == EXTENSION_SQLITE:
+        grafo = abrirGrafoSqlite(ruta)
+        descripcion = {'dirigido': grafo.esDirigido(), 'nodos': len(grafo.nodos), 'aristas': len(grafo.aristas)}
+        grafo.cerrar()
+        return descripcion
+    diario = obtenerDiario(nombreGrafo)
+    if extension.startswith(EXTENSION_BINARIA) and not diario.hayCambios():
+        with open(ruta, 'rb') as archivo, comprimir(archivo, separarCompresion(nombreArchivo)[1], 'rb') as comprimido:
+            cabecera = leerCabecera(comprimido.read(CABECERA.size))
+        return {'dirigido': bool(cabecera['banderas'] & BANDERA_DIRIGIDO), 'nodos': cabecera['n'], 'aristas': cabecera['m']}
+    grafo = leerArchivoGrafo(ruta)
+    diario.aplicar(grafo)
+    return {'dirigido': grafo.esDirigido(), 'nodos': len(grafo.nodos), 'aristas': len(grafo.aristas)}
+
+def obtenerCatalogo() -> 'CatalogoGrafos':
+    '''
+    Devuelve el catálogo de los grafos guardados. La primera vez se lee su archivo, o se construye recorriendo la carpeta si no existe.
+    '''
+    global catalogo
+    if catalogo == None:
+        catalogo = CatalogoGrafos(os.path.join(os.path.dirname(__file__), carpetaGrafos), nombreGrafoDeArchivo, describirArchivoGrafo)
+    return catalogo
+
+def existenGrafos() -> bool:
+    '''
+    Esta funcion indica si existe al menos un grafo almacenado en el programa
+    '''
+    return len(obtenerCatalogo()) > 0
+
+def obtenerGrafos() -> List[str]:
+    '''
+    Esta funcion devuelve una lista de los nombres de los grafos disponibles.
+    '''
+    return obtenerCatalogo().nombres() # Un grafo guardado en dos formatos aparece una sola vez
+
+def obtenerDiario(nombreGrafo: str) -> 'DiarioEdicion':
+    '''
+    Devuelve el diario de edición del grafo, que se guarda junto al grafo en el archivo nombreGrafo.diario.
+    '''
+    return DiarioEdicion(os.path.join(os.path.dirname(__file__), carpetaGrafos, separarExtension(nombreGrafo)[0]))
+
+def escribirArchivoGrafo(grafo: 'Grafo', ruta: str):
+    '''
+    Escribe el grafo completo en la ruta indicada. El formato y la compresión se escogen por la extensión de la ruta (sin contar un .tmp final): grafo1.grafo es binario, grafo1.json.gz es JSON comprimido con gzip, etc.
+
+    El grafo se escribe por partes directamente a través del compresor, sin construir en memoria todo el contenido del archivo. Con la extensión .sqlite se crea una base de datos nueva que reemplaza la anterior.
+    '''
+    nombre = ruta[:-len('.tmp')] if ruta.endswith('.tmp') else ruta
+    nombre, compresion = separarCompresion(nombre)
+    if not nombre.endswith(EXTENSION_BINARIA): # Solo el formato binario necesita el grafo completo, para su adyacencia
+        escribirArchivoPorPartes(ruta, grafo.esDirigido(), grafo.nodos, grafo.aristas)
+        return
+    with open(ruta, 'wb') as archivo, comprimir(archivo, compresion, 'wb') as comprimido:
+        with fase('escribir binario' + compresion):
+            escribirGrafoBinario(grafo, comprimido)
+
+def escribirArchivoPorPartes(ruta: str, dirigido: bool, nodos: Iterable['Nodo'], aristas: Iterable['Arista']) -> None:
+    '''
+    Escribe en la ruta indicada un grafo dado por sus nodos y aristas, que pueden venir de generadores, sin construirlo en memoria. El formato se escoge igual que en escribirArchivoGrafo, pero los archivos binarios se escriben sin la adyacencia (ver escribirGrafoBinarioPorPartes).
+    '''
+    nombre = ruta[:-len('.tmp')] if ruta.endswith('.tmp') else ruta
+    nombre, compresion = separarCompresion(nombre)
+    if nombre.endswith(EXTENSION_SQLITE):
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        with fase('escribir SQLite'):
+            grafoSqlite = (GrafoDirigidoSqlite if dirigido else GrafoNoDirigidoSqlite)(ruta)
+            grafoSqlite.cargarMasivamente(nodos, aristas)
+            grafoSqlite.confirmar()
+            grafoSqlite.cerrar()
+        return
+    with open(ruta, 'wb') as archivo, comprimir(archivo, compresion, 'wb') as comprimido:
+        if nombre.endswith(EXTENSION_BINARIA):
+            with fase('escribir binario por partes' + compresion):
+                escribirGrafoBinarioPorPartes(comprimido, dirigido, nodos, aristas, os.path.dirname(ruta))
+        else:
+            with fase('escribir JSON' + compresion):
+                texto = io.TextIOWrapper(comprimido, encoding='utf-8')
+                escribirElementosJson(texto, dirigido, nodos, aristas)
+                texto.flush()
+                texto.detach() # Para que el archivo comprimido lo cierre el with
+
+def leerArchivoGrafo(ruta: str, progreso: Union[Callable[[int, int], None], None] = None) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Lee el grafo guardado en la ruta indicada, sin aplicar su diario de edición. Los archivos comprimidos se descomprimen a medida que se leen; en ese caso el progreso se reporta con los bytes comprimidos leídos.
+    '''
+    nombre, compresion = separarCompresion(ruta)
+    if nombre.endswith(EXTENSION_SQLITE): # Se copia la base de datos a un grafo en memoria
+        grafoSqlite = abrirGrafoSqlite(ruta)
+        grafo = GrafoDirigido() if grafoSqlite.esDirigido() else GrafoNoDirigido()
+        grafo.cargarMasivamente((Nodo(n.identificador, n.contenido) for n in grafoSqlite.nodos), grafoSqlite.aristas)
+        grafoSqlite.cerrar()
+        return grafo
+    with open(ruta, 'rb') as archivo, comprimir(archivo, compresion, 'rb') as comprimido:
+        if nombre.endswith(EXTENSION_BINARIA):
+            with fase('leer binario' + compresion):
+                return leerGrafoBinario(comprimido)
+        if progreso != None and compresion != '':
+            progresoDescomprimido = progreso
+            bytesTotales = os.fstat(archivo.fileno()).st_size
+            progreso = lambda leidos, total: progresoDescomprimido(archivo.tell(), bytesTotales)
+        with fase('leer JSON' + compresion):
+            return LectorGrafoJson(comprimido, progreso).leer()
+
+def guardarGrafo(grafo: 'Grafo', nombre: str, completo: bool = False):
+    '''
+    Esta funcion guarda el grafo que se pasa como parámetro en un archivo, no es necesario pasarle el nombre con la extensión ya que lo agrega automáticamente.
+
+    El formato se escoge por la extensión: si el nombre termina en .grafo se usa el formato binario y si termina en .json el formato JSON. Cualquiera de los dos se puede comprimir agregando .gz, .bz2 o .xz (grafo1.json.gz). Sin extensión se conserva el formato en el que ya estaba guardado el grafo y, si es un grafo nuevo, se usa JSON.
+
+    Si el grafo ya está guardado y fue abierto con obtenerGrafo, solamente se agregan sus cambios al diario de edición. Cuando el diario crece demasiado se incorpora al archivo en segundo plano. Con completo=True se escribe todo el grafo y se descarta el diario, es necesario antes de abrir el archivo con un editor.
+
+    Un grafo abierto desde su base de datos (.sqlite) ya tiene sus cambios en el archivo, solo se confirma la transacción pendiente.
+
+    Lanza ValueError si se pide un formato nuevo para un grafo que ya está guardado en otro formato: los formatos de un grafo comparten el diario de edición (nombre.diario), así que escribir el otro archivo borraría o mezclaría sus cambios pendientes.
+    '''
+    nombreArchivo = obtenerArchivoGrafo(nombre)
+    if nombreArchivo == None and existeGrafo(separarExtension(nombre)[0]):
+        raise ValueError(f'El grafo {separarExtension(nombre)[0]} ya está guardado en otro formato')
+    if isinstance(grafo, (GrafoDirigidoSqlite, GrafoNoDirigidoSqlite)) and nombreArchivo != None \
+            and os.path.abspath(grafo.ruta) == os.path.abspath(os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)):
+        grafo.confirmar()
+        grafo.extraerCambios()
+        obtenerCatalogo().actualizar(nombreArchivo, grafo)
+        return
+    cambios = grafo.extraerCambios()
+    diario = obtenerDiario(nombre)
+    if nombreArchivo != None and cambios != None and not completo:
+        ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo)
+        if diario.registrar(cambios) > UMBRAL_COMPACTACION:
+            diario.compactar(ruta, leerArchivoGrafo, escribirArchivoGrafo)
+    else:
+        if nombreArchivo == None:
+            nombreArchivo = nombre if separarExtension(nombre)[1] != '' else nombre + '.json'
+        diario.eliminar() # El archivo va a tener el grafo completo
+        escribirArchivoGrafo(grafo, os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo))
+    obtenerCatalogo().actualizar(nombreArchivo, grafo)
+    if cambios != None:
+        cacheGrafos.guardar(nombreArchivo, firmaArchivoGrafo(nombreArchivo), grafo) # El grafo en memoria es igual al guardado
+    else:
+        cacheGrafos.invalidar(nombreArchivo)
+
+def exportarGrafo(grafo: 'Grafo', nombreGrafo: str, compresion: str = '', formato: str = 'csv') -> bool:
+    '''
+    Esta funcion recibe un grafo y crea dos archivos csv dentro de la carpeta "csv" del proyecto, estos archivos estan agrupados en una carpeta con el nombre del grafo, los archivos tienen la extensión csv.
+    Un archivo almacena los nodos, mientras que otro almacena las aristas.
+
+    Con formato 'graphml' o 'gexf' se crea en la misma carpeta un único archivo nombreGrafo.graphml o nombreGrafo.gexf que Gephi puede abrir directamente.
+
+    Si se indica una compresión ('.gz', '.bz2' o '.xz') los archivos se comprimen mientras se escriben (nodos.csv.gz, aristas.csv.gz). Las filas se generan una por una y se escriben por bloques, así que nunca se tiene toda la tabla en memoria. Si el grafo ya se había exportado, los archivos se reemplazan.
+
+    ---
+    Returns:
+    - True: Si se logró exportar el grafo exitosamente
+    - False: Si no se puedo exportar el grafo
+    '''
+    try:
+        rutaCarpeta = os.path.join(os.path.dirname(__file__), carpetaExportar, nombreGrafo)
+
+        # Se crea la carpeta, si ya existe se reemplazan los archivos
+        os.makedirs(rutaCarpeta, exist_ok=True)
+
+        if formato == 'csv':
+            archivos = [
+                ('nodos.csv', lambda archivo: escribirCsv(archivo, ENCABEZADO_NODOS, filasNodos(grafo))),
+                ('aristas.csv', lambda archivo: escribirCsv(archivo, ENCABEZADO_ARISTAS, filasAristas(grafo))),
+            ]
+        elif formato == 'graphml':
+            archivos = [(nombreGrafo + '.graphml', lambda archivo: escribirGraphML(grafo, archivo))]
+        elif formato == 'gexf':
+            archivos = [(nombreGrafo + '.gexf', lambda archivo: escribirGexf(grafo, archivo))]
+        else:
+            return False
+
+        # Se guardan los archivos
+        for nombreArchivo, escribir in archivos:
+            with open(os.path.join(rutaCarpeta, nombreArchivo + compresion), 'wb') as archivo, comprimir(archivo, compresion, 'wb') as comprimido:
+                escribir(comprimido)
+
+        return True 
+
+    except Exception as e:
+        return False 
+
+def importarGrafo(ruta: str, nombreGrafo: str, dirigido: bool = True, procesos: Union[int, None] = 1, progreso: Union[Callable[[int, int], None], None] = None) -> Union['ResultadoImportacion', None]:
+    '''
+    Importa un grafo desde una lista de aristas, una tabla de aristas de Gephi o una carpeta con nodos.csv y aristas.csv (ver ImportadorGrafos.importar) y lo guarda con el nombre indicado.
+
+    El grafo se guarda en formato binario, que es el más rápido de leer para grafos grandes, salvo que el nombre incluya otra extensión (por ejemplo grafo1.sqlite para los grafos que no caben en memoria).
+
+    ---
+    Returns:
+    - ResultadoImportacion: El grafo importado y las filas por segundo que se leyeron.
+    - None: Si no se pudo leer el archivo.
+    '''
+    try:
+        resultado = ImportadorGrafos.importar(ruta, dirigido, procesos, progreso)
+    except (OSError, ValueError, UnicodeDecodeError, csv.Error):
+        return None
+    guardarGrafo(resultado.grafo, nombreGrafo if separarExtension(nombreGrafo)[1] != '' else nombreGrafo + EXTENSION_BINARIA)
+    return resultado
+
+def generarGrafoSintetico(nombreGrafo: str, modelo: str, cantidadNodos: int, cantidadAristas: Union[int, None] = None, dirigido: bool = True, semilla: int = 0, tamanoContenido: int = 0, progreso: Union[Callable[[int, int], None], None] = None, **parametros) -> Dict[str, Any]:
+    '''
+    ---
+    Genera un grafo sintético con GeneradorGrafos y lo guarda con el nombre indicado, escribiendo cada nodo y arista apenas se produce.
+
+    ---
+    Args:
+    ---
+    - nombreGrafo: Nombre del grafo, con extensión para escoger el formato. Sin extensión se usa el formato binario.
+    - modelo: Uno de GeneradorGrafos.MODELOS ('aleatorio', 'potencia', 'rejilla', 'comunidades', 'preferencial', 'cadena' o 'estrella').
+    - cantidadNodos, cantidadAristas: Tamaño del grafo, ver GeneradorGrafos.contarAristas.
+    - dirigido: Si el grafo es dirigido.
+    - semilla: Con la misma semilla se genera el mismo grafo.
+    - tamanoContenido: Caracteres del contenido de cada nodo, con 0 el contenido es 'Nodo i'.
+    - progreso: Se llama con las aristas escritas y las totales cada TAMANO_LOTE aristas.
+    - parametros: Opciones del modelo (exponente, comunidades, mezcla, aristasPorNodo).
+
+    ---
+    Returns:
+    ---
+    - Dict[str, Any]: El archivo creado y la cantidad de nodos y aristas.
+
+    ---
+    Notas:
+    ---
+    - La memoria usada no depende del tamaño del grafo, así se pueden crear grafos de decenas de millones de aristas que no cabrían en memoria como objetos. Los archivos binarios quedan sin la adyacencia, así que no se pueden mapear hasta que se guarden completos.
+    - Lanza ValueError si el grafo ya existe o los argumentos no son válidos.
+    '''
+    nombreBase = separarExtension(nombreGrafo)[0]
+    if existeGrafo(nombreBase): # Los formatos de un mismo grafo comparten el diario, así que no puede existir en ningún formato
+        raise ValueError(f'Ya existe el grafo {nombreBase}')
+    nombreArchivo = nombreGrafo if separarExtension(nombreGrafo)[1] != '' else nombreGrafo + EXTENSION_BINARIA
+    totalAristas = GeneradorGrafos.contarAristas(modelo, cantidadNodos, cantidadAristas, **parametros)
+    aristas = GeneradorGrafos.aristas(modelo, cantidadNodos, cantidadAristas, semilla, **parametros)
+    if progreso != None:
+        aristas = _informarProgreso(aristas, totalAristas, progreso)
+
+    carpeta = os.path.join(os.path.dirname(__file__), carpetaGrafos)
+    os.makedirs(carpeta, exist_ok=True)
+    ruta = os.path.join(carpeta, nombreArchivo)
+    try:
+        escribirArchivoPorPartes(ruta + '.tmp', dirigido, GeneradorGrafos.nodos(cantidadNodos, tamanoContenido, semilla), aristas)
+    except BaseException:
+        if os.path.exists(ruta + '.tmp'):
+            os.remove(ruta + '.tmp')
+        raise
+    os.replace(ruta + '.tmp', ruta)
+    if not any(existeGrafo(nombreBase + extension) for extension in extensionesGrafo if nombreBase + extension != nombreArchivo):
+        obtenerDiario(nombreArchivo).eliminar() # Por si quedó el diario de un grafo anterior con el mismo nombre, nunca el de otro formato
+    obtenerCatalogo().registrar(nombreArchivo, dirigido, cantidadNodos, totalAristas)
+    cacheGrafos.invalidar(nombreArchivo)
+    return {'archivo': nombreArchivo, 'nodos': cantidadNodos, 'aristas': totalAristas}
+
+def _informarProgreso(aristas: Iterable['Arista'], total: int, progreso: Callable[[int, int], None]) -> Iterator['Arista']:
+    escritas = 0
+    for escritas, arista in enumerate(aristas, 1):
+        yield arista
+        if escritas % TAMANO_LOTE == 0:
+            progreso(escritas, total)
+    progreso(escritas, total)
+
+def calcularMetricas(grafo: 'Grafo', nombreGrafo: str) -> Dict[str, 'ResultadoCentralidad']:
+    '''
+    Calcula el grado de entrada y salida, el PageRank y la centralidad de vector propio de cada nodo y los guarda junto al grafo en el archivo nombreGrafo.metricas.csv, con el mismo formato de columnas de la tabla de nodos de Gephi (Id, InDegree, OutDegree, PageRank, Eigenvector) para poder importarlo directamente. En grafos no dirigidos se agregan las columnas Triangles y Clustering.
+
+    ---
+    Returns:
+    - Dict[str, ResultadoCentralidad]: Los resultados de 'pagerank' y 'vectorPropio', con sus iteraciones y tiempos.
+    '''
+    adyacencia = Adyacencia.obtener(grafo) # Se construye una sola vez para todas las metricas
+    gradoEntrada = AnalisisCentralidad.calcularGradoEntrada(adyacencia)
+    gradoSalida = AnalisisCentralidad.calcularGradoSalida(adyacencia)
+    pagerank = AnalisisCentralidad.calcularPageRank(adyacencia)
+    vectorPropio = AnalisisCentralidad.calcularCentralidadVectorPropio(adyacencia)
+    triangulos = AlgoritmoTriangulos.contarTriangulos(adyacencia) # Es None en grafos dirigidos
+
+    ruta = os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreGrafo + '.metricas.csv')
+    with open(ruta, 'w', newline='') as file:
+        writter = csv.writer(file, delimiter=',')
+        if triangulos == None:
+            writter.writerow(['Id','InDegree','OutDegree','PageRank','Eigenvector'])
+            writter.writerows([idNodo, gradoEntrada[idNodo], gradoSalida[idNodo], pagerank.valores[idNodo], vectorPropio.valores[idNodo]] for idNodo in adyacencia.ids)
+        else:
+            writter.writerow(['Id','InDegree','OutDegree','PageRank','Eigenvector','Triangles','Clustering'])
+            writter.writerows([idNodo, gradoEntrada[idNodo], gradoSalida[idNodo], pagerank.valores[idNodo], vectorPropio.valores[idNodo], triangulos.porNodo[idNodo], triangulos.clustering[idNodo]] for idNodo in adyacencia.ids)
+
+    return {'pagerank': pagerank, 'vectorPropio': vectorPropio}
+
+def obtenerGrafo(nombreGrafo: str, progreso: Union[Callable[[int, int], None], None] = None) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Esta funcion devuelve un grafo guardado en alguno de los archivos del almacenamiento del programa. El formato se reconoce por la extensión del archivo.
+
+    Los archivos JSON se leen por bloques con LectorGrafoJson, que entrega cada nodo y arista al grafo a medida que los decodifica, por lo que nunca se tiene en memoria el texto completo del archivo. La función progreso, si se indica, recibe los bytes leídos y los bytes totales después de cada bloque.
+
+    Después de leer el archivo se le aplican los cambios de su diario de edición y el grafo empieza a registrar sus cambios, para que guardarGrafo solo tenga que agregar esos cambios al diario.
+
+    Los grafos cargados se guardan en cacheGrafos: si se vuelve a pedir un grafo cuyo archivo no cambió se devuelve el mismo objeto sin leer el archivo.
+
+    Los grafos guardados en SQLite no se cargan: se devuelve un GrafoDirigidoSqlite o GrafoNoDirigidoSqlite abierto sobre la base de datos, que se debe cerrar con cerrarGrafo.
+    '''
+    nombreArchivo = obtenerArchivoGrafo(nombreGrafo)
+    if nombreArchivo == None:
+        raise FileNotFoundError(f'No existe el grafo {nombreGrafo}')
+    if nombreArchivo.endswith(EXTENSION_SQLITE): # La base de datos se consulta directamente, no se carga en memoria ni tiene diario
+        grafo = abrirGrafoSqlite(os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo))
+        obtenerCatalogo().verificar(nombreArchivo, grafo)
+        return grafo
+    diario = obtenerDiario(nombreGrafo)
+    diario.esperar() # Mientras se compacta el diario, el archivo base y el diario compactando cambian
+    firma = firmaArchivoGrafo(nombreArchivo)
+    grafo = cacheGrafos.obtener(nombreArchivo, firma)
+    if grafo != None: # El grafo ya estaba cargado y su archivo no cambió
+        return grafo
+    grafo = leerArchivoGrafo(os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo), progreso)
+    diario.aplicar(grafo)
+    obtenerCatalogo().verificar(nombreArchivo, grafo) # Por si el archivo se modificó fuera del programa
+    grafo.iniciarRegistroCambios()
+    cacheGrafos.guardar(nombreArchivo, firma, grafo)
+    return grafo
+
+def firmaArchivoGrafo(nombreArchivo: str) -> Tuple[int, ...]:
+    '''
+    Devuelve la fecha de modificación y el tamaño del archivo del grafo y de su diario de edición. Si cualquiera de los dos cambia, la firma también cambia y el grafo guardado en cacheGrafos deja de ser válido.
+    '''
+    diario = obtenerDiario(nombreArchivo)
+    firma = []
+    for ruta in (os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo), diario.ruta, diario.rutaCompactando):
+        try:
+            estado = os.stat(ruta)
+            firma += [estado.st_mtime_ns, estado.st_size]
+        except OSError:
+            firma += [0, -1]
+    return tuple(firma)
+
+def abrirGrafoMapeado(nombreGrafo: str) -> Union['GrafoMapeado', None]:
+    '''
+    Abre el grafo con mmap si está guardado en formato binario con la adyacencia incluida, así no se crean los objetos de todos sus nodos y aristas. Devuelve None si el grafo no se puede mapear o si tiene cambios en su diario de edición que no están en el archivo, en ese caso se debe usar obtenerGrafo.
+    '''
+    nombreArchivo = obtenerArchivoGrafo(nombreGrafo)
+    if nombreArchivo == None or not nombreArchivo.endswith(EXTENSION_BINARIA) or obtenerDiario(nombreGrafo).hayCambios():
+        return None
+    try:
+        grafo = GrafoMapeado(os.path.join(os.path.dirname(__file__), carpetaGrafos, nombreArchivo))
+    except ValueError:
+        return None
+    obtenerCatalogo().verificar(nombreArchivo, grafo)
+    return grafo
+
+def abrirGrafo(nombreGrafo: str, progreso: Union[Callable[[int, int], None], None] = None) -> Union['GrafoMapeado', 'GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Devuelve el grafo mapeado si es posible y de lo contrario lo carga completo con obtenerGrafo. Se usa en los menús y comandos que solo consultan el grafo.
+    '''
+    grafo = abrirGrafoMapeado(nombreGrafo)
+    if grafo == None:
+        grafo = obtenerGrafo(nombreGrafo, progreso)
+    return grafo
+
+def cerrarGrafo(grafo: Union['GrafoMapeado', 'Grafo']):
+    '''
+    Libera el archivo de un grafo mapeado o la base de datos de un grafo SQLite, con los demás grafos no hace nada.
+    '''
+    if isinstance(grafo, (GrafoMapeado, GrafoDirigidoSqlite, GrafoNoDirigidoSqlite)):
+        grafo.cerrar()
+
+def descartarCambios(grafo: 'Grafo', nombreGrafo: str, progreso: Union[Callable[[int, int], None], None] = None) -> 'Grafo':
+    '''
+    Deshace las ediciones del grafo que no se guardaron y devuelve el grafo como está guardado. Un grafo SQLite deshace su transacción pendiente, los demás se vuelven a leer del archivo.
+    '''
+    if isinstance(grafo, (GrafoDirigidoSqlite, GrafoNoDirigidoSqlite)):
+        grafo.descartar()
+        return grafo
+    return obtenerGrafo(nombreGrafo, progreso)
+
+def describirGrafo(nombreGrafo: str) -> str:
+    '''
+    Devuelve el nombre del grafo junto con los datos que tiene el catálogo, sin abrir el grafo.
+
+    >>> describirGrafo('grafo1')
+    'grafo1 (dirigido, 5 nodos, 7 aristas, 1.2 KiB)'
+    '''
+    datos = obtenerCatalogo().obtener(obtenerArchivoGrafo(nombreGrafo))
+    if datos == None:
+        return nombreGrafo
+    tipo = 'dirigido' if datos['dirigido'] else 'no dirigido'
+    return f"{nombreGrafo} ({tipo}, {datos['nodos']} nodos, {datos['aristas']} aristas, {datos['tamano'] / 1024:.1f} KiB)"
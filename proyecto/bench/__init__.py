@@ -0,0 +1,5 @@
+'''
+Pruebas de rendimiento del proyecto. Cada módulo se ejecuta por separado, por ejemplo:
+
+    python -m proyecto.bench.compresion
+'''
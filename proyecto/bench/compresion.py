@@ -0,0 +1,71 @@
+'''
+Compara el tamaño y el tiempo de guardado y carga de un grafo en cada formato y compresión.
+
+    python -m proyecto.bench.compresion [cantidadNodos] [cantidadAristas]
+'''
+from ..modelos.grafo import *
+from ..modelos.binario import EXTENSION_BINARIA
+from ..modelos.compresion import COMPRESORES
+from ..almacenamiento import escribirArchivoGrafo, leerArchivoGrafo
+from typing import List, Tuple
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+def generarGrafo(cantidadNodos: int, cantidadAristas: int, semilla: int = 0) -> 'GrafoDirigido':
+    '''
+    Genera un grafo dirigido aleatorio con contenidos de texto y pesos reales, parecido a los que se crean en el programa.
+    '''
+    aleatorio = random.Random(semilla)
+    grafo = GrafoDirigido()
+    grafo.cargarMasivamente(
+        (Nodo(i, f'Nodo {i}') for i in range(1, cantidadNodos + 1)),
+        (Arista(i, aleatorio.randint(1, cantidadNodos), aleatorio.randint(1, cantidadNodos), round(aleatorio.uniform(1, 10), 2)) for i in range(1, cantidadAristas + 1))
+    )
+    return grafo
+
+
+def medir(grafo: 'Grafo', carpeta: str) -> List[Tuple[str, int, float, float]]:
+    '''
+    Guarda y vuelve a cargar el grafo en cada formato y compresión.
+
+    Returns:
+        - List[Tuple[str, int, float, float]]: (extensión, bytes del archivo, segundos al guardar, segundos al cargar) de cada combinación.
+    '''
+    resultados = []
+    for formato in ('.json', EXTENSION_BINARIA):
+        for compresion in ['', *COMPRESORES]:
+            extension = formato + compresion
+            ruta = os.path.join(carpeta, 'grafo' + extension)
+            inicio = time.perf_counter()
+            escribirArchivoGrafo(grafo, ruta)
+            tiempoGuardado = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            cargado = leerArchivoGrafo(ruta)
+            tiempoCarga = time.perf_counter() - inicio
+            if len(cargado.nodos) != len(grafo.nodos) or len(cargado.aristas) != len(grafo.aristas):
+                raise RuntimeError(f'El grafo cargado desde {extension} no coincide con el original')
+            resultados.append((extension, os.path.getsize(ruta), tiempoGuardado, tiempoCarga))
+            os.remove(ruta)
+    return resultados
+
+
+def main():
+    cantidadNodos = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    cantidadAristas = int(sys.argv[2]) if len(sys.argv) > 2 else 4 * cantidadNodos
+    grafo = generarGrafo(cantidadNodos, cantidadAristas)
+    with tempfile.TemporaryDirectory() as carpeta:
+        resultados = medir(grafo, carpeta)
+
+    tamanoJson = resultados[0][1]
+    print(f'Grafo de {cantidadNodos} nodos y {cantidadAristas} aristas\n')
+    print(f'{"Formato":<12}{"Tamaño (KiB)":>14}{"Relación":>10}{"Guardar (s)":>13}{"Cargar (s)":>12}')
+    for extension, tamano, tiempoGuardado, tiempoCarga in resultados:
+        print(f'{extension:<12}{tamano / 1024:>14.1f}{tamano / tamanoJson:>10.3f}{tiempoGuardado:>13.3f}{tiempoCarga:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
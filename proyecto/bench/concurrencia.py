@@ -0,0 +1,134 @@
+'''
+Prueba de carga de GrafoConcurrente: varios hilos lectores revisan el grafo mientras un hilo escritor agrega y elimina nodos con aristas. Compara las lecturas por segundo con el cerrojo de lectores y escritor, con un cerrojo exclusivo y sin cerrojo, y cuenta las lecturas que vieron el grafo a medio editar.
+
+    python -m proyecto.bench.concurrencia [cantidadNodos] [segundos] [esperaLecturaMs]
+
+Cada lectura revisa que el grafo esté completo, espera esperaLecturaMs milisegundos con el cerrojo tomado, lo que simula el tiempo de escribir una exportación o responder por la red, y vuelve a revisar. Mientras un hilo espera no tiene el GIL, así que esa parte de las lecturas ocurre en paralelo con el cerrojo de lectores y escritor y de a una con el exclusivo; la revisión en Python se ejecuta de a un hilo a la vez en CPython con cualquier cerrojo.
+'''
+from ..modelos.grafo import *
+from ..modelos.concurrencia import GrafoConcurrente
+from .compresion import generarGrafo
+from contextlib import contextmanager, nullcontext
+from threading import Event, Lock, Thread
+from typing import Iterator, Tuple
+import sys
+import time
+
+
+class _CerrojoExclusivo:
+    '''
+    Cerrojo con la misma interfaz que CerrojoLectoresEscritor en el que las lecturas también son exclusivas.
+    '''
+
+    def __init__(self):
+        self._cerrojo = Lock()
+
+    @contextmanager
+    def lectura(self) -> Iterator[None]:
+        with self._cerrojo:
+            yield
+
+    escritura = lectura
+
+
+class _SinCerrojo:
+    def lectura(self):
+        return nullcontext()
+
+    escritura = lectura
+
+
+CERROJOS = {
+    'lectores/escritor': None, # El cerrojo propio de GrafoConcurrente
+    'exclusivo': _CerrojoExclusivo,
+    'sin cerrojo': _SinCerrojo,
+}
+
+
+def _estaCompleto(grafo: 'Grafo', cantidadNodos: int, cantidadAristas: int, diferencia: int, esperaLectura: float) -> bool:
+    '''
+    Revisa que el grafo esté en uno de los dos estados que deja el escritor: sin el nodo extra o con el nodo extra y sus dos aristas, y que cada arista esté también en los vecinos de su nodo de origen. Después espera esperaLectura segundos y vuelve a revisar, porque una lectura larga debe ver el mismo grafo de principio a fin.
+    '''
+    completo = True
+    for i in range(2):
+        extras = len(grafo.nodos) - cantidadNodos
+        if extras not in (0, 1) or len(grafo.aristas) - cantidadAristas != 2 * extras:
+            completo = False
+        elif len(grafo.aristas) - sum(len(n.vecinos) for n in grafo.nodos) != diferencia:
+            completo = False
+        if i == 0 and esperaLectura > 0:
+            time.sleep(esperaLectura)
+    return completo
+
+
+def medir(grafo: 'GrafoDirigido', hilos: int, segundos: float, esperaLectura: float, cerrojo: Union[type, None] = None) -> Tuple[float, int, int]:
+    '''
+    Ejecuta un escritor y la cantidad de lectores indicada durante los segundos indicados. Con cerrojo se reemplaza el cerrojo de lectores y escritor por otro con la misma interfaz.
+
+    Returns:
+        - Tuple[float, int, int]: (lecturas por segundo, lecturas que vieron el grafo a medio editar, ediciones hechas).
+    '''
+    concurrente = GrafoConcurrente(grafo)
+    if cerrojo != None:
+        concurrente.cerrojo = cerrojo()
+    cantidadNodos = len(grafo.nodos)
+    cantidadAristas = len(grafo.aristas)
+    diferencia = cantidadAristas - sum(len(n.vecinos) for n in grafo.nodos)
+    detener = Event()
+    lecturas = [0] * hilos
+    incompletas = [0] * hilos
+    ediciones = [0]
+
+    def escribir():
+        while not detener.is_set():
+            # Cada ciclo son dos ediciones atómicas: agregar un nodo con dos aristas y eliminarlo
+            with concurrente.escritura() as g:
+                nodo = Nodo(cantidadNodos + 1, 'Extra')
+                g.agregarNodo(nodo)
+                g.agregarArista(1, nodo.identificador)
+                g.agregarArista(nodo.identificador, 2)
+            with concurrente.escritura() as g:
+                g.eliminarNodo(nodo.identificador)
+            ediciones[0] += 2
+            time.sleep(0.0001)
+
+    def leer(indice: int):
+        while not detener.is_set():
+            try:
+                completo = concurrente.leer(_estaCompleto, cantidadNodos, cantidadAristas, diferencia, esperaLectura)
+            except (IndexError, AttributeError): # Sin cerrojo las listas pueden cambiar mientras se recorren
+                completo = False
+            incompletas[indice] += not completo
+            lecturas[indice] += 1
+
+    trabajadores = [Thread(target=escribir)] + [Thread(target=leer, args=(i,)) for i in range(hilos)]
+    inicio = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.start()
+    time.sleep(segundos)
+    detener.set()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return sum(lecturas) / (time.perf_counter() - inicio), sum(incompletas), ediciones[0]
+
+
+def main():
+    cantidadNodos = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    esperaLectura = (float(sys.argv[3]) if len(sys.argv) > 3 else 0.5) / 1000
+
+    # Cambios de hilo más frecuentes para que sin cerrojo sea más probable ver ediciones a medias
+    sys.setswitchinterval(0.0001)
+    print(f'Grafo de {cantidadNodos} nodos y {4 * cantidadNodos} aristas, {segundos:g} s por prueba, espera por lectura de {esperaLectura * 1000:g} ms\n')
+    print(f'{"Cerrojo":<20}{"Lectores":>9}{"Lecturas/s":>12}{"Aceleración":>13}{"Incompletas":>13}{"Ediciones":>11}')
+    for nombre, cerrojo in CERROJOS.items():
+        base = None
+        for hilos in (1, 2, 4, 8):
+            grafo = generarGrafo(cantidadNodos, 4 * cantidadNodos)
+            lecturasPorSegundo, incompletas, ediciones = medir(grafo, hilos, segundos, esperaLectura, cerrojo)
+            base = base or lecturasPorSegundo
+            print(f'{nombre:<20}{hilos:>9}{lecturasPorSegundo:>12.0f}{lecturasPorSegundo / base:>13.2f}{incompletas:>13}{ediciones:>11}')
+
+
+if __name__ == '__main__':
+    main()
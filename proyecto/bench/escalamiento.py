@@ -0,0 +1,236 @@
+'''
+Mide cómo escalan las operaciones de Grafo, AlgoritmoBFS, AlgoritmoDFS y AlgoritmoDijkstra con los grafos sintéticos de bench.generadores, y ajusta el exponente k de tiempo ~ n^k de cada operación.
+
+    python -m proyecto.bench.escalamiento [--tamanos 1000,10000,100000] [--generadores cadena,rejilla] [--tipos dirigido,noDirigido] [--limite 30] [--json resultados.json]
+
+Cada operación tiene un exponente esperado: 1 para las que recorren todo el grafo (O(V+E)) y 0 para las que trabajan sobre un nodo o una arista, medidas por llamada. En la tabla se marcan con "!" las operaciones cuyo exponente ajustado supera al esperado en más de 0.5, que es como se ve una operación que se volvió cuadrática.
+
+Antes de cada medición se estima su tiempo a partir de las anteriores; si pasaría de --limite segundos, esa operación no se mide en los tamaños siguientes ("-" en la tabla, null en el JSON). Los grafos de 10^7 nodos necesitan varios GB de memoria.
+'''
+from ..modelos.grafo import *
+from ..modelos.bfs import AlgoritmoBFS
+from ..modelos.dfs import AlgoritmoDFS
+from ..modelos.rutas import AlgoritmoDijkstra
+from ..almacenamiento import escribirArchivoGrafo, leerArchivoGrafo
+from ..modelos.exportacion import ENCABEZADO_ARISTAS, ENCABEZADO_NODOS, escribirCsv, filasAristas, filasNodos
+from .generadores import GENERADORES
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import json
+import math
+import os
+import random
+import tempfile
+import time
+
+CONSULTAS = 100 # Llamadas que se miden en las operaciones sobre un nodo o una arista
+TIEMPO_MINIMO = 0.02 # Las operaciones que no editan el grafo se repiten hasta tardar al menos estos segundos, para reducir el ruido
+
+
+def _buscarNodos(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+    ids = [contexto['aleatorio'].randint(1, contexto['n']) for _ in range(CONSULTAS)]
+    inicio = time.perf_counter()
+    for i in ids:
+        grafo.obtenerNodoPorId(i)
+    return time.perf_counter() - inicio, CONSULTAS
+
+
+def _agregarNodos(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+    nodos = [Nodo(contexto['n'] + i, 'Nuevo') for i in range(1, CONSULTAS + 1)]
+    inicio = time.perf_counter()
+    for nodo in nodos:
+        grafo.agregarNodo(nodo)
+    return time.perf_counter() - inicio, CONSULTAS
+
+
+def _agregarAristas(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+    pares = [(contexto['aleatorio'].randint(1, contexto['n']), contexto['aleatorio'].randint(1, contexto['n'])) for _ in range(CONSULTAS)]
+    inicio = time.perf_counter()
+    for a, b in pares:
+        grafo.agregarArista(a, b)
+    return time.perf_counter() - inicio, CONSULTAS
+
+
+def _eliminarAristas(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+    ids = [a.identificador for a in contexto['aleatorio'].sample(grafo.aristas, min(CONSULTAS, len(grafo.aristas)))]
+    inicio = time.perf_counter()
+    for i in ids:
+        grafo.eliminarArista(i)
+    return time.perf_counter() - inicio, max(len(ids), 1)
+
+
+def _eliminarNodos(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+    ids = contexto['aleatorio'].sample(range(2, contexto['n'] + 1), min(CONSULTAS // 10, contexto['n'] - 1))
+    inicio = time.perf_counter()
+    for i in ids:
+        grafo.eliminarNodo(i)
+    return time.perf_counter() - inicio, max(len(ids), 1)
+
+
+def _repetir(funcion: Callable[['Grafo', Dict[str, Any]], Any]) -> Callable[['Grafo', Dict[str, Any]], Tuple[float, int]]:
+    '''
+    Convierte una operación que no edita el grafo en una medición que la repite hasta que el total llega a TIEMPO_MINIMO.
+    '''
+    def medir(grafo: 'Grafo', contexto: Dict[str, Any]) -> Tuple[float, int]:
+        llamadas = 0
+        inicio = time.perf_counter()
+        while True:
+            funcion(grafo, contexto)
+            llamadas += 1
+            total = time.perf_counter() - inicio
+            if total >= TIEMPO_MINIMO:
+                return total, llamadas
+    return medir
+
+
+def _guardar(grafo: 'Grafo', contexto: Dict[str, Any]) -> None:
+    escribirArchivoGrafo(grafo, os.path.join(contexto['carpeta'], 'grafo.grafo'))
+
+
+def _exportarCsv(grafo: 'Grafo', contexto: Dict[str, Any]) -> None:
+    with open(os.path.join(contexto['carpeta'], 'nodos.csv'), 'wb') as archivo:
+        escribirCsv(archivo, ENCABEZADO_NODOS, filasNodos(grafo))
+    with open(os.path.join(contexto['carpeta'], 'aristas.csv'), 'wb') as archivo:
+        escribirCsv(archivo, ENCABEZADO_ARISTAS, filasAristas(grafo))
+
+
+# (nombre, exponente esperado, medición que devuelve (segundos, llamadas)). Las ediciones van al final porque cambian el grafo.
+OPERACIONES: List[Tuple[str, int, Callable[['Grafo', Dict[str, Any]], Tuple[float, int]]]] = [
+    ('obtenerNodoPorId', 0, _buscarNodos),
+    ('recorrido BFS', 1, _repetir(lambda grafo, contexto: AlgoritmoBFS.obtenerRecorridoEnOrden(grafo, 1))),
+    ('recorrido DFS', 1, _repetir(lambda grafo, contexto: AlgoritmoDFS.obtenerRecorridoEnOrden(grafo, 1))),
+    ('ruta BFS', 1, _repetir(lambda grafo, contexto: AlgoritmoBFS.encontrarRutaMasCorta(grafo, 1, contexto['n']))),
+    ('ruta DFS', 1, _repetir(lambda grafo, contexto: AlgoritmoDFS.encontrarRuta(grafo, 1, contexto['n']))),
+    ('ruta Dijkstra', 1, _repetir(lambda grafo, contexto: AlgoritmoDijkstra.encontrarRutaMasCorta(grafo, 1, contexto['n']))),
+    ('árbol BFS', 1, _repetir(lambda grafo, contexto: AlgoritmoBFS.generarArbolBFS(grafo, 1))),
+    ('árbol DFS', 1, _repetir(lambda grafo, contexto: AlgoritmoDFS.generarArbolDFS(grafo, 1))),
+    ('guardar', 1, _repetir(_guardar)),
+    ('cargar', 1, _repetir(lambda grafo, contexto: leerArchivoGrafo(os.path.join(contexto['carpeta'], 'grafo.grafo')))),
+    ('exportar CSV', 1, _repetir(_exportarCsv)),
+    ('agregarNodo', 0, _agregarNodos),
+    ('agregarArista', 0, _agregarAristas),
+    ('eliminarArista', 0, _eliminarAristas),
+    ('eliminarNodo', 0, _eliminarNodos),
+]
+
+
+def ajustarExponente(puntos: List[Tuple[int, float]]) -> Union[float, None]:
+    '''
+    Pendiente por mínimos cuadrados de log(tiempo) contra log(n). Devuelve None con menos de dos puntos.
+    '''
+    puntos = [(math.log(n), math.log(t)) for n, t in puntos if t > 0]
+    if len(puntos) < 2:
+        return None
+    mediaX = sum(x for x, _ in puntos) / len(puntos)
+    mediaY = sum(y for _, y in puntos) / len(puntos)
+    varianza = sum((x - mediaX) ** 2 for x, _ in puntos)
+    if varianza == 0:
+        return None
+    return sum((x - mediaX) * (y - mediaY) for x, y in puntos) / varianza
+
+
+def _estimar(puntos: List[Tuple[int, float]], n: int, esperado: int) -> float:
+    '''
+    Estima el tiempo total en el tamaño n extrapolando desde el último punto con el exponente ajustado, o con el esperado (al menos 1) si todavía no se puede ajustar.
+    '''
+    if not puntos:
+        return 0.0
+    exponente = ajustarExponente(puntos)
+    exponente = max(exponente if exponente != None else esperado, esperado, 1)
+    ultimoN, ultimoTiempo = puntos[-1]
+    return ultimoTiempo * (n / ultimoN) ** exponente
+
+
+def medir(generador: str, dirigido: bool, tamanos: List[int], limite: float, semilla: int = 0) -> List[Dict[str, Any]]:
+    '''
+    Genera el grafo en cada tamaño y mide todas las operaciones.
+
+    Returns:
+        - List[Dict[str, Any]]: Un diccionario por operación (incluida "generar") con el exponente esperado, los segundos por llamada en cada tamaño (None si no se midió) y el exponente ajustado.
+    '''
+    nombres = [('generar', 1)] + [(nombre, esperado) for nombre, esperado, _ in OPERACIONES]
+    tiempos: Dict[str, Dict[int, Union[float, None]]] = {nombre: {} for nombre, _ in nombres}
+    totales: Dict[str, List[Tuple[int, float]]] = {nombre: [] for nombre, _ in nombres} # Tiempo total de cada medición, para estimar la siguiente
+    for n in tamanos:
+        if _estimar(totales['generar'], n, 1) > limite:
+            for nombre, _ in nombres:
+                tiempos[nombre][n] = None
+            continue
+        inicio = time.perf_counter()
+        grafo = GENERADORES[generador](n, dirigido, semilla)
+        total = time.perf_counter() - inicio
+        tiempos['generar'][n] = total
+        totales['generar'].append((n, total))
+        contexto = {'n': n, 'aleatorio': random.Random(semilla)}
+        with tempfile.TemporaryDirectory() as carpeta:
+            contexto['carpeta'] = carpeta
+            for nombre, esperado, operacion in OPERACIONES:
+                if _estimar(totales[nombre], n, esperado) > limite:
+                    tiempos[nombre][n] = None
+                    continue
+                total, llamadas = operacion(grafo, contexto)
+                tiempos[nombre][n] = total / llamadas
+                totales[nombre].append((n, total))
+        del grafo
+    resultados = []
+    for nombre, esperado in nombres:
+        medidos = [(n, t) for n, t in tiempos[nombre].items() if t != None]
+        resultados.append({'operacion': nombre, 'esperado': esperado, 'tiempos': tiempos[nombre], 'exponente': ajustarExponente(medidos)})
+    return resultados
+
+
+def _formatoTiempo(segundos: Union[float, None]) -> str:
+    if segundos == None:
+        return '-'
+    if segundos < 1e-3:
+        return f'{segundos * 1e6:.1f}µs'
+    if segundos < 1:
+        return f'{segundos * 1e3:.1f}ms'
+    return f'{segundos:.2f}s'
+
+
+def imprimirTabla(titulo: str, tamanos: List[int], resultados: List[Dict[str, Any]]) -> None:
+    print(f'\n{titulo}')
+    print(f'{"Operación":<18}' + ''.join(f'{f"n={n}":>12}' for n in tamanos) + f'{"Exponente":>11}{"Esperado":>10}')
+    for resultado in resultados:
+        exponente = resultado['exponente']
+        marca = ' !' if exponente != None and exponente > resultado['esperado'] + 0.5 else ''
+        texto = f'{exponente:.2f}' if exponente != None else '-'
+        print(f'{resultado["operacion"]:<18}' + ''.join(f'{_formatoTiempo(resultado["tiempos"][n]):>12}' for n in tamanos) + f'{texto:>11}{resultado["esperado"]:>10}{marca}')
+
+
+def main(argumentos: Union[List[str], None] = None):
+    parser = argparse.ArgumentParser(prog='proyecto.bench.escalamiento', description='Mide cómo escalan las operaciones de los grafos con grafos sintéticos.')
+    parser.add_argument('--tamanos', default='1000,10000,100000', help='Cantidades de nodos separadas por comas, de 10^3 a 10^7')
+    parser.add_argument('--generadores', default=','.join(GENERADORES), help='Generadores separados por comas: ' + ', '.join(GENERADORES))
+    parser.add_argument('--tipos', default='dirigido,noDirigido', help='dirigido, noDirigido o ambos separados por comas')
+    parser.add_argument('--limite', type=float, default=30, help='Segundos máximos estimados por operación, las que pasarían se dejan de medir')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--json', help='Archivo donde se guardan los resultados en JSON')
+    argumentos = parser.parse_args(argumentos)
+
+    tamanos = sorted(int(t) for t in argumentos.tamanos.split(','))
+    generadores = [g.strip() for g in argumentos.generadores.split(',')]
+    tipos = [t.strip() for t in argumentos.tipos.split(',')]
+    for generador in generadores:
+        if generador not in GENERADORES:
+            parser.error(f'Generador desconocido: {generador}')
+    for tipo in tipos:
+        if tipo not in ('dirigido', 'noDirigido'):
+            parser.error(f'Tipo desconocido: {tipo}')
+
+    salida = {'tamanos': tamanos, 'limite': argumentos.limite, 'semilla': argumentos.semilla, 'resultados': []}
+    for generador in generadores:
+        for tipo in tipos:
+            resultados = medir(generador, tipo == 'dirigido', tamanos, argumentos.limite, argumentos.semilla)
+            imprimirTabla(f'{generador} ({tipo})', tamanos, resultados)
+            for resultado in resultados:
+                salida['resultados'].append({'generador': generador, 'dirigido': tipo == 'dirigido', **resultado})
+
+    if argumentos.json != None:
+        with open(argumentos.json, 'w', encoding='utf-8') as archivo:
+            json.dump(salida, archivo, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+'''
+Generadores de grafos sintéticos con semilla, dirigidos o no dirigidos, para medir cómo escalan las operaciones:
+
+    - erdosRenyi: aristas entre pares de nodos escogidos al azar.
+    - barabasiAlbert: cada nodo nuevo se une a nodos existentes con probabilidad proporcional a su grado, lo que produce unos pocos nodos con muchos vecinos.
+    - rejilla: rejilla de dos dimensiones, cada nodo se une con el de la derecha y el de abajo.
+    - cadena: 1 - 2 - 3 - ... - n, la profundidad máxima posible.
+    - estrella: el nodo 1 se une con todos los demás, el grado máximo posible.
+
+Los nodos y las aristas salen de los modelos de GeneradorGrafos (proyecto.modelos.generacion), aquí solo se cargan en un grafo en memoria. Los nodos tienen los identificadores 1..n y las aristas pesos reales entre 1 y 10. En los grafos dirigidos las aristas van del nodo menor al mayor, así que todos los nodos se alcanzan desde el nodo 1 salvo en erdosRenyi.
+'''
+from ..modelos.grafo import *
+from ..modelos.generacion import GeneradorGrafos
+from typing import Callable, Dict
+
+
+def _construir(modelo: str, cantidadNodos: int, dirigido: bool, semilla: int, cantidadAristas: Union[int, None] = None, **parametros) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    grafo = GrafoDirigido() if dirigido else GrafoNoDirigido()
+    grafo.cargarMasivamente(GeneradorGrafos.nodos(cantidadNodos), GeneradorGrafos.aristas(modelo, cantidadNodos, cantidadAristas, semilla, **parametros))
+    return grafo
+
+
+def erdosRenyi(cantidadNodos: int, dirigido: bool = True, semilla: int = 0, gradoMedio: int = 4) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Grafo G(n, m) con cantidadNodos * gradoMedio / 2 aristas entre pares distintos escogidos al azar (modelo 'aleatorio').
+    '''
+    return _construir('aleatorio', cantidadNodos, dirigido, semilla, cantidadNodos * gradoMedio // 2)
+
+
+def barabasiAlbert(cantidadNodos: int, dirigido: bool = True, semilla: int = 0, aristasPorNodo: int = 2) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Grafo de enlace preferencial (modelo 'preferencial'): cada nodo a partir de aristasPorNodo + 1 se une a aristasPorNodo nodos anteriores distintos, escogidos con probabilidad proporcional a su grado.
+    '''
+    return _construir('preferencial', cantidadNodos, dirigido, semilla, aristasPorNodo=aristasPorNodo)
+
+
+def rejilla(cantidadNodos: int, dirigido: bool = True, semilla: int = 0) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Rejilla de ceil(sqrt(n)) columnas con los nodos por filas. Cada nodo se une con el de la derecha y el de abajo, si existen.
+    '''
+    return _construir('rejilla', cantidadNodos, dirigido, semilla)
+
+
+def cadena(cantidadNodos: int, dirigido: bool = True, semilla: int = 0) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    return _construir('cadena', cantidadNodos, dirigido, semilla)
+
+
+def estrella(cantidadNodos: int, dirigido: bool = True, semilla: int = 0) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    return _construir('estrella', cantidadNodos, dirigido, semilla)
+
+
+GENERADORES: Dict[str, Callable[..., Union['GrafoDirigido', 'GrafoNoDirigido']]] = {
+    'erdosRenyi': erdosRenyi,
+    'barabasiAlbert': barabasiAlbert,
+    'rejilla': rejilla,
+    'cadena': cadena,
+    'estrella': estrella,
+}
@@ -0,0 +1,262 @@
+'''
+Línea de comandos no interactiva para usar los grafos guardados desde scripts. Cada comando imprime su resultado en JSON en una sola línea y termina con código 1 si hubo un error ({"error": "..."}).
+
+    python -m proyecto.cli bfs --grafo grafo1 --desde 1 [--hasta 5]
+    python -m proyecto.cli dfs --grafo grafo1 --desde 1 [--hasta 5]
+    python -m proyecto.cli import red.txt --nombre red [--no-dirigido] [--procesos 4]
+    python -m proyecto.cli export --grafo grafo1 [--formato graphml] [--compresion .gz]
+    python -m proyecto.cli stats [--grafo grafo1]
+    python -m proyecto.cli bench [cantidadNodos] [cantidadAristas]
+    python -m proyecto.cli generate --nombre red --modelo potencia --nodos 1000000 [--aristas 10000000] [--no-dirigido] [--semilla 7] [--contenido 64]
+    python -m proyecto.cli batch --grafo grafo1 [consultas.jsonl | -] [--salida resultados.jsonl] [--procesos 4]
+    python -m proyecto.cli serve [--puerto 8765 | --socket ruta] [--procesos 2]
+
+Sin comando se abre el menú interactivo. Este módulo no importa la interfaz de consola (ni la librería art), así que una consulta solo paga el costo de abrir el grafo, mapeado si es posible.
+'''
+from .almacenamiento import *
+from .modelos.bfs import AlgoritmoBFS
+from .modelos.dfs import AlgoritmoDFS
+from .modelos.lotes import ConsultasPorLotes
+from .modelos.instrumentacion import activarDesdeEntorno, perfilado
+from typing import List
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+
+
+def recorrer(grafo: 'Grafo', algoritmo: str, desde: int, hasta: Union[int, None] = None) -> Dict[str, Any]:
+    '''
+    Devuelve el recorrido desde el nodo indicado o, si se indica hasta, la ruta entre los dos nodos (la más corta con 'bfs'). Lanza ValueError si el nodo de inicio no existe.
+    '''
+    if grafo.obtenerNodoPorId(desde) == -1:
+        raise ValueError(f'No existe el nodo {desde}')
+    if hasta == None:
+        clase = AlgoritmoBFS if algoritmo == 'bfs' else AlgoritmoDFS
+        return {'desde': desde, 'recorrido': clase.obtenerRecorridoEnOrden(grafo, desde)}
+    if algoritmo == 'bfs':
+        ruta = AlgoritmoBFS.encontrarRutaMasCorta(grafo, desde, hasta)
+    else:
+        ruta = AlgoritmoDFS.encontrarRuta(grafo, desde, hasta)
+    return {'desde': desde, 'hasta': hasta, 'ruta': ruta or None}
+
+
+def _recorrer(algoritmo: str, argumentos: argparse.Namespace) -> Dict[str, Any]:
+    if not existeGrafo(argumentos.grafo):
+        raise ValueError(f'No existe el grafo {argumentos.grafo}')
+    grafo = abrirGrafo(argumentos.grafo)
+    try:
+        return {'grafo': argumentos.grafo, **recorrer(grafo, algoritmo, argumentos.desde, argumentos.hasta)}
+    finally:
+        cerrarGrafo(grafo)
+
+
+def _importar(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    if existeGrafo(separarExtension(argumentos.nombre)[0]): # En cualquier formato, comparten el diario de edición
+        raise ValueError(f'Ya existe el grafo {argumentos.nombre}')
+    resultado = importarGrafo(argumentos.ruta, argumentos.nombre, not argumentos.no_dirigido, argumentos.procesos)
+    if resultado == None:
+        raise ValueError(f'No se pudo importar {argumentos.ruta}')
+    return {
+        'grafo': argumentos.nombre,
+        'nodos': len(resultado.grafo.nodos),
+        'aristas': len(resultado.grafo.aristas),
+        'filas': resultado.filas,
+        'descartadas': resultado.descartadas,
+        'filasPorSegundo': resultado.filasPorSegundo,
+    }
+
+
+def _exportar(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    if not existeGrafo(argumentos.grafo):
+        raise ValueError(f'No existe el grafo {argumentos.grafo}')
+    grafo = abrirGrafo(argumentos.grafo)
+    try:
+        if not exportarGrafo(grafo, argumentos.grafo, argumentos.compresion, argumentos.formato):
+            raise ValueError(f'No se pudo exportar el grafo {argumentos.grafo}')
+    finally:
+        cerrarGrafo(grafo)
+    return {'grafo': argumentos.grafo, 'carpeta': os.path.join(os.path.dirname(__file__), carpetaExportar, argumentos.grafo)}
+
+
+def _estadisticas(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    '''
+    Devuelve los datos del catálogo (tipo, nodos, aristas y tamaño) de un grafo o de todos, sin abrir ninguno.
+    '''
+    if argumentos.refrescar:
+        obtenerCatalogo().refrescar()
+    nombres = [argumentos.grafo] if argumentos.grafo != None else obtenerGrafos()
+    grafos = {}
+    for nombre in nombres:
+        nombreArchivo = obtenerArchivoGrafo(nombre)
+        if nombreArchivo == None:
+            raise ValueError(f'No existe el grafo {nombre}')
+        grafos[nombre] = {'archivo': nombreArchivo, **(obtenerCatalogo().obtener(nombreArchivo) or {})}
+    return {'grafos': grafos}
+
+
+def _medir(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    from .bench.compresion import generarGrafo, medir
+    import tempfile
+    cantidadAristas = argumentos.cantidadAristas if argumentos.cantidadAristas != None else 4 * argumentos.cantidadNodos
+    grafo = generarGrafo(argumentos.cantidadNodos, cantidadAristas)
+    with tempfile.TemporaryDirectory() as carpeta:
+        resultados = medir(grafo, carpeta)
+    return {
+        'nodos': argumentos.cantidadNodos,
+        'aristas': cantidadAristas,
+        'formatos': [
+            {'extension': extension, 'bytes': tamano, 'guardar': tiempoGuardado, 'cargar': tiempoCarga}
+            for extension, tamano, tiempoGuardado, tiempoCarga in resultados
+        ],
+    }
+
+
+def _generar(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    '''
+    Genera un grafo sintético y lo guarda sin construirlo en memoria. El avance se muestra en la salida de errores.
+    '''
+    parametros = {nombre: getattr(argumentos, nombre) for nombre in ('exponente', 'comunidades', 'mezcla') if getattr(argumentos, nombre) != None}
+    progreso = lambda escritas, total: print(f'\rAristas escritas: {escritas} de {total}', end='', file=sys.stderr, flush=True)
+    resultado = generarGrafoSintetico(argumentos.nombre, argumentos.modelo, argumentos.nodos, argumentos.aristas, not argumentos.no_dirigido,
+                                      argumentos.semilla, argumentos.contenido, progreso, **parametros)
+    print(file=sys.stderr)
+    return {'grafo': argumentos.nombre, 'modelo': argumentos.modelo, 'semilla': argumentos.semilla, **resultado}
+
+
+def _ejecutarLote(argumentos: argparse.Namespace) -> Dict[str, Any]:
+    '''
+    Responde las consultas del archivo (o de la entrada estándar) abriendo el grafo una sola vez. El avance se muestra en la salida de errores.
+    '''
+    if not existeGrafo(argumentos.grafo):
+        raise ValueError(f'No existe el grafo {argumentos.grafo}')
+    grafo = abrirGrafo(argumentos.grafo)
+    try:
+        adyacencia = Adyacencia.obtener(grafo)
+    finally:
+        cerrarGrafo(grafo)
+    progreso = lambda consultas: print(f'\rConsultas respondidas: {consultas}', end='', file=sys.stderr, flush=True)
+    with contextlib.ExitStack() as archivos:
+        if argumentos.consultas == '-':
+            entrada = sys.stdin
+        else:
+            archivo = archivos.enter_context(open(argumentos.consultas, 'rb'))
+            comprimido = archivos.enter_context(comprimir(archivo, separarCompresion(argumentos.consultas)[1], 'rb'))
+            entrada = io.TextIOWrapper(comprimido, encoding='utf-8')
+        salida = sys.stdout if argumentos.salida == '-' else archivos.enter_context(open(argumentos.salida, 'w', encoding='utf-8'))
+        resultado = ConsultasPorLotes.ejecutar(adyacencia, entrada, salida, argumentos.procesos, progreso)
+        salida.flush()
+    print(file=sys.stderr)
+    return {
+        'grafo': argumentos.grafo,
+        'consultas': resultado.consultas,
+        'unicas': resultado.unicas,
+        'recorridos': resultado.recorridos,
+        'errores': resultado.errores,
+        'consultasPorSegundo': resultado.consultasPorSegundo,
+    }
+
+
+def crearParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='proyecto', description='Consultas sobre los grafos guardados. Sin comando se abre el menú interactivo.')
+    comandos = parser.add_subparsers(dest='comando')
+
+    for nombre, ayuda in (('bfs', 'Recorrido o ruta más corta con BFS'), ('dfs', 'Recorrido o ruta con DFS')):
+        comando = comandos.add_parser(nombre, help=ayuda)
+        comando.add_argument('--grafo', required=True, help='Nombre del grafo guardado')
+        comando.add_argument('--desde', required=True, type=int, help='Identificador del nodo de inicio')
+        comando.add_argument('--hasta', type=int, help='Identificador del nodo de destino, si se indica se busca una ruta')
+
+    comando = comandos.add_parser('import', help='Importa una lista de aristas, un CSV de Gephi o una carpeta con nodos.csv y aristas.csv')
+    comando.add_argument('ruta')
+    comando.add_argument('--nombre', required=True, help='Nombre con el que se guarda el grafo, con extensión para escoger el formato')
+    comando.add_argument('--no-dirigido', action='store_true', help='Importa el grafo como no dirigido')
+    comando.add_argument('--procesos', type=int, default=1, help='Procesos que leen el archivo, 0 para usar todos los núcleos')
+
+    comando = comandos.add_parser('export', help='Exporta un grafo a la carpeta csv')
+    comando.add_argument('--grafo', required=True)
+    comando.add_argument('--formato', choices=['csv', 'graphml', 'gexf'], default='csv')
+    comando.add_argument('--compresion', choices=['', *COMPRESORES], default='')
+
+    comando = comandos.add_parser('stats', help='Datos del catálogo de un grafo o de todos')
+    comando.add_argument('--grafo')
+    comando.add_argument('--refrescar', action='store_true', help='Compara el catálogo con la carpeta antes, por si se copiaron o borraron archivos a mano')
+
+    comando = comandos.add_parser('bench', help='Compara el guardado y la carga en cada formato y compresión')
+    comando.add_argument('cantidadNodos', nargs='?', type=int, default=50000)
+    comando.add_argument('cantidadAristas', nargs='?', type=int)
+
+    comando = comandos.add_parser('generate', help='Genera un grafo sintético grande escribiéndolo por partes (ver proyecto.modelos.generacion)')
+    comando.add_argument('--nombre', required=True, help='Nombre con el que se guarda el grafo, con extensión para escoger el formato (binario por defecto)')
+    comando.add_argument('--modelo', choices=list(GeneradorGrafos.MODELOS), default='aleatorio')
+    comando.add_argument('--nodos', required=True, type=int)
+    comando.add_argument('--aristas', type=int, help='Por defecto 2 por nodo, la rejilla, la cadena, la estrella y el modelo preferencial tienen las suyas')
+    comando.add_argument('--no-dirigido', action='store_true', help='Genera un grafo no dirigido')
+    comando.add_argument('--semilla', type=int, default=0)
+    comando.add_argument('--contenido', type=int, default=0, help='Caracteres del contenido de cada nodo, con 0 es "Nodo i"')
+    comando.add_argument('--exponente', type=float, help='Exponente de la distribución de grados del modelo potencia, mayor que 2')
+    comando.add_argument('--comunidades', type=int, help='Cantidad de comunidades, por defecto la raíz de la cantidad de nodos')
+    comando.add_argument('--mezcla', type=float, help='Fracción de aristas entre comunidades distintas')
+
+    comando = comandos.add_parser('batch', help='Responde un archivo JSONL de consultas bfs, dfs, ruta y ruta_corta cargando el grafo una sola vez (ver proyecto.modelos.lotes)')
+    comando.add_argument('consultas', nargs='?', default='-', help='Archivo de consultas, puede estar comprimido. Con - se leen de la entrada estándar')
+    comando.add_argument('--grafo', required=True)
+    comando.add_argument('--salida', default='-', help='Archivo de resultados, por defecto la salida estándar')
+    comando.add_argument('--procesos', type=int, default=1, help='Procesos que responden las consultas, 0 para usar todos los núcleos')
+
+    comando = comandos.add_parser('serve', help='Servidor de consultas que mantiene los grafos cargados (ver proyecto.servidor)')
+    comando.add_argument('--puerto', type=int, default=8765, help='Puerto en localhost')
+    comando.add_argument('--socket', help='Ruta de un socket UNIX, en lugar del puerto')
+    comando.add_argument('--procesos', type=int, help='Procesos para las consultas pesadas, por defecto todos los núcleos')
+    return parser
+
+
+COMANDOS = {
+    'bfs': lambda argumentos: _recorrer('bfs', argumentos),
+    'dfs': lambda argumentos: _recorrer('dfs', argumentos),
+    'import': _importar,
+    'export': _exportar,
+    'stats': _estadisticas,
+    'bench': _medir,
+    'generate': _generar,
+    'batch': _ejecutarLote,
+}
+
+
+def main(argumentos: Union[List[str], None] = None) -> int:
+    '''
+    Ejecuta el comando indicado en los argumentos (por defecto sys.argv) e imprime su resultado en JSON junto con los segundos que tardó. Devuelve el código de salida.
+    '''
+    argumentos = crearParser().parse_args(argumentos)
+    activarDesdeEntorno()
+    if argumentos.comando == None:
+        from .__main__ import main as menu
+        menu()
+        return 0
+    if argumentos.comando == 'serve':
+        from .servidor import ServidorGrafos
+        import asyncio
+        try:
+            asyncio.run(ServidorGrafos(argumentos.procesos).servir(argumentos.puerto, argumentos.socket))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if argumentos.comando in ('import', 'batch') and argumentos.procesos == 0:
+        argumentos.procesos = None
+    # Los resultados de batch pueden ir a la salida estándar, en ese caso el resumen se muestra en la salida de errores
+    destino = sys.stderr if argumentos.comando == 'batch' and argumentos.salida == '-' else sys.stdout
+    inicio = time.perf_counter()
+    try:
+        resultado = perfilado(COMANDOS[argumentos.comando])(argumentos)
+    except (ValueError, OSError) as e:
+        print(json.dumps({'error': str(e)}, ensure_ascii=False), file=destino)
+        return 1
+    resultado['segundos'] = time.perf_counter() - inicio
+    print(json.dumps(resultado, ensure_ascii=False), file=destino)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
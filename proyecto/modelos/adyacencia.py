@@ -0,0 +1,151 @@
+from array import array
+from typing import Dict, Union
+from .grafo import *
+
+
+class Adyacencia:
+    '''
+    ---
+    Adyacencia
+    ---
+
+    Representación compacta de un grafo en formato CSR (Compressed Sparse Row). Los nodos se numeran por su posición (0, 1, ..., n-1) y los vecinos de la posición i son vecinos[offsets[i]:offsets[i+1]], cada uno con su peso en la misma posición del arreglo pesos.
+
+    Se construye en O(V+E) a partir de un grafo y permite a los algoritmos recorrer vecinos sin buscar nodos por identificador, que en la clase Grafo cuesta O(V) por consulta.
+
+    ---
+    ### Atributos:
+
+    - ids: arreglo con el identificador del nodo en cada posición.
+    - posiciones: diccionario identificador -> posición.
+    - offsets: arreglo de n+1 enteros con el inicio de los vecinos de cada posición.
+    - vecinos: arreglo con las posiciones de los vecinos.
+    - pesos: arreglo con el peso de cada arista de vecinos.
+    - dirigido: indica si el grafo original es dirigido.
+    - pesosNegativos: indica si alguna arista tiene peso negativo. Si no se proporciona al construirla se calcula la primera vez que se consulta y se guarda, ya que los arreglos no cambian.
+
+    ---
+    ### Métodos:
+
+    - desdeGrafo: metodo estático
+    - obtener: metodo estático
+    - cantidadNodos
+    - cantidadAristas
+    - grado
+    - tienePesosNegativos
+    - transpuesta
+    '''
+
+    def __init__(self, ids: 'array', offsets: 'array', vecinos: 'array', pesos: 'array', dirigido: bool, posiciones: Union[Dict[int, int], None] = None, pesosNegativos: Union[bool, None] = None):
+        self.ids = ids
+        self.offsets = offsets
+        self.vecinos = vecinos
+        self.pesos = pesos
+        self.dirigido = dirigido
+        self.pesosNegativos = pesosNegativos
+        # Si no se proporcionan las posiciones se calculan a partir de los ids
+        self.posiciones: Dict[int, int] = posiciones if posiciones != None else {idNodo: i for i, idNodo in enumerate(ids)}
+
+    @staticmethod
+    def desdeGrafo(grafo: Union['GrafoDirigido', 'GrafoNoDirigido']) -> 'Adyacencia':
+        '''
+        ---
+        Construye la adyacencia a partir de las aristas del grafo en O(V+E).
+
+        ---
+        Notas:
+        ---
+        - El orden de los vecinos de cada nodo es el mismo que el de la lista "vecinos" de sus objetos Nodo, por lo que los recorridos sobre la adyacencia visitan los nodos en el mismo orden que sobre el grafo.
+        - En grafos no dirigidos cada arista aparece en ambos sentidos.
+        '''
+        ids = array('q', (nodo.identificador for nodo in grafo.nodos))
+        posiciones = {idNodo: i for i, idNodo in enumerate(ids)}
+        dirigido = grafo.esDirigido()
+        n = len(ids)
+
+        # Se cuentan los vecinos de cada posicion
+        grados = [0] * n
+        for arista in grafo.aristas:
+            grados[posiciones[arista.a]] += 1
+            if not dirigido:
+                grados[posiciones[arista.b]] += 1
+
+        # La suma acumulada de los grados da el inicio de cada fila
+        offsets = array('q', [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + grados[i]
+
+        total = offsets[n]
+        vecinos = array('q', [0]) * total
+        pesos = array('d', [0.0]) * total
+        siguiente = list(offsets[:n]) # Proxima casilla libre de cada fila
+        for arista in grafo.aristas:
+            pa = posiciones[arista.a]
+            pb = posiciones[arista.b]
+            vecinos[siguiente[pa]] = pb
+            pesos[siguiente[pa]] = arista.peso
+            siguiente[pa] += 1
+            if not dirigido:
+                vecinos[siguiente[pb]] = pa
+                pesos[siguiente[pb]] = arista.peso
+                siguiente[pb] += 1
+
+        return Adyacencia(ids, offsets, vecinos, pesos, dirigido, posiciones, len(pesos) > 0 and min(pesos) < 0)
+
+    @staticmethod
+    def obtener(grafo: Union['Grafo', 'Adyacencia']) -> 'Adyacencia':
+        '''
+        Devuelve el mismo objeto si ya es una Adyacencia, de lo contrario la construye a partir del grafo. Permite que los algoritmos acepten indistintamente un grafo o una adyacencia construida previamente. Si el grafo ya tiene sus arreglos listos (por ejemplo un GrafoMapeado) se usa su método obtenerAdyacencia.
+        '''
+        if isinstance(grafo, Adyacencia):
+            return grafo
+        if hasattr(grafo, 'obtenerAdyacencia'):
+            return grafo.obtenerAdyacencia()
+        return Adyacencia.desdeGrafo(grafo)
+
+    def cantidadNodos(self) -> int:
+        return len(self.ids)
+
+    def cantidadAristas(self) -> int:
+        '''
+        Devuelve la cantidad de entradas de la adyacencia, en grafos no dirigidos cada arista cuenta dos veces.
+        '''
+        return len(self.vecinos)
+
+    def grado(self, posicion: int) -> int:
+        return self.offsets[posicion + 1] - self.offsets[posicion]
+
+    def tienePesosNegativos(self) -> bool:
+        '''
+        Indica si alguna arista tiene peso negativo. Se calcula en O(E) una sola vez, las siguientes consultas cuestan O(1).
+        '''
+        if self.pesosNegativos == None:
+            self.pesosNegativos = len(self.pesos) > 0 and min(self.pesos) < 0
+        return self.pesosNegativos
+
+    def transpuesta(self) -> 'Adyacencia':
+        '''
+        Devuelve la adyacencia con el sentido de las aristas invertido, útil para obtener los padres de cada nodo en grafos dirigidos. En grafos no dirigidos devuelve el mismo objeto.
+        '''
+        if not self.dirigido:
+            return self
+        n = len(self.ids)
+        grados = [0] * n
+        for v in self.vecinos:
+            grados[v] += 1
+
+        offsets = array('q', [0]) * (n + 1)
+        for i in range(n):
+            offsets[i + 1] = offsets[i] + grados[i]
+
+        vecinos = array('q', [0]) * len(self.vecinos)
+        pesos = array('d', [0.0]) * len(self.pesos)
+        siguiente = list(offsets[:n])
+        for u in range(n):
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.vecinos[k]
+                vecinos[siguiente[v]] = u
+                pesos[siguiente[v]] = self.pesos[k]
+                siguiente[v] += 1
+
+        return Adyacencia(self.ids, offsets, vecinos, pesos, True, self.posiciones, self.pesosNegativos)
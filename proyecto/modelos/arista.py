@@ -1,16 +1,24 @@
 from typing import Dict, Any 
 
 class Arista():
-    def __init__(self, identificador: int, a: int, b: int):
+    def __init__(self, identificador: int, a: int, b: int, peso: float = 1):
+        '''
+        Args:
+            - identificador: Es el identificador único de la arista.
+            - a: Es el identificador del primer nodo (nodo origen en grafos dirigidos).
+            - b: Es el identificador del segundo nodo (nodo destino en grafos dirigidos).
+            - peso: Es el costo de recorrer la arista, por defecto es 1 para que las rutas equivalgan a contar saltos.
+        '''
         self.identificador = identificador
         self.a = a 
         self.b = b 
+        self.peso = peso
     
     def __str__(self):
         return f'({self.a},{self.b})'
     
     def __repr__(self):
-        return f'Arista({self.identificador}, {self.a}, {self.b})'
+        return f'Arista({self.identificador}, {self.a}, {self.b}, {self.peso})'
     
     def __eq__(self, otraArista: 'Arista') -> bool:
         return type(self) == type(otraArista) and self.identificador == otraArista.identificador
@@ -28,5 +36,6 @@ class Arista():
         return {
             'identificador': self.identificador,
             'a': self.a,
-            'b': self.b
+            'b': self.b,
+            'peso': self.peso
         }
\ No newline at end of file
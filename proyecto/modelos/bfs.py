@@ -1,6 +1,8 @@
 from .grafo import *
+from .adyacencia import Adyacencia
+from array import array
 from collections import deque
-from typing import List, Union, Deque
+from typing import Any, Callable, Dict, List, Tuple, Union, Deque
 
 class AlgoritmoBFS():
     '''
@@ -16,10 +18,13 @@ class AlgoritmoBFS():
     - obtenerRecorridoEnOrden
     - encontrarRutaMasCorta
     - generarArbolBFS
+    - calcularDistancias
+    - calcularDistanciasPorPosicion
+    - calcularArbolPorPosicion
     '''
 
     @staticmethod
-    def obtenerRecorridoEnOrden(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int) -> List[int]:
+    def obtenerRecorridoEnOrden(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> List[int]:
         '''
         ---
         Obtiene el recorrido en orden utilizando el algoritmo de Búsqueda en Amplitud (BFS).
@@ -29,6 +34,7 @@ class AlgoritmoBFS():
         ---
         - grafo (Grafo): El grafo sobre el cual se realizará la búsqueda.
         - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la cola, recorrido hasta el momento) cada vez que se visita un nodo. Puede lanzar una excepción para detener el recorrido (ver Tarea).
 
         ---
         Returns:
@@ -69,10 +75,12 @@ class AlgoritmoBFS():
                     nodosVisitados.append(nodo)
                     vecinos = grafo.obtenerNodoPorId(nodo).vecinos 
                     colaBusqueda += [v.identificador for v in vecinos]
+                    if progreso != None:
+                        progreso(len(nodosVisitados), len(colaBusqueda), nodosVisitados)
         return nodosVisitados
     
     @staticmethod
-    def encontrarRutaMasCorta(grafo: 'Grafo', nodoInicio: int, nodoFin: int) -> List[int] | None:
+    def encontrarRutaMasCorta(grafo: 'Grafo', nodoInicio: int, nodoFin: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> List[int] | None:
         '''
         ---
         Encuentra la ruta más corta entre dos nodos utilizando el algoritmo de Búsqueda en Amplitud (BFS).
@@ -83,6 +91,7 @@ class AlgoritmoBFS():
         - grafo (Grafo): El grafo sobre el cual se realizará la búsqueda.
         - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
         - nodoFin (int): El identificador del nodo al cual se desea llegar.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la cola, None) cada vez que se visita un nodo. Puede lanzar una excepción para detener la búsqueda (ver Tarea).
 
         ---
         Returns:
@@ -145,17 +154,19 @@ class AlgoritmoBFS():
                         colaBusqueda += vecinosFiltrados
                         for v in vecinosFiltrados:
                             padres[v] = nodo
+                        if progreso != None:
+                            progreso(len(nodosVisitados), len(colaBusqueda), None)
         return None
     
     @staticmethod
     @overload
-    def generarArbolBFS(grafo: 'GrafoDirigido', raiz: int) -> 'GrafoDirigido': ...
+    def generarArbolBFS(grafo: 'GrafoDirigido', raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> 'GrafoDirigido': ...
     @staticmethod
     @overload
-    def generarArbolBFS(grafo: 'GrafoNoDirigido', raiz: int) -> 'GrafoNoDirigido': ...
+    def generarArbolBFS(grafo: 'GrafoNoDirigido', raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> 'GrafoNoDirigido': ...
 
     @staticmethod
-    def generarArbolBFS(grafo: Union['GrafoDirigido','GrafoNoDirigido'], raiz: int) -> Union['GrafoDirigido','GrafoNoDirigido',None]:
+    def generarArbolBFS(grafo: Union['GrafoDirigido','GrafoNoDirigido'], raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> Union['GrafoDirigido','GrafoNoDirigido',None]:
         '''
         ---
         Genera un árbol BFS a partir de un grafo y una raíz especificada.
@@ -165,6 +176,7 @@ class AlgoritmoBFS():
         ---
         - grafo (Grafo): El grafo sobre el cual se generará el árbol BFS.
         - raiz (int): El identificador del nodo raíz desde el cual comenzará la generación.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la cola, árbol construido hasta el momento) cada vez que se visita un nodo. Puede lanzar una excepción para detener la generación (ver Tarea).
 
         ---
         Returns:
@@ -229,6 +241,92 @@ class AlgoritmoBFS():
                             n = grafo.obtenerNodoPorId(v)
                             arbol.agregarNodo(Nodo(n.identificador,n.contenido))
                         arbol.agregarArista(nodo,v)
+                    if progreso != None:
+                        progreso(len(nodosVisitados), len(colaBusqueda), arbol)
             return arbol
-        return None 
-    
+        return None
+
+    @staticmethod
+    def calcularDistancias(grafo: Union['GrafoDirigido','GrafoNoDirigido','Adyacencia'], nodoInicio: int) -> Dict[int, int]:
+        '''
+        ---
+        Calcula la cantidad mínima de aristas (saltos) desde un nodo hacia todos los nodos alcanzables.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se realizará la búsqueda, puede ser una Adyacencia construida previamente.
+        - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+
+        ---
+        Returns:
+        ---
+        - Dict[int, int]: Diccionario identificador -> distancia en saltos. Solo contiene los nodos alcanzables.
+
+        ---
+        Nota:
+        ---
+        - Si el nodo de inicio no existe en el grafo, el diccionario devuelto estará vacío.
+        '''
+        adyacencia = Adyacencia.obtener(grafo)
+        inicio = adyacencia.posiciones.get(nodoInicio, -1)
+        if inicio == -1:
+            return {}
+        distancias = AlgoritmoBFS.calcularDistanciasPorPosicion(adyacencia, inicio)
+        return {adyacencia.ids[i]: d for i, d in enumerate(distancias) if d != -1}
+
+    @staticmethod
+    def calcularDistanciasPorPosicion(adyacencia: 'Adyacencia', inicio: int) -> 'array':
+        '''
+        ---
+        Recorrido BFS en O(V+E) sobre una Adyacencia, trabajando únicamente con posiciones.
+
+        ---
+        Args:
+        ---
+        - adyacencia (Adyacencia): La adyacencia sobre la que se realiza el recorrido.
+        - inicio (int): La posición (no el identificador) del nodo de inicio.
+
+        ---
+        Returns:
+        ---
+        - array: Arreglo de enteros de 32 bits donde la casilla i es la distancia en saltos hasta la posición i, o -1 si no es alcanzable.
+        '''
+        offsets = adyacencia.offsets
+        vecinos = adyacencia.vecinos
+        distancias = array('i', [-1]) * len(adyacencia.ids)
+        distancias[inicio] = 0
+        colaBusqueda: Deque[int] = deque([inicio])
+        while colaBusqueda:
+            u = colaBusqueda.popleft()
+            siguiente = distancias[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = vecinos[k]
+                if distancias[v] == -1:
+                    distancias[v] = siguiente
+                    colaBusqueda.append(v)
+        return distancias
+
+    @staticmethod
+    def calcularArbolPorPosicion(adyacencia: 'Adyacencia', inicio: int) -> Tuple[List[int], 'array']:
+        '''
+        ---
+        Recorrido BFS en O(V+E) sobre una Adyacencia que guarda el padre de cada posición, para responder con un solo recorrido todas las rutas más cortas que salen del mismo nodo.
+
+        ---
+        Returns:
+        ---
+        - (orden, padres): orden son las posiciones en el orden en que se visitaron (el mismo de obtenerRecorridoEnOrden) y padres[i] es la posición anterior a i en su ruta más corta, -1 para el inicio y -2 si i no es alcanzable.
+        '''
+        offsets = adyacencia.offsets
+        vecinos = adyacencia.vecinos
+        padres = array('q', [-2]) * len(adyacencia.ids)
+        padres[inicio] = -1
+        orden = [inicio]
+        for u in orden: # orden funciona como la cola, se recorre mientras crece
+            for k in range(offsets[u], offsets[u + 1]):
+                v = vecinos[k]
+                if padres[v] == -2:
+                    padres[v] = u
+                    orden.append(v)
+        return orden, padres
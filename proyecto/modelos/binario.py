@@ -0,0 +1,304 @@
+'''
+Formato binario compacto para guardar grafos.
+
+El archivo tiene una cabecera fija seguida de secciones contiguas:
+
+    Cabecera (struct '<4sHHqqqq', 40 bytes):
+        - firma:            b'EDAG'
+        - version:          uint16
+        - banderas:         uint16 (bit 0: dirigido, bit 1: incluye adyacencia CSR)
+        - cantidadNodos:    int64 (n)
+        - cantidadAristas:  int64 (m)
+        - tamanoContenido:  int64 (bytes del bloque de contenidos)
+        - cantidadVecinos:  int64 (k, entradas de la adyacencia: m en grafos dirigidos y 2m en no dirigidos)
+
+    Secciones:
+        - idsNodos:          int64[n]
+        - offsetsContenido:  int64[n+1]  el contenido del nodo i es contenido[offsets[i]:offsets[i+1]]
+        - idsAristas:        int64[m]
+        - origenes:          int64[m]
+        - destinos:          int64[m]
+        - pesos:             float64[m]
+        Solo si incluye adyacencia CSR:
+        - ordenIds:          int64[n]    posiciones de los nodos ordenadas por identificador, para buscar con búsqueda binaria
+        - offsetsVecinos:    int64[n+1]  los vecinos de la posición i son vecinos[offsetsVecinos[i]:offsetsVecinos[i+1]]
+        - vecinos:           int64[k]    posiciones de los vecinos, en el mismo orden que Nodo.vecinos
+        - pesosVecinos:      float64[k]
+        Siempre al final:
+        - tiposContenido:    uint8[n]    0: None, 1: texto UTF-8, 2: JSON
+        - contenido:         bytes[tamanoContenido]
+
+Todos los enteros y reales se guardan en little-endian. Los arreglos numéricos van antes que los de bytes para que cada uno empiece en una posición múltiplo de 8, lo que permite usarlos directamente sobre un mmap.
+
+La versión 1 del formato tenía una cabecera de 32 bytes sin cantidadVecinos y nunca incluía la adyacencia, se sigue pudiendo leer.
+'''
+from .grafo import *
+from .adyacencia import Adyacencia
+from array import array
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, Tuple, Union
+import contextlib
+import json
+import shutil
+import struct
+import sys
+import tempfile
+
+EXTENSION_BINARIA = '.grafo'
+FIRMA = b'EDAG'
+VERSION = 2
+CABECERA = struct.Struct('<4sHHqqqq')
+CABECERA_V1 = struct.Struct('<4sHHqqq')
+
+BANDERA_DIRIGIDO = 1
+BANDERA_CSR = 2
+
+CONTENIDO_NINGUNO = 0
+CONTENIDO_TEXTO = 1
+CONTENIDO_JSON = 2
+
+TAMANO_LOTE = 1 << 16 # Nodos o aristas que escribirGrafoBinarioPorPartes convierte juntos
+
+
+def _aLittleEndian(arreglo: 'array') -> bytes:
+    if sys.byteorder == 'big':
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desdeLittleEndian(tipo: str, datos: Union[bytes, memoryview]) -> 'array':
+    arreglo = array(tipo)
+    arreglo.frombytes(datos)
+    if sys.byteorder == 'big':
+        arreglo.byteswap()
+    return arreglo
+
+
+def leerCabecera(datos: Union[bytes, memoryview]) -> Dict[str, int]:
+    '''
+    Interpreta la cabecera de un archivo binario de grafo (versión 1 o 2).
+
+    Returns:
+        - Dict[str, int]: 'version', 'banderas', 'n', 'm', 'tamanoContenido', 'k' y 'tamanoCabecera'.
+
+    Lanza ValueError si los datos no empiezan con la firma o la versión no es conocida.
+    '''
+    firma, version = struct.unpack_from('<4sH', datos, 0)
+    if firma != FIRMA or version not in (1, VERSION):
+        raise ValueError('El archivo no es un grafo binario válido')
+    if version == 1:
+        _, _, banderas, n, m, tamanoContenido = CABECERA_V1.unpack_from(datos, 0)
+        k = 0
+        tamanoCabecera = CABECERA_V1.size
+    else:
+        _, _, banderas, n, m, tamanoContenido, k = CABECERA.unpack_from(datos, 0)
+        tamanoCabecera = CABECERA.size
+    return {'version': version, 'banderas': banderas, 'n': n, 'm': m, 'tamanoContenido': tamanoContenido, 'k': k, 'tamanoCabecera': tamanoCabecera}
+
+
+def ubicarSecciones(cabecera: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
+    '''
+    Calcula a partir de la cabecera la posición de inicio y fin (en bytes) de cada sección del archivo. Las secciones de la adyacencia solo aparecen si el archivo la incluye.
+    '''
+    n, m, k = cabecera['n'], cabecera['m'], cabecera['k']
+    tamanos = [('idsNodos', 8 * n), ('offsetsContenido', 8 * (n + 1)), ('idsAristas', 8 * m), ('origenes', 8 * m), ('destinos', 8 * m), ('pesos', 8 * m)]
+    if cabecera['banderas'] & BANDERA_CSR:
+        tamanos += [('ordenIds', 8 * n), ('offsetsVecinos', 8 * (n + 1)), ('vecinos', 8 * k), ('pesosVecinos', 8 * k)]
+    tamanos += [('tiposContenido', n), ('contenido', cabecera['tamanoContenido'])]
+
+    secciones = {}
+    posicion = cabecera['tamanoCabecera']
+    for nombre, tamano in tamanos:
+        secciones[nombre] = (posicion, posicion + tamano)
+        posicion += tamano
+    return secciones
+
+
+def codificarContenido(contenido) -> Tuple[int, bytes]:
+    '''
+    Devuelve el tipo y los bytes con los que se guarda el contenido de un nodo, el inverso de decodificarContenido.
+    '''
+    if contenido == None:
+        return CONTENIDO_NINGUNO, b''
+    if type(contenido) == str:
+        return CONTENIDO_TEXTO, contenido.encode('utf-8')
+    return CONTENIDO_JSON, json.dumps(contenido).encode('utf-8')
+
+
+def decodificarContenido(tipo: int, datos: Union[bytes, memoryview]):
+    '''
+    Convierte los bytes del contenido de un nodo en el valor original según su tipo.
+    '''
+    if tipo == CONTENIDO_NINGUNO:
+        return None
+    texto = str(datos, 'utf-8')
+    return texto if tipo == CONTENIDO_TEXTO else json.loads(texto)
+
+
+def escribirGrafoBinario(grafo: Union['GrafoDirigido', 'GrafoNoDirigido'], archivo: BinaryIO, incluirAdyacencia: bool = True) -> None:
+    '''
+    ---
+    Escribe el grafo en el formato binario en un archivo abierto en modo 'wb'.
+
+    ---
+    Args:
+    ---
+    - grafo: El grafo que se va a guardar.
+    - archivo: Archivo abierto en modo binario.
+    - incluirAdyacencia: Si es True se guarda también la adyacencia en formato CSR, necesaria para abrir el grafo con GrafoMapeado.
+
+    ---
+    Notas:
+    ---
+    - Los contenidos de texto se guardan tal cual en UTF-8, cualquier otro contenido se guarda como JSON para conservar su tipo, igual que en el formato JSON del programa.
+    '''
+    n = len(grafo.nodos)
+    m = len(grafo.aristas)
+
+    offsetsContenido = array('q', [0]) * (n + 1)
+    tiposContenido = bytearray(n)
+    contenido = bytearray()
+    for i, nodo in enumerate(grafo.nodos):
+        tiposContenido[i], datos = codificarContenido(nodo.contenido)
+        contenido += datos
+        offsetsContenido[i + 1] = len(contenido)
+
+    idsNodos = array('q', (nodo.identificador for nodo in grafo.nodos))
+    adyacencia = Adyacencia.desdeGrafo(grafo) if incluirAdyacencia else None
+    banderas = BANDERA_DIRIGIDO if grafo.esDirigido() else 0
+    if adyacencia != None:
+        banderas |= BANDERA_CSR
+    k = len(adyacencia.vecinos) if adyacencia != None else 0
+
+    archivo.write(CABECERA.pack(FIRMA, VERSION, banderas, n, m, len(contenido), k))
+    archivo.write(_aLittleEndian(idsNodos))
+    archivo.write(_aLittleEndian(offsetsContenido))
+    archivo.write(_aLittleEndian(array('q', (arista.identificador for arista in grafo.aristas))))
+    archivo.write(_aLittleEndian(array('q', (arista.a for arista in grafo.aristas))))
+    archivo.write(_aLittleEndian(array('q', (arista.b for arista in grafo.aristas))))
+    archivo.write(_aLittleEndian(array('d', (arista.peso for arista in grafo.aristas))))
+    if adyacencia != None:
+        archivo.write(_aLittleEndian(array('q', sorted(range(n), key=idsNodos.__getitem__))))
+        archivo.write(_aLittleEndian(adyacencia.offsets))
+        archivo.write(_aLittleEndian(adyacencia.vecinos))
+        archivo.write(_aLittleEndian(adyacencia.pesos))
+    archivo.write(tiposContenido)
+    archivo.write(contenido)
+
+
+def _porLotes(elementos: Iterable, tamano: int = TAMANO_LOTE) -> Iterator[list]:
+    elementos = iter(elementos)
+    while True:
+        lote = list(islice(elementos, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def escribirGrafoBinarioPorPartes(archivo: BinaryIO, dirigido: bool, nodos: Iterable['Nodo'], aristas: Iterable['Arista'], carpetaTemporal: Union[str, None] = None) -> Tuple[int, int]:
+    '''
+    ---
+    Escribe en el formato binario los nodos y aristas que se reciben, sin construir el grafo ni tenerlos todos en memoria.
+
+    ---
+    Args:
+    ---
+    - archivo: Archivo abierto en modo binario ('wb'), puede ser un compresor.
+    - dirigido: Si el grafo es dirigido.
+    - nodos, aristas: Los elementos del grafo, por ejemplo generadores. Las aristas deben unir nodos que estén en nodos.
+    - carpetaTemporal: Carpeta de los archivos temporales, por defecto la del sistema.
+
+    ---
+    Returns:
+    ---
+    - (n, m): La cantidad de nodos y aristas escritas.
+
+    ---
+    Descripción:
+    ---
+    La cabecera necesita las cantidades y el tamaño del contenido, y cada columna de las aristas es una sección separada, así que los elementos se convierten por lotes de TAMANO_LOTE y cada sección se escribe en su propio archivo temporal. Al final se escribe la cabecera y se copian las secciones en orden. La memoria usada es la de un lote, pero se necesita espacio en disco para una copia del archivo sin comprimir.
+
+    ---
+    Notas:
+    ---
+    - No se incluye la adyacencia CSR, que necesita las aristas agrupadas por nodo de origen. El archivo se lee igual con leerGrafoBinario, pero no se puede abrir con GrafoMapeado hasta que se vuelva a guardar completo.
+    '''
+    with contextlib.ExitStack() as pila:
+        nombres = ['idsNodos', 'offsetsContenido', 'idsAristas', 'origenes', 'destinos', 'pesos', 'tiposContenido', 'contenido']
+        secciones = {nombre: pila.enter_context(tempfile.TemporaryFile(dir=carpetaTemporal)) for nombre in nombres}
+
+        n = 0
+        tamanoContenido = 0
+        secciones['offsetsContenido'].write(_aLittleEndian(array('q', [0])))
+        for lote in _porLotes(nodos):
+            offsets = array('q', bytes(8 * len(lote)))
+            tipos = bytearray(len(lote))
+            contenido = bytearray()
+            for i, nodo in enumerate(lote):
+                tipos[i], datos = codificarContenido(nodo.contenido)
+                contenido += datos
+                offsets[i] = tamanoContenido + len(contenido)
+            secciones['idsNodos'].write(_aLittleEndian(array('q', [nodo.identificador for nodo in lote])))
+            secciones['offsetsContenido'].write(_aLittleEndian(offsets))
+            secciones['tiposContenido'].write(tipos)
+            secciones['contenido'].write(contenido)
+            n += len(lote)
+            tamanoContenido += len(contenido)
+
+        m = 0
+        for lote in _porLotes(aristas):
+            secciones['idsAristas'].write(_aLittleEndian(array('q', [arista.identificador for arista in lote])))
+            secciones['origenes'].write(_aLittleEndian(array('q', [arista.a for arista in lote])))
+            secciones['destinos'].write(_aLittleEndian(array('q', [arista.b for arista in lote])))
+            secciones['pesos'].write(_aLittleEndian(array('d', [arista.peso for arista in lote])))
+            m += len(lote)
+
+        archivo.write(CABECERA.pack(FIRMA, VERSION, BANDERA_DIRIGIDO if dirigido else 0, n, m, tamanoContenido, 0))
+        for nombre in nombres:
+            secciones[nombre].seek(0)
+            shutil.copyfileobj(secciones[nombre], archivo, 1 << 20)
+    return n, m
+
+
+def leerGrafoBinario(archivo: BinaryIO) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    ---
+    Lee un grafo guardado con escribirGrafoBinario desde un archivo abierto en modo 'rb'.
+
+    ---
+    Descripción:
+    ---
+    El archivo se lee de una sola vez y cada sección se convierte directamente en un arreglo con array.frombytes, sin interpretar texto. Luego el grafo se reconstruye con Grafo.cargarMasivamente en O(V+E).
+
+    ---
+    Returns:
+    ---
+    - GrafoDirigido | GrafoNoDirigido: El grafo reconstruido.
+
+    Lanza ValueError si el archivo no tiene la firma o la versión esperada.
+    '''
+    datos = memoryview(archivo.read())
+    cabecera = leerCabecera(datos)
+    secciones = ubicarSecciones(cabecera)
+
+    def seccion(nombre: str, tipo: str) -> 'array':
+        inicio, fin = secciones[nombre]
+        return _desdeLittleEndian(tipo, datos[inicio:fin])
+
+    idsNodos = seccion('idsNodos', 'q')
+    offsetsContenido = seccion('offsetsContenido', 'q')
+    inicio, fin = secciones['tiposContenido']
+    tiposContenido = datos[inicio:fin]
+    inicio, fin = secciones['contenido']
+    contenido = datos[inicio:fin]
+
+    def leerContenido(i: int):
+        return decodificarContenido(tiposContenido[i], contenido[offsetsContenido[i]:offsetsContenido[i + 1]])
+
+    grafo = GrafoDirigido() if cabecera['banderas'] & BANDERA_DIRIGIDO else GrafoNoDirigido()
+    grafo.cargarMasivamente(
+        map(Nodo, idsNodos, map(leerContenido, range(cabecera['n']))),
+        map(Arista, seccion('idsAristas', 'q'), seccion('origenes', 'q'), seccion('destinos', 'q'), seccion('pesos', 'd'))
+    )
+    return grafo
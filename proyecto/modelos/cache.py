@@ -0,0 +1,120 @@
+from .grafo import *
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+# Memoria aproximada de cada nodo y arista de un Grafo cargado, medida con tracemalloc con contenidos de texto cortos
+BYTES_POR_NODO = 250
+BYTES_POR_ARISTA = 220
+
+
+def estimarMemoria(grafo: 'Grafo') -> int:
+    '''
+    Estima en O(1) los bytes que ocupa un grafo cargado en memoria a partir de su cantidad de nodos y aristas.
+    '''
+    return len(grafo.nodos) * BYTES_POR_NODO + len(grafo.aristas) * BYTES_POR_ARISTA
+
+
+class CacheGrafos:
+    '''
+    ---
+    CacheGrafos
+    ---
+
+    Caché de grafos ya cargados con expulsión del menos usado recientemente (LRU). Cada grafo se guarda con una firma del archivo del que se leyó (por ejemplo la fecha de modificación y el tamaño), si al pedirlo la firma del archivo ya no es la misma el grafo se descarta y se cuenta como fallo.
+
+    Se limita la cantidad de grafos y, opcionalmente, la memoria aproximada que ocupan entre todos.
+
+    ---
+    ### Métodos:
+
+    - obtener
+    - guardar
+    - invalidar
+    - limpiar
+    - estadisticas
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    cache = CacheGrafos(capacidad=4, memoriaMaxima=512 * 1024 * 1024)
+    grafo = cache.obtener('grafo1.json', firma)
+    if grafo == None:
+        grafo = leerGrafo('grafo1.json')
+        cache.guardar('grafo1.json', firma, grafo)
+    print(cache.estadisticas())
+    ```
+
+    ---
+    Notas:
+    ---
+    - Los grafos no se copian, quien lo pide recibe el mismo objeto. Un grafo con cambios registrados sin guardar (Grafo.tieneCambios) ya no coincide con su archivo y se descarta al pedirlo.
+    '''
+
+    def __init__(self, capacidad: int = 4, memoriaMaxima: Union[int, None] = None):
+        '''
+        Args:
+            - capacidad: Cantidad máxima de grafos guardados.
+            - memoriaMaxima: Bytes aproximados que pueden ocupar los grafos guardados, None para no limitarlos. Un grafo más grande que este límite no se guarda.
+        '''
+        self.capacidad = capacidad
+        self.memoriaMaxima = memoriaMaxima
+        self._entradas: 'OrderedDict[str, Tuple[Hashable, Grafo, int]]' = OrderedDict() # clave -> (firma, grafo, memoria)
+        self.memoria = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obtener(self, clave: str, firma: Hashable) -> Union['Grafo', None]:
+        '''
+        Devuelve el grafo guardado con esa clave si su firma coincide, o None si no está o ya no es válido.
+        '''
+        entrada = self._entradas.get(clave)
+        if entrada != None and entrada[0] == firma and not entrada[1].tieneCambios():
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[1]
+        self.invalidar(clave)
+        self.fallos += 1
+        return None
+
+    def guardar(self, clave: str, firma: Hashable, grafo: 'Grafo') -> None:
+        '''
+        Guarda el grafo o reemplaza el que tenía la clave, y expulsa los menos usados hasta respetar los límites.
+        '''
+        self.invalidar(clave)
+        memoria = estimarMemoria(grafo)
+        if self.capacidad <= 0 or (self.memoriaMaxima != None and memoria > self.memoriaMaxima):
+            return
+        self._entradas[clave] = (firma, grafo, memoria)
+        self.memoria += memoria
+        while len(self._entradas) > self.capacidad or (self.memoriaMaxima != None and self.memoria > self.memoriaMaxima):
+            _, (_, _, memoriaExpulsada) = self._entradas.popitem(last=False)
+            self.memoria -= memoriaExpulsada
+            self.expulsiones += 1
+
+    def invalidar(self, clave: str) -> None:
+        entrada = self._entradas.pop(clave, None)
+        if entrada != None:
+            self.memoria -= entrada[2]
+
+    def limpiar(self) -> None:
+        self._entradas.clear()
+        self.memoria = 0
+
+    def estadisticas(self) -> Dict[str, Union[int, float]]:
+        '''
+        Devuelve los aciertos, fallos, expulsiones, la proporción de aciertos, la cantidad de grafos guardados y su memoria aproximada en bytes.
+        '''
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'expulsiones': self.expulsiones,
+            'tasaAciertos': self.aciertos / consultas if consultas else 0.0,
+            'grafos': len(self._entradas),
+            'memoria': self.memoria,
+        }
@@ -0,0 +1,286 @@
+from typing import Any, Callable, Dict, List, Tuple, Union
+import contextlib
+import json
+import os
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+NOMBRE_CATALOGO = '.catalogo' # Archivo del índice dentro de la carpeta de grafos
+VERSION_CATALOGO = 1
+
+
+class CatalogoGrafos:
+    '''
+    ---
+    CatalogoGrafos
+    ---
+
+    Índice de los grafos guardados en una carpeta. Por cada archivo de grafo guarda si es dirigido, la cantidad de nodos y aristas, el tamaño y la fecha de modificación del archivo. El índice se guarda en el archivo .catalogo de la misma carpeta, así el menú de selección puede mostrar los datos de cada grafo sin abrirlo.
+
+    El catálogo se mantiene al día con actualizar y quitar, que llaman las funciones que guardan y eliminan grafos. Si el archivo del índice no existe o no se puede leer, se reconstruye una vez recorriendo la carpeta.
+
+    Varios procesos pueden usar la misma carpeta a la vez (el menú, la línea de comandos, el servidor):
+        - El índice se vuelve a leer cuando cambia la fecha de modificación de .catalogo, así se ven los grafos que guardó otro proceso.
+        - Cada cambio se hace con un cerrojo sobre el archivo .catalogo.lock: se vuelve a leer el índice, se aplica el cambio y se reemplaza el archivo con os.replace, así un proceso no borra las entradas que agregó otro.
+        - El índice es solo una pista: existeArchivo confirma con os.path.isfile, quita las entradas de archivos que ya no existen y agrega los que aparecieron en la carpeta sin pasar por el catálogo. archivos, nombres y len responden solo con el índice, sin recorrer la carpeta; refrescar lo compara con la carpeta cuando se pide.
+
+    ---
+    ### Métodos:
+
+    - existeArchivo
+    - archivos
+    - nombres
+    - obtener
+    - actualizar
+    - registrar
+    - verificar
+    - quitar
+    - refrescar
+    - reconstruir
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    catalogo = CatalogoGrafos('datos_grafos', nombreDeArchivo, describir)
+    if catalogo.existeArchivo('grafo1.json'):
+        print(catalogo.obtener('grafo1.json')['nodos'])
+    ```
+    '''
+
+    def __init__(self, carpeta: str, nombreDeArchivo: Callable[[str], Union[str, None]], describir: Callable[[str], Dict[str, Any]]):
+        '''
+        Args:
+            - carpeta: Carpeta donde se guardan los grafos.
+            - nombreDeArchivo: Devuelve el nombre del grafo guardado en un archivo, o None si el archivo no es de un grafo.
+            - describir: Devuelve 'dirigido', 'nodos' y 'aristas' del grafo guardado en un archivo, solo se usa al reconstruir el catálogo.
+        '''
+        self.carpeta = carpeta
+        self.ruta = os.path.join(carpeta, NOMBRE_CATALOGO)
+        self.nombreDeArchivo = nombreDeArchivo
+        self.describir = describir
+        self._entradas: Union[Dict[str, Dict[str, Any]], None] = None # archivo -> datos del grafo
+        self._firma: Union[Tuple[int, int, int], None] = None # Fecha, tamaño e inodo de .catalogo cuando se leyó
+
+    def _firmaIndice(self) -> Union[Tuple[int, int, int], None]:
+        try:
+            estado = os.stat(self.ruta)
+        except OSError:
+            return None
+        return (estado.st_mtime_ns, estado.st_size, estado.st_ino)
+
+    def _leer(self) -> Union[Dict[str, Dict[str, Any]], None]:
+        '''
+        Lee el índice del archivo, o devuelve None si no existe o no se puede leer.
+        '''
+        firma = self._firmaIndice()
+        try:
+            with open(self.ruta, 'r', encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+            if datos.get('version') != VERSION_CATALOGO:
+                raise ValueError('Versión de catálogo desconocida')
+            entradas = datos['grafos']
+            if type(entradas) != dict:
+                raise ValueError('El catálogo no tiene grafos')
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+        self._firma = firma
+        return entradas
+
+    def _obtenerEntradas(self) -> Dict[str, Dict[str, Any]]:
+        '''
+        Devuelve el índice, volviendo a leerlo si otro proceso cambió el archivo desde la última lectura. Solo cuesta un os.stat si no cambió.
+        '''
+        if self._entradas == None or self._firmaIndice() != self._firma:
+            entradas = self._leer()
+            if entradas == None:
+                self._modificar(lambda entradas: False) # Con el cerrojo, por si otro proceso lo está creando
+            else:
+                self._entradas = entradas
+        return self._entradas
+
+    @contextlib.contextmanager
+    def _cerrojo(self):
+        '''
+        Cerrojo entre procesos sobre el archivo .catalogo.lock, con fcntl.flock en Linux y macOS y msvcrt.locking en Windows.
+        '''
+        os.makedirs(self.carpeta, exist_ok=True)
+        with open(self.ruta + '.lock', 'a+b') as archivo:
+            if fcntl != None:
+                fcntl.flock(archivo.fileno(), fcntl.LOCK_EX)
+            else:
+                archivo.seek(0)
+                msvcrt.locking(archivo.fileno(), msvcrt.LK_LOCK, 1) # Reintenta durante 10 segundos antes de fallar
+            try:
+                yield
+            finally:
+                if fcntl != None:
+                    fcntl.flock(archivo.fileno(), fcntl.LOCK_UN)
+                else:
+                    archivo.seek(0)
+                    msvcrt.locking(archivo.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _modificar(self, cambio: Callable[[Dict[str, Dict[str, Any]]], bool]) -> None:
+        '''
+        Aplica el cambio sobre la versión más reciente del índice y la guarda, todo con el cerrojo tomado. El cambio devuelve False si no modificó nada y no hace falta escribir el archivo.
+        '''
+        with self._cerrojo():
+            entradas = self._leer()
+            reconstruido = entradas == None
+            if reconstruido:
+                entradas = self._recorrerCarpeta()
+            cambiado = cambio(entradas)
+            self._entradas = entradas
+            if cambiado or reconstruido:
+                self._guardar()
+
+    def _guardar(self) -> None:
+        '''
+        Escribe el índice en un archivo temporal propio de este proceso y lo reemplaza de una vez, así nadie lee un archivo a medio escribir. Se llama con el cerrojo tomado.
+        '''
+        rutaTemporal = f'{self.ruta}.{os.getpid()}.tmp'
+        with open(rutaTemporal, 'w', encoding='utf-8') as archivo:
+            json.dump({'version': VERSION_CATALOGO, 'grafos': self._entradas}, archivo)
+        os.replace(rutaTemporal, self.ruta)
+        self._firma = self._firmaIndice()
+
+    def _datosArchivo(self, nombreArchivo: str) -> Union[Dict[str, int], None]:
+        try:
+            estado = os.stat(os.path.join(self.carpeta, nombreArchivo))
+        except OSError:
+            return None
+        return {'tamano': estado.st_size, 'mtime': estado.st_mtime_ns}
+
+    def _describirArchivo(self, nombreArchivo: str) -> Union[Dict[str, Any], None]:
+        '''
+        Devuelve la entrada de un archivo que no está en el índice leyendo el grafo, o None si no se puede leer.
+        '''
+        datosArchivo = self._datosArchivo(nombreArchivo)
+        try:
+            descripcion = self.describir(nombreArchivo)
+        except Exception:
+            return None
+        return {**descripcion, **datosArchivo} if datosArchivo != None else None
+
+    def _archivosEnCarpeta(self) -> List[str]:
+        archivos = os.listdir(self.carpeta) if os.path.isdir(self.carpeta) else []
+        return [nombreArchivo for nombreArchivo in archivos if self.nombreDeArchivo(nombreArchivo) != None]
+
+    def _recorrerCarpeta(self) -> Dict[str, Dict[str, Any]]:
+        '''
+        Crea las entradas de todos los grafos de la carpeta. Los grafos que no se pueden leer se omiten.
+        '''
+        entradas = {}
+        for nombreArchivo in self._archivosEnCarpeta():
+            entrada = self._describirArchivo(nombreArchivo)
+            if entrada != None:
+                entradas[nombreArchivo] = entrada
+        return entradas
+
+    def reconstruir(self) -> None:
+        '''
+        Vuelve a crear el índice recorriendo la carpeta. Los grafos que no se pueden leer se omiten.
+        '''
+        def reemplazar(entradas: Dict[str, Dict[str, Any]]) -> bool:
+            entradas.clear()
+            entradas.update(self._recorrerCarpeta())
+            return True
+        self._modificar(reemplazar)
+
+    def refrescar(self) -> None:
+        '''
+        Compara el índice con la carpeta: quita los archivos que ya no están y agrega los que se guardaron sin pasar por el catálogo. A diferencia de reconstruir, solo lee los grafos nuevos.
+        '''
+        presentes = self._archivosEnCarpeta()
+        self._modificar(lambda entradas: self._sincronizar(entradas, presentes))
+
+    def _sincronizar(self, entradas: Dict[str, Dict[str, Any]], presentes: List[str]) -> bool:
+        '''
+        Quita del índice los archivos que ya no están en la carpeta y agrega los que faltan. Devuelve True si cambió algo.
+        '''
+        cambiado = False
+        for nombreArchivo in set(entradas).difference(presentes):
+            del entradas[nombreArchivo]
+            cambiado = True
+        for nombreArchivo in set(presentes).difference(entradas):
+            entrada = self._describirArchivo(nombreArchivo)
+            if entrada != None:
+                entradas[nombreArchivo] = entrada
+                cambiado = True
+        return cambiado
+
+    def __len__(self) -> int:
+        return len(self._obtenerEntradas())
+
+    def existeArchivo(self, nombreArchivo: str) -> bool:
+        '''
+        Indica si el archivo de grafo existe. El índice responde en O(1) y se confirma con os.path.isfile. Si no coinciden, se corrige el índice: se quita la entrada de un archivo borrado y se agrega un archivo que se guardó sin pasar por el catálogo.
+        '''
+        enIndice = nombreArchivo in self._obtenerEntradas()
+        existe = self.nombreDeArchivo(nombreArchivo) != None and os.path.isfile(os.path.join(self.carpeta, nombreArchivo))
+        if existe and not enIndice:
+            entrada = self._describirArchivo(nombreArchivo)
+            if entrada != None:
+                self._modificar(lambda entradas: entradas.setdefault(nombreArchivo, entrada) is entrada)
+        elif enIndice and not existe:
+            self.quitar(nombreArchivo)
+        return existe
+
+    def archivos(self) -> List[str]:
+        '''
+        Devuelve los archivos de grafo del índice. Los archivos copiados a la carpeta o borrados sin pasar por el catálogo aparecen después de llamar a refrescar.
+        '''
+        return list(self._obtenerEntradas())
+
+    def nombres(self) -> List[str]:
+        '''
+        Devuelve los nombres de los grafos, un grafo guardado en dos formatos aparece una sola vez.
+        '''
+        return list(dict.fromkeys(self.nombreDeArchivo(a) for a in self.archivos()))
+
+    def obtener(self, nombreArchivo: str) -> Union[Dict[str, Any], None]:
+        '''
+        Devuelve los datos guardados del archivo ('dirigido', 'nodos', 'aristas', 'tamano' y 'mtime') o None si no está en el catálogo.
+        '''
+        return self._obtenerEntradas().get(nombreArchivo)
+
+    def actualizar(self, nombreArchivo: str, grafo) -> None:
+        '''
+        Registra o actualiza un archivo de grafo con los datos del grafo que se acaba de guardar en él. El grafo puede ser cualquier objeto con nodos, aristas y esDirigido.
+        '''
+        self.registrar(nombreArchivo, grafo.esDirigido(), len(grafo.nodos), len(grafo.aristas))
+
+    def registrar(self, nombreArchivo: str, dirigido: bool, nodos: int, aristas: int) -> None:
+        '''
+        Igual que actualizar pero con los datos sueltos, para los archivos que se escriben sin tener el grafo en memoria.
+        '''
+        datosArchivo = self._datosArchivo(nombreArchivo)
+        if datosArchivo == None:
+            return
+        entrada = {'dirigido': dirigido, 'nodos': nodos, 'aristas': aristas, **datosArchivo}
+        def agregar(entradas: Dict[str, Dict[str, Any]]) -> bool:
+            entradas[nombreArchivo] = entrada
+            return True
+        self._modificar(agregar)
+
+    def verificar(self, nombreArchivo: str, grafo) -> bool:
+        '''
+        Compara el tamaño y la fecha del archivo con los del catálogo y, si cambiaron (por ejemplo porque se modificó con un editor), actualiza los datos con el grafo recién leído del archivo.
+
+        Returns:
+            - bool: True si hubo que actualizar el catálogo.
+        '''
+        entrada = self.obtener(nombreArchivo)
+        datosArchivo = self._datosArchivo(nombreArchivo)
+        if entrada != None and datosArchivo != None and entrada['tamano'] == datosArchivo['tamano'] and entrada['mtime'] == datosArchivo['mtime'] \
+                and entrada['nodos'] == len(grafo.nodos) and entrada['aristas'] == len(grafo.aristas):
+            return False
+        self.actualizar(nombreArchivo, grafo)
+        return True
+
+    def quitar(self, nombreArchivo: str) -> None:
+        if nombreArchivo in self._obtenerEntradas():
+            self._modificar(lambda entradas: entradas.pop(nombreArchivo, None) != None)
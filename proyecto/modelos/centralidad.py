@@ -0,0 +1,287 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from .compartido import ArreglosCompartidos, arreglosTrabajador, iniciarTrabajador
+from array import array
+from collections import deque
+from typing import Dict, List, Union
+import os
+import random
+import time
+
+
+def _intermediacionParcial(fuentes: List[int], offsets: Union['array', None] = None, vecinos: Union['array', None] = None) -> List[float]:
+    '''
+    Acumula la dependencia de Brandes de las fuentes dadas. Si no se pasa la adyacencia se utiliza la del proceso trabajador.
+
+    Por cada fuente se hace un BFS que cuenta los caminos más cortos (sigma) y luego se recorren los nodos en orden inverso de distancia propagando la dependencia desde los sucesores, así no se necesitan listas de predecesores ni la adyacencia transpuesta.
+    '''
+    if offsets == None:
+        arreglos = arreglosTrabajador()
+        offsets, vecinos = arreglos['offsets'], arreglos['vecinos']
+    n = len(offsets) - 1
+    puntajes = [0.0] * n
+    distancias = array('i', [-1]) * n
+    sigma = [0] * n
+    dependencia = [0.0] * n
+    for s in fuentes:
+        orden = [s]
+        distancias[s] = 0
+        sigma[s] = 1
+        colaBusqueda = deque([s])
+        while colaBusqueda:
+            u = colaBusqueda.popleft()
+            siguiente = distancias[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = vecinos[k]
+                if distancias[v] == -1:
+                    distancias[v] = siguiente
+                    orden.append(v)
+                    colaBusqueda.append(v)
+                if distancias[v] == siguiente:
+                    sigma[v] += sigma[u]
+
+        for w in reversed(orden):
+            siguiente = distancias[w] + 1
+            acumulado = 0.0
+            for k in range(offsets[w], offsets[w + 1]):
+                x = vecinos[k]
+                if distancias[x] == siguiente:
+                    acumulado += (1.0 + dependencia[x]) / sigma[x]
+            dependencia[w] = sigma[w] * acumulado
+            if w != s:
+                puntajes[w] += dependencia[w]
+
+        # Solo se restablecen las casillas que se usaron en esta fuente
+        for w in orden:
+            distancias[w] = -1
+            sigma[w] = 0
+            dependencia[w] = 0.0
+    return puntajes
+
+
+class ResultadoCentralidad:
+    '''
+    ---
+    ResultadoCentralidad
+    ---
+
+    Resultado de un cálculo iterativo de centralidad.
+
+    ### Atributos:
+        - valores: diccionario identificador -> valor de centralidad.
+        - iteraciones: cantidad de iteraciones realizadas.
+        - tiempo: segundos que tomó el cálculo, incluida la construcción de la adyacencia.
+        - convergio: True si la diferencia entre dos iteraciones fue menor que la tolerancia antes de llegar al límite de iteraciones.
+    '''
+
+    def __init__(self, valores: Dict[int, float], iteraciones: int, tiempo: float, convergio: bool):
+        self.valores = valores
+        self.iteraciones = iteraciones
+        self.tiempo = tiempo
+        self.convergio = convergio
+
+    def __repr__(self) -> str:
+        return f'ResultadoCentralidad(nodos={len(self.valores)}, iteraciones={self.iteraciones}, tiempo={self.tiempo:.4f}s, convergio={self.convergio})'
+
+
+class AnalisisCentralidad:
+    '''
+    ---
+    AnalisisCentralidad
+    ---
+
+    Clase que proporciona métodos para calcular métricas de centralidad de los nodos sin necesidad de exportar el grafo a otra aplicación.
+
+    Los cálculos se hacen sobre la Adyacencia del grafo (formato CSR) con iteración de potencias: en cada iteración el valor de cada nodo es la suma de los valores de su fila de la adyacencia transpuesta, que se obtiene recorriendo un corte contiguo del arreglo de vecinos. Todos los métodos aceptan un grafo o una Adyacencia construida previamente.
+
+    ---
+    ### Métodos:
+
+    - calcularGradoEntrada
+    - calcularGradoSalida
+    - calcularPageRank
+    - calcularCentralidadVectorPropio
+    - calcularIntermediacion
+    '''
+
+    @staticmethod
+    def calcularGradoEntrada(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia']) -> Dict[int, int]:
+        '''
+        Devuelve un diccionario identificador -> cantidad de aristas que llegan al nodo. En grafos no dirigidos es igual al grado del nodo.
+        '''
+        transpuesta = Adyacencia.obtener(grafo).transpuesta()
+        return {idNodo: transpuesta.grado(i) for i, idNodo in enumerate(transpuesta.ids)}
+
+    @staticmethod
+    def calcularGradoSalida(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia']) -> Dict[int, int]:
+        '''
+        Devuelve un diccionario identificador -> cantidad de aristas que salen del nodo. En grafos no dirigidos es igual al grado del nodo.
+        '''
+        adyacencia = Adyacencia.obtener(grafo)
+        return {idNodo: adyacencia.grado(i) for i, idNodo in enumerate(adyacencia.ids)}
+
+    @staticmethod
+    def calcularPageRank(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], amortiguamiento: float = 0.85, tolerancia: float = 1e-6, maxIteraciones: int = 100) -> 'ResultadoCentralidad':
+        '''
+        ---
+        Calcula el PageRank de cada nodo con iteración de potencias.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se calculará el PageRank.
+        - amortiguamiento (float): Probabilidad de seguir una arista en lugar de saltar a un nodo al azar, por defecto 0.85.
+        - tolerancia (float): El cálculo se detiene cuando la suma de las diferencias absolutas entre dos iteraciones es menor que este valor.
+        - maxIteraciones (int): Límite de iteraciones aunque no se haya alcanzado la tolerancia.
+
+        ---
+        Returns:
+        ---
+        - ResultadoCentralidad: Los valores suman 1. Incluye las iteraciones realizadas y el tiempo empleado.
+
+        ---
+        Notas:
+        ---
+        - El valor de los nodos sin aristas de salida se reparte uniformemente entre todos los nodos.
+        - Las aristas repetidas cuentan tantas veces como aparezcan.
+        '''
+        inicioTiempo = time.perf_counter()
+        adyacencia = Adyacencia.obtener(grafo)
+        transpuesta = adyacencia.transpuesta()
+        n = adyacencia.cantidadNodos()
+        if n == 0:
+            return ResultadoCentralidad({}, 0, time.perf_counter() - inicioTiempo, True)
+
+        gradosSalida = [adyacencia.grado(i) for i in range(n)]
+        sinSalida = [i for i in range(n) if gradosSalida[i] == 0]
+        offsets = transpuesta.offsets
+        padres = transpuesta.vecinos
+
+        rangos = [1.0 / n] * n
+        iteraciones = 0
+        convergio = False
+        while iteraciones < maxIteraciones and not convergio:
+            iteraciones += 1
+            # Aporte que cada nodo envía por cada una de sus aristas de salida
+            aportes = [r / g if g else 0.0 for r, g in zip(rangos, gradosSalida)]
+            masaSinSalida = sum(rangos[i] for i in sinSalida)
+            base = (1.0 - amortiguamiento) / n + amortiguamiento * masaSinSalida / n
+            nuevos = [base + amortiguamiento * sum(map(aportes.__getitem__, padres[offsets[v]:offsets[v + 1]])) for v in range(n)]
+            diferencia = sum(abs(a - b) for a, b in zip(nuevos, rangos))
+            rangos = nuevos
+            convergio = diferencia < tolerancia
+
+        valores = dict(zip(adyacencia.ids, rangos))
+        return ResultadoCentralidad(valores, iteraciones, time.perf_counter() - inicioTiempo, convergio)
+
+    @staticmethod
+    def calcularCentralidadVectorPropio(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], tolerancia: float = 1e-6, maxIteraciones: int = 100) -> 'ResultadoCentralidad':
+        '''
+        ---
+        Calcula la centralidad de vector propio (eigenvector centrality) de cada nodo con iteración de potencias.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se calculará la centralidad.
+        - tolerancia (float): El cálculo se detiene cuando la suma de las diferencias absolutas entre dos iteraciones es menor que este valor.
+        - maxIteraciones (int): Límite de iteraciones aunque no se haya alcanzado la tolerancia.
+
+        ---
+        Returns:
+        ---
+        - ResultadoCentralidad: Vector normalizado (norma euclidiana 1). Incluye las iteraciones realizadas y el tiempo empleado.
+
+        ---
+        Notas:
+        ---
+        - En grafos dirigidos la centralidad de un nodo proviene de los nodos que apuntan hacia él.
+        - Cada iteración calcula x + A·x en lugar de A·x, que tiene el mismo vector propio pero converge también en grafos bipartitos donde A·x oscila.
+        '''
+        inicioTiempo = time.perf_counter()
+        transpuesta = Adyacencia.obtener(grafo).transpuesta()
+        n = transpuesta.cantidadNodos()
+        if n == 0:
+            return ResultadoCentralidad({}, 0, time.perf_counter() - inicioTiempo, True)
+
+        offsets = transpuesta.offsets
+        padres = transpuesta.vecinos
+        valores = [1.0 / n] * n
+        iteraciones = 0
+        convergio = False
+        while iteraciones < maxIteraciones and not convergio:
+            iteraciones += 1
+            nuevos = [valores[v] + sum(map(valores.__getitem__, padres[offsets[v]:offsets[v + 1]])) for v in range(n)]
+            norma = sum(x * x for x in nuevos) ** 0.5 or 1.0
+            nuevos = [x / norma for x in nuevos]
+            diferencia = sum(abs(a - b) for a, b in zip(nuevos, valores))
+            valores = nuevos
+            convergio = diferencia < tolerancia
+
+        return ResultadoCentralidad(dict(zip(transpuesta.ids, valores)), iteraciones, time.perf_counter() - inicioTiempo, convergio)
+
+    @staticmethod
+    def calcularIntermediacion(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], procesos: Union[int, None] = None, muestras: Union[int, None] = None, semilla: Union[int, None] = None, normalizar: bool = False) -> 'ResultadoCentralidad':
+        '''
+        ---
+        Calcula la centralidad de intermediación (betweenness) de cada nodo con el algoritmo de Brandes.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se calculará la centralidad. Las aristas se consideran sin peso.
+        - procesos (int | None): Cantidad de procesos trabajadores. Con None se usa la cantidad de CPUs y con 1 se calcula en el proceso actual.
+        - muestras (int | None): Si se indica, solo se hace el BFS desde esa cantidad de fuentes escogidas al azar y el resultado se escala por n/muestras. Es una aproximación útil en grafos muy grandes.
+        - semilla (int | None): Semilla para escoger las fuentes al azar, permite repetir un resultado aproximado.
+        - normalizar (bool): Si es True divide cada valor para la cantidad de pares de nodos que no lo incluyen, dejando los valores entre 0 y 1.
+
+        ---
+        Returns:
+        ---
+        - ResultadoCentralidad: Las iteraciones corresponden a la cantidad de fuentes procesadas.
+
+        ---
+        Descripción:
+        ---
+        Se necesita un BFS por cada fuente y las fuentes son independientes entre sí, por lo que se reparten en bloques entre los procesos. Cada proceso recibe la adyacencia plana (dos arreglos) una sola vez al iniciar, acumula los puntajes parciales de sus bloques y al final se suman los resultados de todos los bloques.
+
+        ---
+        Ejemplo de uso:
+        ---
+        ```python
+        exacta = AnalisisCentralidad.calcularIntermediacion(grafo, procesos=4)
+        aproximada = AnalisisCentralidad.calcularIntermediacion(grafo, muestras=256, semilla=7)
+        ```
+        '''
+        inicioTiempo = time.perf_counter()
+        adyacencia = Adyacencia.obtener(grafo)
+        n = adyacencia.cantidadNodos()
+
+        if muestras != None and muestras < n:
+            fuentes = random.Random(semilla).sample(range(n), muestras)
+        else:
+            fuentes = list(range(n))
+
+        procesos = procesos or os.cpu_count() or 1
+        procesos = max(1, min(procesos, len(fuentes)))
+        if procesos == 1:
+            puntajes = _intermediacionParcial(fuentes, adyacencia.offsets, adyacencia.vecinos)
+        else:
+            # Varios bloques por proceso para equilibrar la carga si algunas fuentes alcanzan más nodos que otras
+            tamanoBloque = max(1, len(fuentes) // (procesos * 4))
+            bloques = [fuentes[i:i + tamanoBloque] for i in range(0, len(fuentes), tamanoBloque)]
+            puntajes = [0.0] * n
+            from multiprocessing import Pool # Se importa solo cuando se usan varios procesos porque importarlo es lento
+            with ArreglosCompartidos.crear({'offsets': adyacencia.offsets, 'vecinos': adyacencia.vecinos}) as compartidos, \
+                    Pool(procesos, initializer=iniciarTrabajador, initargs=(compartidos.descriptor,)) as pool:
+                for parcial in pool.imap_unordered(_intermediacionParcial, bloques):
+                    puntajes = [a + b for a, b in zip(puntajes, parcial)]
+
+        escala = n / len(fuentes) if fuentes else 1.0
+        if not adyacencia.dirigido:
+            escala /= 2 # En grafos no dirigidos cada camino se cuenta desde ambos extremos
+        if normalizar and n > 2:
+            escala /= (n - 1) * (n - 2) if adyacencia.dirigido else (n - 1) * (n - 2) / 2
+
+        valores = {idNodo: puntaje * escala for idNodo, puntaje in zip(adyacencia.ids, puntajes)}
+        return ResultadoCentralidad(valores, len(fuentes), time.perf_counter() - inicioTiempo, True)
@@ -0,0 +1,259 @@
+'''
+Entrega de grafos y arreglos a procesos trabajadores por memoria compartida (multiprocessing.shared_memory), sin copiarlos a cada proceso.
+
+Al pasar un Grafo o una Adyacencia a un Pool se serializa con pickle para cada proceso, lo que cuesta O(V+E) por proceso y a veces más que el trabajo mismo. Aquí el proceso principal copia los arreglos una sola vez a un bloque de memoria compartida y a los trabajadores solo se les pasa un descriptor pequeño (el nombre del bloque y dónde empieza cada arreglo). Cada trabajador abre el bloque en O(1) y usa los arreglos directamente con memoryview.
+
+    with ArreglosCompartidos.crear({'offsets': adyacencia.offsets, 'vecinos': adyacencia.vecinos}) as compartidos, \
+            Pool(4, initializer=iniciarTrabajador, initargs=(compartidos.descriptor,)) as pool:
+        ...
+
+    def _tarea(...):
+        offsets = arreglosTrabajador()['offsets']
+
+Para un grafo completo se comparte su imagen en el formato binario y cada trabajador la abre con GrafoCompartido, que es un GrafoMapeado sobre el bloque: AlgoritmoBFS y AlgoritmoDFS lo recorren directamente y Adyacencia.obtener devuelve su adyacencia sin copiarla.
+'''
+from .grafo import *
+from .adyacencia import Adyacencia
+from .binario import escribirGrafoBinario
+from .mapeado import GrafoMapeado, PosicionesOrdenadas
+from array import array
+from typing import Dict, Tuple
+import io
+
+ALINEACION = 8 # Cada arreglo empieza en un múltiplo de 8 bytes para poder verlo como enteros o reales
+
+# (nombre del bloque, {arreglo: (inicio, fin, formato)}, datos adicionales)
+Descriptor = Tuple[str, Dict[str, Tuple[int, int, str]], Dict[str, Any]]
+
+# Bloque que abrió iniciarTrabajador en este proceso trabajador, se asigna una única vez al iniciar el proceso
+_compartidosTrabajador: Union['ArreglosCompartidos', None] = None
+_adyacenciaTrabajador: Union['Adyacencia', None] = None
+
+
+def _abrirBloque(nombre: str):
+    from multiprocessing.shared_memory import SharedMemory # Se importa solo cuando se usa porque importar multiprocessing es lento
+    try:
+        return SharedMemory(nombre, track=False) # Python 3.13+: el proceso que abre el bloque no lo registra para eliminarlo al terminar
+    except TypeError:
+        return SharedMemory(nombre)
+
+
+class ArreglosCompartidos:
+    '''
+    ---
+    ArreglosCompartidos
+    ---
+
+    Arreglos con nombre (array, bytes o memoryview) guardados juntos en un bloque de memoria compartida.
+
+    ---
+    ### Atributos:
+
+    - arreglos: diccionario nombre -> memoryview del arreglo dentro del bloque, con el mismo formato que el original ('q', 'd', 'B', ...).
+    - datos: diccionario de valores pequeños que acompañan a los arreglos, por ejemplo si el grafo es dirigido.
+    - descriptor: lo que se pasa a los trabajadores para que abran el bloque, se serializa con pickle en unos pocos bytes.
+
+    ---
+    ### Métodos:
+
+    - crear: metodo estático
+    - abrir: metodo estático
+    - cerrar
+
+    ---
+    Notas:
+    ---
+    - El proceso que crea el bloque es su dueño: al cerrarlo se elimina el bloque, así que debe cerrarlo después de que terminen los trabajadores. Los trabajadores solo lo leen y al cerrarlo únicamente liberan su vista.
+    - Se puede usar con with, que llama a cerrar al salir.
+    '''
+
+    def __init__(self, bloque, secciones: Dict[str, Tuple[int, int, str]], datos: Dict[str, Any], propietario: bool):
+        self._bloque = bloque
+        self._secciones = secciones
+        self._propietario = propietario
+        self.datos = datos
+        self.arreglos: Dict[str, memoryview] = {nombre: bloque.buf[inicio:fin].cast(formato) for nombre, (inicio, fin, formato) in secciones.items()}
+
+    @staticmethod
+    def crear(arreglos: Dict[str, Any], **datos) -> 'ArreglosCompartidos':
+        '''
+        ---
+        Crea un bloque de memoria compartida y copia en él los arreglos, en O(tamaño total) una sola vez.
+
+        ---
+        Args:
+        ---
+        - arreglos: Diccionario nombre -> array, bytes, bytearray o memoryview contiguo.
+        - datos: Valores pequeños que se guardan en el descriptor, deben poder serializarse con pickle.
+        '''
+        from multiprocessing.shared_memory import SharedMemory
+        vistas = {nombre: memoryview(arreglo) for nombre, arreglo in arreglos.items()}
+        secciones = {}
+        posicion = 0
+        for nombre, vista in vistas.items():
+            secciones[nombre] = (posicion, posicion + vista.nbytes, vista.format)
+            posicion += -(-vista.nbytes // ALINEACION) * ALINEACION
+        bloque = SharedMemory(create=True, size=max(posicion, 1)) # No se puede crear un bloque vacío
+        try:
+            for nombre, vista in vistas.items():
+                inicio, fin, _ = secciones[nombre]
+                bloque.buf[inicio:fin] = vista.cast('B')
+        except BaseException:
+            bloque.close()
+            bloque.unlink()
+            raise
+        return ArreglosCompartidos(bloque, secciones, datos, True)
+
+    @staticmethod
+    def abrir(descriptor: Descriptor) -> 'ArreglosCompartidos':
+        '''
+        Abre desde un trabajador el bloque descrito por descriptor, en O(1) sin importar el tamaño de los arreglos.
+        '''
+        from multiprocessing import util
+        nombre, secciones, datos = descriptor
+        compartidos = ArreglosCompartidos(_abrirBloque(nombre), secciones, datos, False)
+        # Si el proceso termina sin cerrarlo, SharedMemory no se puede cerrar mientras existan las vistas y avisa con un error
+        util.Finalize(compartidos, compartidos.cerrar, exitpriority=0)
+        return compartidos
+
+    @property
+    def descriptor(self) -> Descriptor:
+        return (self._bloque.name, self._secciones, self.datos)
+
+    def cerrar(self) -> None:
+        '''
+        Libera las vistas de los arreglos y el bloque. Si este objeto creó el bloque, también lo elimina.
+        '''
+        if self._bloque == None:
+            return
+        for vista in self.arreglos.values():
+            vista.release()
+        self.arreglos = {}
+        self._bloque.close()
+        if self._propietario:
+            self._bloque.unlink()
+        self._bloque = None
+
+    def __enter__(self) -> 'ArreglosCompartidos':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+def compartirAdyacencia(adyacencia: 'Adyacencia') -> 'ArreglosCompartidos':
+    '''
+    Copia la adyacencia a memoria compartida junto con las posiciones ordenadas por identificador, para que verAdyacencia no tenga que construir el diccionario de posiciones en cada trabajador.
+    '''
+    ids = adyacencia.ids
+    orden = array('q', sorted(range(len(ids)), key=ids.__getitem__))
+    return ArreglosCompartidos.crear(
+        {'ids': ids, 'ordenIds': orden, 'offsets': adyacencia.offsets, 'vecinos': adyacencia.vecinos, 'pesos': adyacencia.pesos},
+        dirigido=adyacencia.dirigido,
+        pesosNegativos=adyacencia.tienePesosNegativos()
+    )
+
+
+def verAdyacencia(compartidos: 'ArreglosCompartidos') -> 'Adyacencia':
+    '''
+    Devuelve en O(1) la Adyacencia de los arreglos compartidos con compartirAdyacencia y abiertos con ArreglosCompartidos.abrir. Los arreglos son vistas del bloque y las posiciones se buscan con búsqueda binaria (PosicionesOrdenadas) en lugar de un diccionario. Es válida mientras compartidos siga abierto.
+    '''
+    arreglos = compartidos.arreglos
+    return Adyacencia(arreglos['ids'], arreglos['offsets'], arreglos['vecinos'], arreglos['pesos'], compartidos.datos['dirigido'], PosicionesOrdenadas(arreglos['ids'], arreglos['ordenIds']), compartidos.datos['pesosNegativos'])
+
+
+def iniciarTrabajador(descriptor: Descriptor) -> None:
+    '''
+    Inicializador de los procesos de un Pool: abre el bloque que el proceso principal dejó en memoria compartida, en O(1) sin copiarlo. Las tareas del trabajador lo usan después con arreglosTrabajador o adyacenciaTrabajador.
+    '''
+    global _compartidosTrabajador, _adyacenciaTrabajador
+    _compartidosTrabajador = ArreglosCompartidos.abrir(descriptor)
+    _adyacenciaTrabajador = None
+
+
+def arreglosTrabajador() -> Dict[str, memoryview]:
+    '''
+    Devuelve los arreglos del bloque abierto con iniciarTrabajador en este proceso.
+    '''
+    return _compartidosTrabajador.arreglos
+
+
+def adyacenciaTrabajador() -> 'Adyacencia':
+    '''
+    Devuelve la Adyacencia del bloque abierto con iniciarTrabajador, que debe venir de compartirAdyacencia. Se crea con verAdyacencia la primera vez y se reutiliza en las demás tareas del proceso.
+    '''
+    global _adyacenciaTrabajador
+    if _adyacenciaTrabajador == None:
+        _adyacenciaTrabajador = verAdyacencia(_compartidosTrabajador)
+    return _adyacenciaTrabajador
+
+
+def compartirGrafo(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'GrafoMapeado']) -> 'ArreglosCompartidos':
+    '''
+    ---
+    Copia el grafo a memoria compartida en el formato binario con su adyacencia, para abrirlo en los trabajadores con GrafoCompartido.
+
+    ---
+    Notas:
+    ---
+    - Un GrafoMapeado ya tiene su imagen binaria, se copia tal cual. Los demás se escriben primero en memoria con escribirGrafoBinario, así que mientras se copian ocupan el doble.
+    '''
+    if isinstance(grafo, GrafoMapeado):
+        return ArreglosCompartidos.crear({'grafo': grafo._datos})
+    imagen = io.BytesIO()
+    escribirGrafoBinario(grafo, imagen)
+    datos = imagen.getbuffer()
+    try:
+        return ArreglosCompartidos.crear({'grafo': datos})
+    finally:
+        datos.release()
+
+
+class GrafoCompartido(GrafoMapeado):
+    '''
+    ---
+    GrafoCompartido
+    ---
+
+    Vista de solo lectura, desde un trabajador, de un grafo compartido con compartirGrafo. Tiene los mismos métodos que GrafoMapeado y también se abre en O(1): los nodos se buscan con búsqueda binaria y sus vecinos se leen del bloque al consultarlos.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    # En el proceso principal
+    compartidos = compartirGrafo(grafo)
+    pool = Pool(4, initializer=_iniciarTrabajador, initargs=(compartidos.descriptor,))
+
+    # En cada trabajador
+    def _iniciarTrabajador(descriptor):
+        global _grafo
+        _grafo = GrafoCompartido(descriptor)
+
+    def _recorrer(nodoInicio):
+        return AlgoritmoBFS.obtenerRecorridoEnOrden(_grafo, nodoInicio)
+    ```
+    '''
+
+    def __init__(self, descriptor: Descriptor):
+        from multiprocessing import util
+        self._compartidos = ArreglosCompartidos.abrir(descriptor)
+        try:
+            self._abrirDatos(self._compartidos.arreglos['grafo'])
+        except Exception:
+            self.cerrar()
+            raise
+        util.Finalize(self, self.cerrar, exitpriority=1) # Las vistas de las secciones se liberan antes que el bloque
+
+    def obtenerAdyacencia(self) -> 'Adyacencia':
+        '''
+        Devuelve la Adyacencia con vistas del bloque en lugar de copias, válida hasta cerrar el grafo.
+        '''
+        return Adyacencia(self._ids, self._offsetsVecinos, self._vecinos, self._pesosVecinos, self._dirigido, self._posiciones)
+
+    def cerrar(self) -> None:
+        '''
+        Libera las vistas y el bloque de este proceso. El bloque sigue existiendo hasta que lo cierre el proceso que lo creó.
+        '''
+        self._liberarVistas()
+        self._compartidos.cerrar()
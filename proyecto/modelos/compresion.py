@@ -0,0 +1,54 @@
+from typing import BinaryIO, Tuple
+import bz2
+import gzip
+import lzma
+
+# Extensiones de compresión y la función que abre un archivo comprimido con cada una, todas de la librería estándar.
+# Los niveles de gzip y xz son menores que los que usan por defecto: comprimen casi lo mismo en mucho menos tiempo (ver proyecto.bench.compresion)
+COMPRESORES = {
+    '.gz': lambda archivo, modo: gzip.GzipFile(fileobj=archivo, mode=modo, compresslevel=6),
+    '.bz2': lambda archivo, modo: bz2.BZ2File(archivo, modo),
+    '.xz': lambda archivo, modo: lzma.LZMAFile(archivo, modo, preset=1 if 'w' in modo else None),
+}
+
+
+def separarCompresion(nombreArchivo: str) -> Tuple[str, str]:
+    '''
+    Separa la extensión de compresión del nombre de un archivo. Si el archivo no está comprimido la extensión devuelta es una cadena vacía.
+
+    >>> separarCompresion('grafo1.json.gz')
+    ('grafo1.json', '.gz')
+    >>> separarCompresion('grafo1.json')
+    ('grafo1.json', '')
+    '''
+    for extension in COMPRESORES:
+        if nombreArchivo.endswith(extension):
+            return nombreArchivo[:-len(extension)], extension
+    return nombreArchivo, ''
+
+
+def comprimir(archivo: BinaryIO, compresion: str, modo: str) -> BinaryIO:
+    '''
+    ---
+    Envuelve un archivo binario ya abierto para comprimir lo que se escribe o descomprimir lo que se lee.
+
+    ---
+    Args:
+    ---
+    - archivo: Archivo abierto en modo 'rb' o 'wb'.
+    - compresion: Extensión de compresión ('.gz', '.bz2', '.xz') o cadena vacía para no comprimir.
+    - modo: 'rb' o 'wb', igual que el archivo.
+
+    ---
+    Returns:
+    ---
+    - BinaryIO: Un archivo binario que comprime o descomprime a medida que se escribe o se lee, sin tener todo el contenido en memoria. Si no hay compresión devuelve el mismo archivo.
+
+    ---
+    Notas:
+    ---
+    - Cerrar el archivo devuelto no cierra el archivo original, hay que cerrar ambos.
+    '''
+    if compresion == '':
+        return archivo
+    return COMPRESORES[compresion](archivo, modo)
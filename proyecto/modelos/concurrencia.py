@@ -0,0 +1,215 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from .diario import aplicarCambio
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+class CerrojoLectoresEscritor:
+    '''
+    ---
+    CerrojoLectoresEscritor
+    ---
+
+    Cerrojo que permite varios lectores al mismo tiempo o un único escritor.
+
+    ---
+    Descripción:
+    ---
+    Da preferencia a los escritores: cuando un escritor está esperando, los lectores nuevos esperan a que termine, así un flujo continuo de lecturas no deja esperando a las ediciones para siempre.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    cerrojo = CerrojoLectoresEscritor()
+    with cerrojo.lectura():
+        ... # Varios hilos pueden estar aquí al mismo tiempo
+    with cerrojo.escritura():
+        ... # Solo un hilo, sin lectores
+    ```
+
+    ---
+    Notas:
+    ---
+    - No es reentrante: un hilo que ya tiene la lectura o la escritura no debe volver a pedirla, porque si hay un escritor esperando se bloquearía para siempre.
+    '''
+
+    def __init__(self):
+        self._condicion = Condition(Lock())
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritoresEsperando = 0
+
+    def adquirirLectura(self) -> None:
+        with self._condicion:
+            while self._escribiendo or self._escritoresEsperando:
+                self._condicion.wait()
+            self._lectores += 1
+
+    def liberarLectura(self) -> None:
+        with self._condicion:
+            self._lectores -= 1
+            if self._lectores == 0:
+                self._condicion.notify_all()
+
+    def adquirirEscritura(self) -> None:
+        with self._condicion:
+            self._escritoresEsperando += 1
+            while self._escribiendo or self._lectores:
+                self._condicion.wait()
+            self._escritoresEsperando -= 1
+            self._escribiendo = True
+
+    def liberarEscritura(self) -> None:
+        with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+
+    @contextmanager
+    def lectura(self) -> Iterator[None]:
+        self.adquirirLectura()
+        try:
+            yield
+        finally:
+            self.liberarLectura()
+
+    @contextmanager
+    def escritura(self) -> Iterator[None]:
+        self.adquirirEscritura()
+        try:
+            yield
+        finally:
+            self.liberarEscritura()
+
+
+class GrafoConcurrente:
+    '''
+    ---
+    GrafoConcurrente
+    ---
+
+    Envoltorio opcional que permite usar un grafo desde varios hilos. Las lecturas (recorridos, listados, exportaciones) se hacen al mismo tiempo y cada edición, o grupo de ediciones, se hace sola, así ningún hilo ve una arista agregada a medias.
+
+    ---
+    ### Métodos:
+
+    - lectura
+    - escritura
+    - leer
+    - editar
+    - aplicarCambios
+    - agregarNodo
+    - agregarArista
+    - eliminarNodo
+    - eliminarArista
+    - obtenerAdyacencia
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    grafo = GrafoConcurrente(GrafoDirigido())
+
+    # Una edición
+    grafo.agregarNodo(Nodo(1, 'A'))
+
+    # Varias ediciones que los lectores ven juntas o no ven
+    with grafo.escritura() as g:
+        g.agregarNodo(Nodo(2, 'B'))
+        g.agregarArista(1, 2)
+
+    # Lecturas desde cualquier hilo
+    recorrido = grafo.leer(AlgoritmoBFS.obtenerRecorridoEnOrden, 1)
+    distancias = AlgoritmoDijkstra.calcularDistancias(grafo, 1) # Usa obtenerAdyacencia
+    ```
+
+    ---
+    Notas:
+    ---
+    - El grafo envuelto solo se debe usar dentro de lectura, escritura, leer o editar. Los nodos obtenidos dentro de una lectura no se deben consultar después de que termina.
+    - Dentro de un bloque de lectura o escritura se usa el grafo que entrega el bloque, no los métodos de este envoltorio, porque el cerrojo no es reentrante.
+    '''
+
+    def __init__(self, grafo: Union['GrafoDirigido', 'GrafoNoDirigido']):
+        self.grafo = grafo
+        self.cerrojo = CerrojoLectoresEscritor()
+        self._adyacencia: Union['Adyacencia', None] = None # Se construye con la primera lectura que la pide y se descarta al editar
+
+    @contextmanager
+    def lectura(self) -> Iterator[Union['GrafoDirigido', 'GrafoNoDirigido']]:
+        with self.cerrojo.lectura():
+            yield self.grafo
+
+    @contextmanager
+    def escritura(self) -> Iterator[Union['GrafoDirigido', 'GrafoNoDirigido']]:
+        with self.cerrojo.escritura():
+            self._adyacencia = None
+            try:
+                yield self.grafo
+            finally:
+                self._adyacencia = None # También si la edición falló a la mitad
+
+    def leer(self, funcion: Callable[..., T], *args, **kwargs) -> T:
+        '''
+        Ejecuta funcion(grafo, *args, **kwargs) con el cerrojo de lectura y devuelve su resultado. Sirve para cualquier algoritmo que recibe el grafo como primer argumento.
+        '''
+        with self.lectura() as grafo:
+            return funcion(grafo, *args, **kwargs)
+
+    def editar(self, funcion: Callable[..., T], *args, **kwargs) -> T:
+        '''
+        Ejecuta funcion(grafo, *args, **kwargs) con el cerrojo de escritura y devuelve su resultado. Todas las ediciones que hace la función se ven juntas.
+        '''
+        with self.escritura() as grafo:
+            return funcion(grafo, *args, **kwargs)
+
+    def aplicarCambios(self, cambios: Iterable[tuple]) -> int:
+        '''
+        Aplica de una sola vez una lista de cambios con el formato de Grafo.extraerCambios (('+n', idNodo, contenido), ('+a', idArista, a, b, peso), ('-n', idNodo), ('-a', idArista)).
+
+        Returns:
+            - int: Cantidad de cambios aplicados.
+        '''
+        with self.escritura() as grafo:
+            cantidad = 0
+            for cambio in cambios:
+                aplicarCambio(grafo, cambio)
+                cantidad += 1
+            return cantidad
+
+    def agregarNodo(self, nodo: 'Nodo') -> int:
+        '''
+        Agrega el nodo y devuelve su identificador, que puede cambiar si ya existía otro nodo con el mismo.
+        '''
+        with self.escritura() as grafo:
+            grafo.agregarNodo(nodo)
+            return nodo.identificador
+
+    def agregarArista(self, *args, **kwargs):
+        with self.escritura() as grafo:
+            return grafo.agregarArista(*args, **kwargs)
+
+    def eliminarNodo(self, idNodo: int):
+        with self.escritura() as grafo:
+            return grafo.eliminarNodo(idNodo)
+
+    def eliminarArista(self, *args, **kwargs):
+        with self.escritura() as grafo:
+            return grafo.eliminarArista(*args, **kwargs)
+
+    def esDirigido(self) -> bool:
+        return self.grafo.esDirigido()
+
+    def obtenerAdyacencia(self) -> 'Adyacencia':
+        '''
+        Devuelve la Adyacencia del grafo construida con el cerrojo de lectura. Se guarda hasta la siguiente edición, así los algoritmos que usan Adyacencia.obtener (Dijkstra, centralidades, triángulos) reciben directamente este envoltorio y no reconstruyen la adyacencia en cada consulta. La adyacencia no cambia con las ediciones posteriores.
+        '''
+        with self.cerrojo.lectura():
+            adyacencia = self._adyacencia
+            if adyacencia == None:
+                adyacencia = self._adyacencia = Adyacencia.desdeGrafo(self.grafo)
+            return adyacencia
@@ -1,5 +1,7 @@
-from typing import Union, List
+from typing import Any, Callable, Union, List, Tuple
 from .grafo import *
+from .adyacencia import Adyacencia
+from array import array
 
 
 class AlgoritmoDFS:
@@ -16,10 +18,11 @@ class AlgoritmoDFS:
     - obtenerRecorridoEnOrden
     - encontrarRuta
     - generarArbolDFS
+    - calcularArbolPorPosicion
     '''
 
     @staticmethod
-    def obtenerRecorridoEnOrden(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int) -> List[int]:
+    def obtenerRecorridoEnOrden(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> List[int]:
         '''
         ---
         Obtiene el recorrido en orden utilizando el algoritmo de Búsqueda en Profundidad (DFS).
@@ -29,6 +32,7 @@ class AlgoritmoDFS:
         ---
         - grafo (Grafo): El grafo sobre el cual se realizará la búsqueda.
         - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la pila, recorrido hasta el momento) cada vez que se visita un nodo. Puede lanzar una excepción para detener el recorrido (ver Tarea).
 
         ---
         Returns:
@@ -40,7 +44,7 @@ class AlgoritmoDFS:
         ---
         Este método implementa el algoritmo DFS para recorrer el grafo desde un nodo de inicio.
         Comienza la búsqueda desde el nodo especificado y visita todos los nodos en orden de profundidad. Retorna una lista con los identificadores de nodos en el orden en que
-        fueron visitados.
+        fueron visitados. Usa una pila explícita en lugar de recursión, así que no tiene límite de profundidad.
 
         ---
         Ejemplo de uso:
@@ -58,27 +62,31 @@ class AlgoritmoDFS:
         ---
         - Si el nodo de inicio no existe en el grafo, la lista devuelta estará vacía.
         '''
-        def dfsRecursivo(nodo: int, recorrido: List[int], nodosVisitados: List[int]) -> None:
-            try:
-                recorrido.append(nodo)
-                nodosVisitados.append(nodo)
-
-                for vecino in grafo.obtenerNodoPorId(nodo).vecinos:
-                    if not vecino.identificador in nodosVisitados:
-                        dfsRecursivo(vecino.identificador, recorrido, nodosVisitados)
-            except Exception as e:
-                recorrido = []
-            recorrido = []
-
         recorrido = []
-        nodosVisitados = []
-        # Se verifica si el nodo existe en el grafo para iniciar la funcion recursiva
-        if grafo._nodosExisten([nodoInicio]):
-            dfsRecursivo(nodoInicio, recorrido, nodosVisitados)
+        # Se verifica si el nodo existe en el grafo para iniciar el recorrido
+        if not grafo._nodosExisten([nodoInicio]):
+            return recorrido
+        recorrido.append(nodoInicio)
+        nodosVisitados = {nodoInicio}
+        # Cada elemento de la pila son los vecinos que faltan revisar de un nodo del camino actual
+        pila = [iter(grafo.obtenerNodoPorId(nodoInicio).vecinos)]
+        if progreso != None:
+            progreso(len(recorrido), len(pila), recorrido)
+        while pila:
+            for vecino in pila[-1]:
+                if not vecino.identificador in nodosVisitados:
+                    recorrido.append(vecino.identificador)
+                    nodosVisitados.add(vecino.identificador)
+                    pila.append(iter(grafo.obtenerNodoPorId(vecino.identificador).vecinos))
+                    if progreso != None:
+                        progreso(len(recorrido), len(pila), recorrido)
+                    break
+            else:
+                pila.pop() # Ya se revisaron todos los vecinos del nodo
         return recorrido
 
     @staticmethod
-    def encontrarRuta(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int, nodoFin: int) -> List[int]:
+    def encontrarRuta(grafo: Union['GrafoDirigido','GrafoNoDirigido'], nodoInicio: int, nodoFin: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> List[int]:
         '''
         ---
         Encuentra una ruta entre dos nodos utilizando el algoritmo de Búsqueda en Profundidad (DFS).
@@ -89,6 +97,7 @@ class AlgoritmoDFS:
         - grafo (Grafo): El grafo sobre el cual se realizará la búsqueda.
         - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
         - nodoFin (int): El identificador del nodo al cual se desea llegar.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la pila, ruta que se está explorando) cada vez que se visita un nodo. Puede lanzar una excepción para detener la búsqueda (ver Tarea).
 
         ---
         Returns:
@@ -117,44 +126,43 @@ class AlgoritmoDFS:
         - Si alguno de los nodos no existe en el grafo, la función devuelve una lista vacía.
         - Si el nodo de inicio y el nodo de destino son el mismo, la ruta más corta será una lista que contiene únicamente ese nodo.
         '''
-        def rutaDfsRecursiva(nodo: int, ruta: List[int], nodosVisitados: List[int]) -> None:
-            try:
-                ruta.append(nodo)
-                nodosVisitados.append(nodo)
-
-                # se obtienen los vecinos del nodo
-                for vecino in grafo.obtenerNodoPorId(nodo).vecinos:
-                    # Verificar si el vecino ya ha sido visitado, si no ha sido visitado entonces se le visita
-                    if not vecino.identificador in nodosVisitados:
-                        rutaDfsRecursiva(vecino.identificador, ruta, nodosVisitados)
-                        if ruta[-1] == nodoFin:
-                            # Si ya se encontró el nodo fin, entonces ya no es necesario buscar en los otros vecinos y solo regresa.
-                            break 
-                
-                if ruta[-1] != nodoFin:
-                    # Si el nodo visitado no es el nodoFin que se busca, entonces se elimina
-                    ruta.pop(-1)
-
-            except Exception as e:
-                ruta = []
-            ruta = []
-
         ruta = []
-        nodosVisitados = []
-        # Se verifica si el nodo existe en el grafo para iniciar la funcion recursiva
-        if grafo._nodosExisten([nodoInicio]):
-            rutaDfsRecursiva(nodoInicio, ruta, nodosVisitados)
+        # Se verifica si el nodo existe en el grafo para iniciar la búsqueda
+        if not grafo._nodosExisten([nodoInicio]):
+            return ruta
+        ruta.append(nodoInicio)
+        if nodoInicio == nodoFin:
+            return ruta
+        nodosVisitados = {nodoInicio}
+        # La pila tiene los vecinos que faltan revisar de cada nodo de la ruta, ruta[i] corresponde a pila[i]
+        pila = [iter(grafo.obtenerNodoPorId(nodoInicio).vecinos)]
+        while pila:
+            for vecino in pila[-1]:
+                # Verificar si el vecino ya ha sido visitado, si no ha sido visitado entonces se le visita
+                if not vecino.identificador in nodosVisitados:
+                    ruta.append(vecino.identificador)
+                    if vecino.identificador == nodoFin:
+                        return ruta
+                    nodosVisitados.add(vecino.identificador)
+                    pila.append(iter(grafo.obtenerNodoPorId(vecino.identificador).vecinos))
+                    if progreso != None:
+                        progreso(len(nodosVisitados), len(pila), ruta)
+                    break
+            else:
+                # Desde este nodo no se llega al nodoFin, entonces se elimina de la ruta
+                pila.pop()
+                ruta.pop()
         return ruta
 
     @staticmethod
     @overload
-    def generarArbolDFS(grafo: 'GrafoDirigido', raiz: int) -> 'GrafoDirigido': ...
+    def generarArbolDFS(grafo: 'GrafoDirigido', raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> 'GrafoDirigido': ...
     @staticmethod
     @overload
-    def generarArbolDFS(grafo: 'GrafoNoDirigido', raiz: int) -> 'GrafoNoDirigido': ...
+    def generarArbolDFS(grafo: 'GrafoNoDirigido', raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> 'GrafoNoDirigido': ...
 
     @staticmethod
-    def generarArbolDFS(grafo: Union['GrafoDirigido','GrafoNoDirigido'], raiz: int) -> Union['GrafoDirigido', 'GrafoNoDirigido',None]:
+    def generarArbolDFS(grafo: Union['GrafoDirigido','GrafoNoDirigido'], raiz: int, progreso: Union[Callable[[int, int, Any], None], None] = None) -> Union['GrafoDirigido', 'GrafoNoDirigido',None]:
         '''
         ---
         Genera un árbol DFS a partir de un grafo y una raíz.
@@ -164,6 +172,7 @@ class AlgoritmoDFS:
         ---
         - grafo (Grafo): El grafo sobre el cual se construirá el árbol DFS.
         - raiz (int): El identificador del nodo raíz.
+        - progreso (función, opcional): Se llama con (nodos visitados, tamaño de la pila, árbol construido hasta el momento) cada vez que se visita un nodo. Puede lanzar una excepción para detener la generación (ver Tarea).
 
         ---
         Returns:
@@ -192,37 +201,73 @@ class AlgoritmoDFS:
         - El tipo de grafo retornado (GrafoDirigido o GrafoNoDirigido) dependerá del tipo del grafo original.
         - Los nodos en el árbol solo contienen el identificador y el contenido del nodo original.
         '''
-        def dfsArbolRecursivo(arbol: Union['GrafoDirigido', 'GrafoNoDirigido'], nodo: int, nodosVisitados: List[int]) -> None:
-            try:
-                nodosVisitados.append(nodo)
-                # Se copia el nodo en el arbol si todavía no existe en este pero se copia sin los vecinos, es decir únicamente el identificador y su contenido
-                if arbol._buscarNodo(nodo) == -1: 
-                    n = grafo.obtenerNodoPorId(nodo)
-                    arbol.agregarNodo(Nodo(n.identificador,n.contenido))
-
-                for vecino in grafo.obtenerNodoPorId(nodo).vecinos:
-                    if not vecino.identificador in nodosVisitados:
-                        # Si el arbol no tiene creado al vecino, entonces se crea este dentro del arbol.
-                        if arbol._buscarNodo(vecino.identificador) == -1: 
-                            v = grafo.obtenerNodoPorId(vecino.identificador)
-                            arbol.agregarNodo(Nodo(v.identificador,v.contenido))
-                        arbol.agregarArista(nodo, vecino.identificador)
-                        # Se procede a buscar recursivamente en el vecino
-                        dfsArbolRecursivo(arbol, vecino.identificador, nodosVisitados)
-                            
-                        
-            except Exception as e:
-                return None 
-            return None 
-
-        nodosVisitados = []
         if grafo.esDirigido():
             arbol = GrafoDirigido()
         else:
             arbol = GrafoNoDirigido()
-        # Se verifica si la raiz existe en el grafo para iniciar la funcion recursiva
-        if grafo._nodosExisten([raiz]):
-            dfsArbolRecursivo(arbol, raiz, nodosVisitados)
-            return arbol 
-        else:
+        # Se verifica si la raiz existe en el grafo para iniciar la búsqueda
+        if not grafo._nodosExisten([raiz]):
             return None
+        # Se copia el nodo en el arbol sin los vecinos, es decir únicamente el identificador y su contenido
+        n = grafo.obtenerNodoPorId(raiz)
+        arbol.agregarNodo(Nodo(n.identificador,n.contenido))
+        nodosVisitados = {raiz}
+        # Cada elemento de la pila es un nodo del camino actual junto con los vecinos que le faltan revisar
+        pila = [(raiz, iter(n.vecinos))]
+        if progreso != None:
+            progreso(len(nodosVisitados), len(pila), arbol)
+        while pila:
+            nodo, vecinos = pila[-1]
+            for vecino in vecinos:
+                if not vecino.identificador in nodosVisitados:
+                    nodosVisitados.add(vecino.identificador)
+                    # Si el arbol no tiene creado al vecino, entonces se crea este dentro del arbol.
+                    v = grafo.obtenerNodoPorId(vecino.identificador)
+                    if arbol._buscarNodo(vecino.identificador) == -1: 
+                        arbol.agregarNodo(Nodo(v.identificador,v.contenido))
+                    arbol.agregarArista(nodo, vecino.identificador)
+                    # Se continúa la búsqueda desde el vecino
+                    pila.append((vecino.identificador, iter(v.vecinos)))
+                    if progreso != None:
+                        progreso(len(nodosVisitados), len(pila), arbol)
+                    break
+            else:
+                pila.pop()
+        return arbol
+
+    @staticmethod
+    def calcularArbolPorPosicion(adyacencia: 'Adyacencia', inicio: int) -> Tuple[List[int], 'array']:
+        '''
+        ---
+        Recorrido DFS en O(V+E) sobre una Adyacencia, con una pila explícita en lugar de recursión, que guarda el padre de cada posición.
+
+        ---
+        Descripción:
+        ---
+        Los vecinos se visitan en el mismo orden que en obtenerRecorridoEnOrden, así que la ruta desde el inicio hasta cualquier posición siguiendo los padres es la misma que devuelve encontrarRuta, y un solo recorrido responde todas las rutas que salen del mismo nodo.
+
+        ---
+        Returns:
+        ---
+        - (orden, padres): orden son las posiciones en el orden en que se visitaron y padres[i] es la posición desde la que se llegó a i, -1 para el inicio y -2 si i no es alcanzable.
+        '''
+        offsets = adyacencia.offsets
+        vecinos = adyacencia.vecinos
+        padres = array('q', [-2]) * len(adyacencia.ids)
+        padres[inicio] = -1
+        orden = [inicio]
+        pila = [(inicio, offsets[inicio])] # (posicion, siguiente vecino por revisar)
+        while pila:
+            u, k = pila[-1]
+            fin = offsets[u + 1]
+            while k < fin and padres[vecinos[k]] != -2:
+                k += 1
+            if k == fin:
+                pila.pop()
+                continue
+            v = vecinos[k]
+            pila[-1] = (u, k + 1)
+            padres[v] = u
+            orden.append(v)
+            pila.append((v, offsets[v]))
+        return orden, padres
@@ -0,0 +1,184 @@
+from .grafo import *
+from threading import Lock, Thread
+from typing import Callable, Dict, Iterator, List
+import json
+import os
+
+EXTENSION_DIARIO = '.diario'
+EXTENSION_COMPACTANDO = '.compactando' # Se agrega al diario mientras se está incorporando al archivo base
+UMBRAL_COMPACTACION = 64 * 1024 # Bytes del diario a partir de los cuales conviene incorporarlo al archivo base
+
+
+def aplicarCambio(grafo: Union['GrafoDirigido', 'GrafoNoDirigido'], cambio: List) -> None:
+    '''
+    Aplica al grafo un cambio registrado por Grafo.extraerCambios. Aplicar un cambio que el grafo ya tiene no lo modifica, así un mismo diario se puede aplicar más de una vez sobre el mismo archivo base sin duplicar nodos ni aristas.
+    '''
+    tipo = cambio[0]
+    if tipo == '+n':
+        if grafo._buscarNodo(cambio[1]) == -1:
+            grafo.agregarNodo(Nodo(cambio[1], cambio[2]))
+    elif tipo == '+a':
+        if grafo._buscarArista(cambio[1]) == -1:
+            grafo.agregarArista(cambio[2], cambio[3], idArista=cambio[1], peso=cambio[4])
+    elif tipo == '-n':
+        grafo.eliminarNodo(cambio[1])
+    elif tipo == '-a':
+        grafo.eliminarArista(cambio[1])
+
+
+class DiarioEdicion:
+    '''
+    ---
+    DiarioEdicion
+    ---
+
+    Diario de solo agregado con los cambios de un grafo guardado. En lugar de volver a escribir todo el grafo cada vez que se guarda, los cambios registrados con Grafo.iniciarRegistroCambios se agregan como una línea JSON por cambio en el archivo <nombre>.diario, por lo que guardar cuesta O(cambios).
+
+    Al abrir el grafo se lee el archivo base y se le aplican los cambios del diario. Cuando el diario supera UMBRAL_COMPACTACION bytes se incorpora al archivo base en un hilo en segundo plano:
+
+    1. El diario se renombra a <nombre>.diario.compactando, los siguientes cambios se escriben en un diario nuevo.
+    2. El hilo lee el archivo base, le aplica el diario renombrado y escribe el resultado en un archivo temporal.
+    3. El archivo temporal reemplaza al base con os.replace y se borra el diario renombrado.
+
+    Si el programa se detiene en cualquier punto el grafo sigue siendo el mismo: el archivo base se reemplaza de forma atómica y los cambios se pueden aplicar de nuevo sin efecto porque aplicarCambio ignora los que ya están en el grafo.
+
+    ---
+    ### Métodos:
+
+    - hayCambios
+    - registrar
+    - aplicar
+    - compactar
+    - esperar
+    - eliminar
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    diario = DiarioEdicion('datos_grafos/grafo1')
+    diario.aplicar(grafo)
+    grafo.iniciarRegistroCambios()
+    grafo.agregarNodo(Nodo(10, 'nuevo'))
+    if diario.registrar(grafo.extraerCambios()) > UMBRAL_COMPACTACION:
+        diario.compactar('datos_grafos/grafo1.json', leer, escribir)
+    ```
+    '''
+
+    # Hilos de compactación en curso, por diario, compartidos entre todas las instancias
+    _compactaciones: Dict[str, 'Thread'] = {}
+    _cerrojo = Lock()
+
+    def __init__(self, ruta: str):
+        '''
+        Args:
+            - ruta: Ruta del grafo sin extensión, el diario se guarda en ruta + EXTENSION_DIARIO.
+        '''
+        self.ruta = ruta + EXTENSION_DIARIO
+        self.rutaCompactando = self.ruta + EXTENSION_COMPACTANDO
+
+    def hayCambios(self) -> bool:
+        '''
+        Indica si hay cambios en el diario que todavía no están en el archivo base.
+        '''
+        return any(os.path.exists(r) and os.path.getsize(r) > 0 for r in (self.rutaCompactando, self.ruta))
+
+    def registrar(self, cambios: List[tuple]) -> int:
+        '''
+        Agrega los cambios al final del diario.
+
+        Returns:
+            - int: El tamaño del diario en bytes después de agregar los cambios.
+        '''
+        if not cambios:
+            return os.path.getsize(self.ruta) if os.path.exists(self.ruta) else 0
+        with open(self.ruta, 'a', encoding='utf-8') as archivo:
+            archivo.write(''.join(json.dumps(cambio, separators=(',', ':')) + '\n' for cambio in cambios))
+            return archivo.tell()
+
+    @staticmethod
+    def _leerCambios(ruta: str) -> Iterator[List]:
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            for linea in archivo:
+                try:
+                    yield json.loads(linea)
+                except json.JSONDecodeError:
+                    return # Última línea incompleta si el programa se detuvo mientras se escribía
+
+    def aplicar(self, grafo: Union['GrafoDirigido', 'GrafoNoDirigido']) -> int:
+        '''
+        Aplica al grafo los cambios del diario que se está compactando y luego los del diario actual.
+
+        Returns:
+            - int: Cantidad de cambios leídos.
+        '''
+        cantidad = 0
+        for ruta in (self.rutaCompactando, self.ruta):
+            for cambio in DiarioEdicion._leerCambios(ruta):
+                aplicarCambio(grafo, cambio)
+                cantidad += 1
+        return cantidad
+
+    def compactar(self, rutaBase: str, leer: Callable[[str], 'Grafo'], escribir: Callable[['Grafo', str], None], esperar: bool = False) -> bool:
+        '''
+        ---
+        Incorpora el diario al archivo base en un hilo en segundo plano.
+
+        ---
+        Args:
+        ---
+        - rutaBase: Ruta del archivo base del grafo.
+        - leer: Función que lee un grafo desde una ruta.
+        - escribir: Función que escribe un grafo completo en una ruta.
+        - esperar: Si es True espera a que termine la compactación.
+
+        ---
+        Returns:
+        ---
+        - bool: False si ya había una compactación en curso para este diario y no se inició otra.
+        '''
+        with DiarioEdicion._cerrojo:
+            hilo = DiarioEdicion._compactaciones.get(self.ruta)
+            if hilo != None and hilo.is_alive():
+                if esperar:
+                    hilo.join()
+                return False
+            # Si quedó un diario compactando de una ejecución anterior se incorpora primero ese y el actual queda para la próxima vez
+            if not os.path.exists(self.rutaCompactando) and os.path.exists(self.ruta):
+                os.replace(self.ruta, self.rutaCompactando)
+
+            def compactarDiario():
+                grafo = leer(rutaBase)
+                for cambio in DiarioEdicion._leerCambios(self.rutaCompactando):
+                    aplicarCambio(grafo, cambio)
+                rutaTemporal = rutaBase + '.tmp'
+                escribir(grafo, rutaTemporal)
+                os.replace(rutaTemporal, rutaBase)
+                os.remove(self.rutaCompactando)
+
+            hilo = Thread(target=compactarDiario, daemon=False)
+            DiarioEdicion._compactaciones[self.ruta] = hilo
+            hilo.start()
+        if esperar:
+            hilo.join()
+        return True
+
+    def esperar(self) -> None:
+        '''
+        Espera a que termine la compactación en curso de este diario, si la hay.
+        '''
+        with DiarioEdicion._cerrojo:
+            hilo = DiarioEdicion._compactaciones.pop(self.ruta, None)
+        if hilo != None:
+            hilo.join()
+
+    def eliminar(self) -> None:
+        '''
+        Espera la compactación en curso y borra el diario. Se usa cuando el archivo base se reemplaza por el grafo completo o cuando se elimina el grafo.
+        '''
+        self.esperar()
+        for ruta in (self.rutaCompactando, self.ruta):
+            if os.path.exists(ruta):
+                os.remove(ruta)
@@ -0,0 +1,71 @@
+from .grafo import *
+from typing import Iterable, TextIO
+import json
+from json.encoder import encode_basestring_ascii as codificarTexto
+
+SANGRIA = ' ' * 8 # Sangría de los elementos de las listas "nodos" y "aristas" con indent=4
+
+
+def _formatearValor(valor: Any) -> str:
+    '''
+    Convierte un valor a JSON igual que json.dumps. Los enteros, reales y textos se convierten directamente, que es lo más común en nodos y aristas, y solo las listas y diccionarios no vacíos se convierten con indent.
+    '''
+    tipo = type(valor)
+    if tipo is int:
+        return int.__repr__(valor)
+    if tipo is str:
+        return codificarTexto(valor)
+    if tipo is float and valor - valor == 0: # Descarta inf y nan, que json escribe como Infinity y NaN
+        return float.__repr__(valor)
+    if isinstance(valor, (list, dict)) and valor:
+        return json.dumps(valor, indent=4).replace('\n', '\n' + SANGRIA + '    ')
+    return json.dumps(valor)
+
+
+def _formatearElemento(elemento: Dict[str, Any]) -> str:
+    '''
+    Devuelve el texto de un nodo o arista como lo escribe json.dump con indent=4 dentro de la lista.
+    '''
+    lineas = [f'{SANGRIA}    {codificarTexto(clave)}: {_formatearValor(valor)}' for clave, valor in elemento.items()]
+    return SANGRIA + '{\n' + ',\n'.join(lineas) + '\n' + SANGRIA + '}'
+
+
+def _escribirLista(archivo: TextIO, elementos: Iterable[Dict[str, Any]]) -> None:
+    primero = True
+    for elemento in elementos:
+        archivo.write('[\n' if primero else ',\n')
+        archivo.write(_formatearElemento(elemento))
+        primero = False
+    archivo.write('[]' if primero else '\n    ]')
+
+
+def escribirGrafoJson(grafo: Union['GrafoDirigido', 'GrafoNoDirigido'], archivo: TextIO) -> None:
+    '''
+    ---
+    Escribe el grafo en JSON en un archivo de texto, un nodo y una arista a la vez.
+
+    ---
+    Descripción:
+    ---
+    El texto es exactamente el mismo que produce json.dump(grafo.to_dict(), archivo, indent=4), pero no se construye el diccionario del grafo completo ni el texto completo en memoria: cada nodo y cada arista se convierte y se escribe por separado. Así el archivo se puede escribir directamente a través de un compresor.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    with open('grafo1.json', 'w', encoding='utf-8') as archivo:
+        escribirGrafoJson(grafo, archivo)
+    ```
+    '''
+    escribirElementosJson(archivo, grafo.esDirigido(), grafo.nodos, grafo.aristas)
+
+
+def escribirElementosJson(archivo: TextIO, dirigido: bool, nodos: Iterable['Nodo'], aristas: Iterable['Arista']) -> None:
+    '''
+    Igual que escribirGrafoJson pero a partir de los nodos y aristas sueltos, que pueden venir de generadores: cada uno se escribe apenas se recibe, sin construir el grafo.
+    '''
+    archivo.write('{\n    "dirigido": ' + json.dumps(dirigido) + ',\n    "nodos": ')
+    _escribirLista(archivo, (nodo.to_dict() for nodo in nodos))
+    archivo.write(',\n    "aristas": ')
+    _escribirLista(archivo, (arista.to_dict() for arista in aristas))
+    archivo.write('\n}')
@@ -0,0 +1,152 @@
+'''
+Escritores de exportación de grafos: CSV con el formato de tablas de Gephi, GraphML y GEXF.
+
+Todos reciben un archivo binario abierto para escritura (que puede ser un compresor de compresion.comprimir) y escriben el grafo por bloques de tamaño fijo a partir de generadores, sin construir en memoria las tablas completas ni un árbol XML.
+'''
+from .grafo import *
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List
+import csv
+import io
+import json
+import re
+
+ELEMENTOS_POR_BLOQUE = 10000 # Filas o elementos XML que se convierten a texto y se escriben juntos
+CARACTERES_INVALIDOS_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]') # No se permiten en XML 1.0
+
+ENCABEZADO_NODOS = ['Id','Label']
+ENCABEZADO_ARISTAS = ['Source','Target','Type','Id','Weight']
+
+
+def _escribirPorBloques(archivo: BinaryIO, textos: Iterable[str]) -> None:
+    '''
+    Une los textos en bloques de ELEMENTOS_POR_BLOQUE y escribe cada bloque codificado en UTF-8.
+    '''
+    textos = iter(textos)
+    while True:
+        bloque = ''.join(islice(textos, ELEMENTOS_POR_BLOQUE))
+        if not bloque:
+            return
+        archivo.write(bloque.encode('utf-8'))
+
+
+def filasNodos(grafo: 'Grafo') -> Iterator[List]:
+    return ([nodo.identificador, nodo.contenido] for nodo in grafo.nodos)
+
+
+def filasAristas(grafo: 'Grafo') -> Iterator[List]:
+    tipo = 'Directed' if grafo.esDirigido() else 'Undirected'
+    return ([arista.a, arista.b, tipo, arista.identificador, arista.peso] for arista in grafo.aristas)
+
+
+def escribirCsv(archivo: BinaryIO, encabezado: List[str], filas: Iterable[List]) -> int:
+    '''
+    ---
+    Escribe una tabla CSV por bloques de filas.
+
+    ---
+    Descripción:
+    ---
+    Cada bloque de ELEMENTOS_POR_BLOQUE filas se convierte con csv.writer en un búfer de texto y se escribe de una vez, así la memoria usada no depende de la cantidad de filas.
+
+    ---
+    Returns:
+    ---
+    - int: Cantidad de filas escritas, sin contar el encabezado.
+    '''
+    filas = iter(filas)
+    cantidad = 0
+    bufer = io.StringIO()
+    escritor = csv.writer(bufer, delimiter=',')
+    escritor.writerow(encabezado)
+    while True:
+        bloque = list(islice(filas, ELEMENTOS_POR_BLOQUE))
+        escritor.writerows(bloque)
+        cantidad += len(bloque)
+        archivo.write(bufer.getvalue().encode('utf-8'))
+        if len(bloque) < ELEMENTOS_POR_BLOQUE:
+            return cantidad
+        bufer.seek(0)
+        bufer.truncate()
+
+
+def _textoContenido(contenido: Any) -> str:
+    '''
+    Convierte el contenido de un nodo en texto válido para XML. Los textos se usan tal cual y los demás valores se escriben como JSON.
+    '''
+    if contenido == None:
+        return ''
+    texto = contenido if type(contenido) == str else json.dumps(contenido)
+    return CARACTERES_INVALIDOS_XML.sub('', texto)
+
+
+def escribirGraphML(grafo: 'Grafo', archivo: BinaryIO) -> None:
+    '''
+    ---
+    Escribe el grafo en formato GraphML.
+
+    ---
+    Descripción:
+    ---
+    El contenido de cada nodo se guarda en el atributo "label" y el peso de cada arista en "weight", que son los nombres que Gephi reconoce al importar.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    with open('grafo1.graphml', 'wb') as archivo:
+        escribirGraphML(grafo, archivo)
+    ```
+    '''
+    from xml.sax.saxutils import escape # Importa urllib y tarda más que el resto del programa, solo se necesita al exportar XML
+    tipo = 'directed' if grafo.esDirigido() else 'undirected'
+    archivo.write((
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n'
+        '  <key id="label" for="node" attr.name="label" attr.type="string"/>\n'
+        '  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n'
+        f'  <graph id="G" edgedefault="{tipo}">\n'
+    ).encode('utf-8'))
+    _escribirPorBloques(archivo, (
+        f'    <node id="{nodo.identificador}"><data key="label">{escape(_textoContenido(nodo.contenido))}</data></node>\n'
+        for nodo in grafo.nodos
+    ))
+    _escribirPorBloques(archivo, (
+        f'    <edge id="e{arista.identificador}" source="{arista.a}" target="{arista.b}"><data key="weight">{float(arista.peso)!r}</data></edge>\n'
+        for arista in grafo.aristas
+    ))
+    archivo.write(b'  </graph>\n</graphml>\n')
+
+
+def escribirGexf(grafo: 'Grafo', archivo: BinaryIO) -> None:
+    '''
+    ---
+    Escribe el grafo en formato GEXF 1.3, el formato propio de Gephi.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    with open('grafo1.gexf', 'wb') as archivo:
+        escribirGexf(grafo, archivo)
+    ```
+    '''
+    from xml.sax.saxutils import quoteattr
+    tipo = 'directed' if grafo.esDirigido() else 'undirected'
+    archivo.write((
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<gexf xmlns="http://gexf.net/1.3" version="1.3">\n'
+        f'  <graph mode="static" defaultedgetype="{tipo}">\n'
+        '    <nodes>\n'
+    ).encode('utf-8'))
+    _escribirPorBloques(archivo, (
+        f'      <node id="{nodo.identificador}" label={quoteattr(_textoContenido(nodo.contenido))}/>\n'
+        for nodo in grafo.nodos
+    ))
+    archivo.write(b'    </nodes>\n    <edges>\n')
+    _escribirPorBloques(archivo, (
+        f'      <edge id="{arista.identificador}" source="{arista.a}" target="{arista.b}" weight="{float(arista.peso)!r}"/>\n'
+        for arista in grafo.aristas
+    ))
+    archivo.write(b'    </edges>\n  </graph>\n</gexf>\n')
@@ -1,5 +1,6 @@
-from art import *
 from typing import Dict, Union 
+import json
+import os
 
 # Declaracion de variables de fuente constante
 FUENTE_NORMAL = 'normal'
@@ -26,5 +27,59 @@ def obtenerFuentesConsola(parametro: Union[str, None] = None) -> Dict[str,str]:
             'FUENTE_DOOM': 'doom'
         }
     elif parametro == 'a':
+        from art import FONT_NAMES
         return dict(enumerate(FONT_NAMES))
 
+
+# Títulos ya dibujados, la clave es (titulo, fuente). Se llenan con renderizarTitulo
+_titulos: Dict[tuple, str] = {}
+_rutaCacheTitulos: Union[str, None] = None
+
+
+def activarCacheTitulos(ruta: str) -> None:
+    '''
+    Guarda en el archivo JSON indicado los títulos que se dibujan y carga los que ya tenía, así en las siguientes ejecuciones del programa no se necesita importar art para dibujarlos otra vez.
+
+    Si el archivo no existe o está dañado se empieza con el caché vacío.
+    '''
+    global _rutaCacheTitulos
+    _rutaCacheTitulos = ruta
+    try:
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            for fuente, titulos in json.load(archivo).items():
+                for titulo, texto in titulos.items():
+                    _titulos.setdefault((titulo, fuente), texto)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+def _guardarCacheTitulos() -> None:
+    datos: Dict[str, Dict[str, str]] = {}
+    for (titulo, fuente), texto in _titulos.items():
+        datos.setdefault(fuente, {})[titulo] = texto
+    try:
+        with open(_rutaCacheTitulos + '.tmp', 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo, ensure_ascii=False)
+        os.replace(_rutaCacheTitulos + '.tmp', _rutaCacheTitulos)
+    except OSError:
+        pass # Sin el archivo solo se pierde el caché entre ejecuciones
+
+
+def renderizarTitulo(titulo: str, fuente: str) -> str:
+    '''
+    ---
+    Dibuja el título con la fuente de art indicada.
+
+    ---
+    Descripción:
+    ---
+    Cada título se dibuja una sola vez por fuente y se guarda en memoria (y en el archivo de activarCacheTitulos, si se activó). La librería art se importa la primera vez que hay que dibujar un título que no está guardado, porque importarla tarda más que todo lo demás al abrir el programa.
+    '''
+    texto = _titulos.get((titulo, fuente))
+    if texto == None:
+        from art import text2art
+        texto = _titulos[(titulo, fuente)] = text2art(titulo, fuente)
+        if _rutaCacheTitulos != None:
+            _guardarCacheTitulos()
+    return texto
+
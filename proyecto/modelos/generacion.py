@@ -0,0 +1,211 @@
+'''
+Generación de grafos sintéticos grandes para pruebas de carga. Los nodos y las aristas se producen uno por uno con generadores, así se pueden escribir directamente al formato de guardado (ver generarGrafoSintetico en almacenamiento) sin que la memoria dependa del tamaño del grafo. proyecto.bench.generadores construye con estos mismos modelos los grafos en memoria para medir cómo escalan las operaciones.
+
+Modelos:
+
+    - aleatorio: aristas entre pares de nodos escogidos al azar (Erdős–Rényi G(n, m)).
+    - potencia: los dos extremos de cada arista se escogen con probabilidad proporcional a un peso que decrece como una potencia del identificador (modelo de Chung–Lu), así la cantidad de nodos con grado k decrece como k^-exponente.
+    - rejilla: rejilla de dos dimensiones, cada nodo se une con el de la derecha y el de abajo.
+    - comunidades: los nodos se reparten en bloques de identificadores consecutivos y la mayoría de las aristas quedan dentro de un bloque (modelo de bloques estocástico).
+    - preferencial: cada nodo nuevo se une a nodos anteriores con probabilidad proporcional a su grado (modelo de Barabási–Albert). Es el único modelo que guarda una lista con un elemento por extremo de arista, así que su memoria sí crece con el grafo.
+    - cadena: 1 - 2 - 3 - ... - n, la profundidad máxima posible.
+    - estrella: el nodo 1 se une con todos los demás, el grado máximo posible.
+
+Los nodos tienen los identificadores 1..n y las aristas 1..m, con pesos reales entre 1 y 10. No se descartan las aristas repetidas, que en grafos dispersos son muy pocas, porque para eso habría que recordar todos los pares. Con la misma semilla se obtiene siempre el mismo grafo.
+'''
+from .grafo import *
+from typing import Callable, Dict, Iterator, Tuple
+import math
+import random
+
+EXPONENTE = 2.5 # Exponente de la distribución de grados del modelo potencia
+MEZCLA = 0.1 # Fracción de las aristas del modelo comunidades que unen dos comunidades
+ARISTAS_POR_NODO = 2 # Aristas con las que llega cada nodo nuevo en el modelo preferencial
+
+
+def _paresAleatorios(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random') -> Iterator[Tuple[int, int]]:
+    azar = aleatorio.random
+    for _ in range(cantidadAristas):
+        a = int(azar() * cantidadNodos) + 1
+        b = int(azar() * (cantidadNodos - 1)) + 1
+        yield a, b if b < a else b + 1 # b es distinto de a
+
+
+def _paresPotencia(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random', exponente: float = EXPONENTE) -> Iterator[Tuple[int, int]]:
+    '''
+    El peso del nodo i es i^-beta con beta = 1 / (exponente - 1). Cada extremo se escoge invirtiendo la función de distribución continua de esos pesos, en O(1) y sin tablas.
+    '''
+    uno = 1 - 1 / (exponente - 1) # 1 - beta
+    escala = (cantidadNodos + 1) ** uno - 1
+    inverso = 1 / uno
+    azar = aleatorio.random
+
+    def extremo() -> int:
+        return min(int((escala * azar() + 1) ** inverso), cantidadNodos)
+
+    for _ in range(cantidadAristas):
+        a = extremo()
+        b = extremo()
+        while b == a:
+            b = extremo()
+        yield a, b
+
+
+def _paresRejilla(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random') -> Iterator[Tuple[int, int]]:
+    columnas = math.isqrt(max(cantidadNodos - 1, 0)) + 1
+    for i in range(1, cantidadNodos + 1):
+        if i % columnas != 0 and i < cantidadNodos:
+            yield i, i + 1
+        if i + columnas <= cantidadNodos:
+            yield i, i + columnas
+
+
+def _paresComunidades(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random', comunidades: Union[int, None] = None, mezcla: float = MEZCLA) -> Iterator[Tuple[int, int]]:
+    '''
+    Por defecto hay raíz de n comunidades. Cada arista une dos nodos al azar con probabilidad mezcla y, si no, un nodo al azar con otro de su misma comunidad.
+    '''
+    if comunidades == None:
+        comunidades = max(math.isqrt(cantidadNodos), 1)
+    tamano = -(-cantidadNodos // comunidades)
+    azar = aleatorio.random
+    for _ in range(cantidadAristas):
+        a = int(azar() * cantidadNodos) + 1
+        inicio = (a - 1) // tamano * tamano + 1
+        fin = min(inicio + tamano - 1, cantidadNodos)
+        if azar() < mezcla or fin == inicio:
+            b = int(azar() * (cantidadNodos - 1)) + 1
+        else:
+            b = inicio + int(azar() * (fin - inicio))
+        yield a, b if b < a else b + 1 # b es distinto de a
+
+
+def _paresPreferencial(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random', aristasPorNodo: int = ARISTAS_POR_NODO) -> Iterator[Tuple[int, int]]:
+    '''
+    Cada nodo a partir de aristasPorNodo + 1 se une a aristasPorNodo nodos anteriores distintos, escogidos con probabilidad proporcional a su grado. Las aristas van del nodo anterior al nuevo.
+    '''
+    repetidos = [] # Cada nodo aparece una vez por cada arista que tiene, escoger de aquí es escoger según el grado
+    destinos = list(range(1, min(aristasPorNodo, cantidadNodos) + 1))
+    for nuevo in range(len(destinos) + 1, cantidadNodos + 1):
+        for destino in destinos:
+            yield destino, nuevo
+        repetidos += destinos
+        repetidos += [nuevo] * len(destinos)
+        escogidos = set()
+        while len(escogidos) < aristasPorNodo:
+            escogidos.add(aleatorio.choice(repetidos))
+        destinos = list(escogidos)
+
+
+def _paresCadena(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random') -> Iterator[Tuple[int, int]]:
+    return ((i, i + 1) for i in range(1, cantidadNodos))
+
+
+def _paresEstrella(cantidadNodos: int, cantidadAristas: int, aleatorio: 'random.Random') -> Iterator[Tuple[int, int]]:
+    return ((1, i) for i in range(2, cantidadNodos + 1))
+
+
+class GeneradorGrafos:
+    '''
+    ---
+    GeneradorGrafos
+    ---
+
+    Nodos y aristas de grafos sintéticos, producidos uno por uno a partir de una semilla.
+
+    ---
+    ### Métodos:
+
+    - nodos
+    - aristas
+    - contarAristas
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    grafo = GrafoDirigido()
+    grafo.cargarMasivamente(GeneradorGrafos.nodos(1000), GeneradorGrafos.aristas('potencia', 1000, 4000, semilla=7))
+    ```
+    '''
+
+    MODELOS: Dict[str, Callable[..., Iterator[Tuple[int, int]]]] = {
+        'aleatorio': _paresAleatorios,
+        'potencia': _paresPotencia,
+        'rejilla': _paresRejilla,
+        'comunidades': _paresComunidades,
+        'preferencial': _paresPreferencial,
+        'cadena': _paresCadena,
+        'estrella': _paresEstrella,
+    }
+
+    @staticmethod
+    def contarAristas(modelo: str, cantidadNodos: int, cantidadAristas: Union[int, None] = None, **parametros) -> int:
+        '''
+        Devuelve la cantidad de aristas que va a producir aristas con los mismos argumentos: cantidadAristas (por defecto 2 por nodo, un grado medio de 4) salvo en la rejilla, la cadena, la estrella y el modelo preferencial, donde depende solo de la cantidad de nodos y de aristasPorNodo. Lanza ValueError si el modelo no existe o las cantidades son negativas.
+        '''
+        if modelo not in GeneradorGrafos.MODELOS:
+            raise ValueError(f'Modelo desconocido: {modelo}. Los modelos son {", ".join(GeneradorGrafos.MODELOS)}')
+        if cantidadNodos < 0 or (cantidadAristas != None and cantidadAristas < 0):
+            raise ValueError('La cantidad de nodos y de aristas no puede ser negativa')
+        if modelo == 'rejilla':
+            columnas = math.isqrt(max(cantidadNodos - 1, 0)) + 1
+            return max(cantidadNodos - 1 - (cantidadNodos - 1) // columnas, 0) + max(cantidadNodos - columnas, 0)
+        if cantidadNodos < 2: # No hay dos nodos distintos que unir
+            return 0
+        if modelo in ('cadena', 'estrella'):
+            return cantidadNodos - 1
+        if modelo == 'preferencial':
+            aristasPorNodo = min(parametros.get('aristasPorNodo', ARISTAS_POR_NODO), cantidadNodos)
+            return aristasPorNodo * (cantidadNodos - aristasPorNodo)
+        return cantidadAristas if cantidadAristas != None else 2 * cantidadNodos
+
+    @staticmethod
+    def nodos(cantidadNodos: int, tamanoContenido: int = 0, semilla: int = 0) -> Iterator['Nodo']:
+        '''
+        Produce los nodos 1..cantidadNodos. Con tamanoContenido 0 el contenido es 'Nodo i', si no es un texto hexadecimal al azar de tamanoContenido caracteres, para probar el peso de los contenidos.
+        '''
+        if tamanoContenido <= 0:
+            for i in range(1, cantidadNodos + 1):
+                yield Nodo(i, f'Nodo {i}')
+            return
+        aleatorio = random.Random(2 * semilla + 1) # Distinta de la de las aristas, así el contenido no cambia el grafo
+        bytesAzar = (tamanoContenido + 1) // 2
+        for i in range(1, cantidadNodos + 1):
+            yield Nodo(i, aleatorio.randbytes(bytesAzar).hex()[:tamanoContenido])
+
+    @staticmethod
+    def aristas(modelo: str, cantidadNodos: int, cantidadAristas: Union[int, None] = None, semilla: int = 0, **parametros) -> Iterator['Arista']:
+        '''
+        ---
+        Produce las aristas del modelo entre los nodos 1..cantidadNodos.
+
+        ---
+        Args:
+        ---
+        - modelo: Uno de MODELOS: 'aleatorio', 'potencia', 'rejilla', 'comunidades', 'preferencial', 'cadena' o 'estrella'.
+        - cantidadNodos: La cantidad de nodos del grafo.
+        - cantidadAristas: Cuántas aristas producir, ver contarAristas.
+        - semilla: Con la misma semilla se producen las mismas aristas.
+        - parametros: Opciones del modelo, exponente en 'potencia', comunidades y mezcla en 'comunidades' y aristasPorNodo en 'preferencial'.
+
+        ---
+        Notas:
+        ---
+        - Lanza ValueError si el modelo no existe o los parámetros no son válidos, antes de producir la primera arista.
+        '''
+        cantidadAristas = GeneradorGrafos.contarAristas(modelo, cantidadNodos, cantidadAristas, **parametros)
+        if parametros.get('aristasPorNodo', ARISTAS_POR_NODO) < 1:
+            raise ValueError('Cada nodo nuevo del modelo preferencial debe llegar con al menos una arista')
+        if parametros.get('exponente', EXPONENTE) <= 2:
+            raise ValueError('El exponente del modelo potencia debe ser mayor que 2')
+        if parametros.get('comunidades') != None and parametros['comunidades'] < 1:
+            raise ValueError('Debe haber al menos una comunidad')
+        if not 0 <= parametros.get('mezcla', MEZCLA) <= 1:
+            raise ValueError('La mezcla debe estar entre 0 y 1')
+        aleatorio = random.Random(2 * semilla)
+        try:
+            pares = GeneradorGrafos.MODELOS[modelo](cantidadNodos, cantidadAristas, aleatorio, **parametros)
+        except TypeError:
+            raise ValueError(f'El modelo {modelo} no acepta {", ".join(parametros)}')
+        azar = aleatorio.random
+        return (Arista(i, a, b, round(1 + 9 * azar(), 2)) for i, (a, b) in enumerate(pares, 1))
@@ -1,5 +1,5 @@
 from abc import ABC, abstractclassmethod
-from typing import List, overload, Union, Dict, Any 
+from typing import List, overload, Union, Dict, Any, Iterable 
 from .nodo import Nodo 
 from .arista import Arista 
 
@@ -7,6 +7,7 @@ class Grafo(ABC):
     def __init__(self):
         self.nodos: List['Nodo'] = []
         self.aristas: List['Arista'] = []
+        self._cambios: Union[List[tuple], None] = None # Cambios pendientes de guardar, solo si se llamó a iniciarRegistroCambios
 
     def __str__(self) -> str:
         retorno = ""
@@ -35,7 +36,7 @@ class Grafo(ABC):
         '''
         Esta funcion devuelve un entero que corresponde a un id que no existe dentro del grafo. Es util para crear nuevas aristas sin interferir con la implementacion del grafo.
         '''
-        idsAristas = [arista.identificador for arista in self.aristas] + [0]
+        idsAristas = {arista.identificador for arista in self.aristas} | {0} # Conjunto para que cada busqueda cueste O(1)
 
         idmin = min(idsAristas)
         idmax = max(idsAristas)
@@ -51,7 +52,7 @@ class Grafo(ABC):
         '''
         Esta funcion devuelve un entero que corresponde a un id que no existe dentro del grafo. Es util para crear nuevos nodos sin interferir con la implementacion del grafo.
         '''
-        idsNodos = [nodo.identificador for nodo in self.nodos] + [0]
+        idsNodos = {nodo.identificador for nodo in self.nodos} | {0} # Conjunto para que cada busqueda cueste O(1)
 
         idmin = min(idsNodos)
         idmax = max(idsNodos)
@@ -139,11 +140,97 @@ class Grafo(ABC):
             nuevoId = self._obtenerIdNodoDisponible()
             nodo.identificador = nuevoId 
         self.nodos.append(nodo)
+        self._registrarCambio('+n', nodo.identificador, nodo.contenido)
+
+    def iniciarRegistroCambios(self) -> None:
+        '''
+        Empieza a registrar los nodos y aristas que se agregan o eliminan, para poder guardar solamente los cambios con extraerCambios en lugar de todo el grafo.
+        '''
+        self._cambios = []
+
+    def extraerCambios(self) -> Union[List[tuple], None]:
+        '''
+        Devuelve los cambios registrados desde la última llamada y vacía el registro. Si no se está registrando devuelve None.
+
+        Cada cambio es una tupla con los identificadores ya resueltos por el grafo:
+            - ('+n', idNodo, contenido)
+            - ('+a', idArista, a, b, peso)
+            - ('-n', idNodo)
+            - ('-a', idArista)
+        '''
+        cambios = self._cambios
+        if cambios != None:
+            self._cambios = []
+        return cambios
+
+    def tieneCambios(self) -> bool:
+        '''
+        Indica si hay cambios registrados que todavía no se extrajeron con extraerCambios.
+        '''
+        return bool(self._cambios)
+
+    def _registrarCambio(self, *cambio) -> None:
+        if self._cambios != None:
+            self._cambios.append(cambio)
     
     @abstractclassmethod
     def agregarArista(self, *args, **kwargs):
         pass
 
+    def cargarMasivamente(self, nodos: Iterable['Nodo'], aristas: Iterable['Arista']) -> None:
+        '''
+        ---
+        Agrega muchos nodos y aristas a la vez en O(V+E). Es útil para reconstruir grafos guardados o importados, donde agregarNodo y agregarArista costarían O(V+E) por cada elemento al buscar los nodos y los identificadores en las listas.
+
+        ---
+        Args:
+        ---
+        - nodos: Nodos a agregar, sin vecinos. Se consumen completamente antes que las aristas, por lo que pueden ser generadores.
+        - aristas: Aristas a agregar, sus nodos deben estar en el grafo o entre los nodos anteriores.
+
+        ---
+        Notas:
+        ---
+        - Igual que en agregarNodo y agregarArista, si un identificador ya existe se le asigna el menor identificador libre, como con _obtenerIdNodoDisponible y _obtenerIdAristaDisponible. Como durante la carga solo se agregan identificadores, el menor libre nunca retrocede y se busca desde donde quedó la última vez, así el costo total sigue siendo O(V+E).
+        - Las aristas cuyos nodos no existen se descartan.
+        '''
+        porId = {n.identificador: n for n in self.nodos}
+        minIdNodo = libreNodo = min(min(porId, default=0), 0)
+        for nodo in nodos:
+            if nodo.identificador in porId:
+                while libreNodo == 0 or libreNodo in porId: # Igual que en _obtenerIdNodoDisponible el 0 nunca se asigna
+                    libreNodo += 1
+                nodo.identificador = libreNodo
+            elif nodo.identificador < minIdNodo:
+                minIdNodo = libreNodo = nodo.identificador
+            porId[nodo.identificador] = nodo
+            self.nodos.append(nodo)
+
+        idsAristas = {a.identificador for a in self.aristas}
+        minIdArista = libreArista = min(min(idsAristas, default=0), 0)
+        dirigido = self.esDirigido()
+        # Referencias locales para evitar búsquedas de atributos en el ciclo, que se repite una vez por arista
+        buscar = porId.get
+        agregarId = idsAristas.add
+        agregarArista = self.aristas.append
+        for arista in aristas:
+            origen = buscar(arista.a)
+            destino = buscar(arista.b)
+            if origen is None or destino is None:
+                continue
+            idArista = arista.identificador
+            if idArista in idsAristas:
+                while libreArista == 0 or libreArista in idsAristas:
+                    libreArista += 1
+                arista.identificador = idArista = libreArista
+            elif idArista < minIdArista:
+                minIdArista = libreArista = idArista
+            agregarId(idArista)
+            agregarArista(arista)
+            origen.vecinos.append(destino)
+            if not dirigido:
+                destino.vecinos.append(origen)
+
     @abstractclassmethod
     def eliminarNodo(self, idNodo: int) -> int:
         '''
@@ -186,6 +273,10 @@ class GrafoDirigido(Grafo):
     ### Métodos heredados de Grafo:
         - obtenerNodoPorId
         - agregarNodo
+        - cargarMasivamente
+        - iniciarRegistroCambios
+        - extraerCambios
+        - tieneCambios
     '''
     def __init__(self):
         super().__init__()
@@ -360,10 +451,11 @@ class GrafoDirigido(Grafo):
 
             # Eliminar el nodo del grafo
             self.nodos.pop(p)
+            self._registrarCambio('-n', idNodo)
 
             return 1 # Se eliminó exitosamente
 
-    def agregarArista(self, nodoOrigen: int, nodoDestino: int, idArista: int  = 0) -> int:
+    def agregarArista(self, nodoOrigen: int, nodoDestino: int, idArista: int  = 0, peso: float = 1) -> int:
         '''
         Para agregar la arista en el grafo previamente deben existir los nodos correspondientes.
 
@@ -372,6 +464,7 @@ class GrafoDirigido(Grafo):
             - nodoDestino: Es el identificador del nodo de destino.
 
             - idArista: Es el identificador que se le quiera poner a la arista, por defecto es 0 pero si ya existe se escogerá uno automáticamente.
+            - peso: Es el costo de la arista, por defecto es 1.
 
         Returns:
             - 1: Si se agregó la arista en el grafo exitosamente.
@@ -381,7 +474,7 @@ class GrafoDirigido(Grafo):
             
             if self._nodosExisten([nodoOrigen, nodoDestino]):
 
-                nuevaArista = Arista(idArista, nodoOrigen, nodoDestino)
+                nuevaArista = Arista(idArista, nodoOrigen, nodoDestino, peso)
 
                 if self._buscarArista(idArista) != -1:
                     nuevaArista.identificador = self._obtenerIdAristaDisponible()
@@ -390,6 +483,7 @@ class GrafoDirigido(Grafo):
                 pNodoOrigen = self._buscarNodo(nodoOrigen)      # Posicion del nodo de origen en el grafo
                 pNodoDestino = self._buscarNodo(nodoDestino)    # Posicion del nodo de destino en el grafo
                 self.nodos[pNodoOrigen].agregarVecino(self.nodos[pNodoDestino]) # Se agrega un vecino al nodoOrigen
+                self._registrarCambio('+a', nuevaArista.identificador, nodoOrigen, nodoDestino, peso)
                 return 1
             else:
                 return 0
@@ -427,6 +521,7 @@ class GrafoDirigido(Grafo):
                 self.nodos[self._buscarNodo(arista.a)].eliminarVecino(arista.b)
 
                 self.aristas.pop(posicionArista) # Se elimina la arista del grafo
+                self._registrarCambio('-a', arista.identificador)
                 return 1
             return 0
             
@@ -454,6 +549,10 @@ class GrafoNoDirigido(Grafo):
     ### Métodos heredados de Grafo:
         - obtenerNodoPorId
         - agregarNodo
+        - cargarMasivamente
+        - iniciarRegistroCambios
+        - extraerCambios
+        - tieneCambios
     '''
     def __init__(self):
         super().__init__()
@@ -525,10 +624,11 @@ class GrafoNoDirigido(Grafo):
 
             # Eliminar el nodo del grafo
             self.nodos.pop(p)
+            self._registrarCambio('-n', idNodo)
 
             return True # Se eliminó exitosamente
     
-    def agregarArista(self, nodo1: int, nodo2: int, idArista: int = 0) -> bool:
+    def agregarArista(self, nodo1: int, nodo2: int, idArista: int = 0, peso: float = 1) -> bool:
         '''
         Para agregar la arista en el grafo previamente deben existir los nodos correspondientes.
 
@@ -537,6 +637,7 @@ class GrafoNoDirigido(Grafo):
             - nodo2: Es el identificador del nodo de destino.
 
             - idArista: Es el identificador que se le quiera poner a la arista, por defecto es None y se escogerá uno automáticamente.
+            - peso: Es el costo de la arista, por defecto es 1.
 
         Returns:
             - True: Si se agregó la arista en el grafo exitosamente.
@@ -546,7 +647,7 @@ class GrafoNoDirigido(Grafo):
             
             if self._nodosExisten([nodo1, nodo2]):
 
-                nuevaArista = Arista(idArista, nodo1, nodo2)
+                nuevaArista = Arista(idArista, nodo1, nodo2, peso)
 
                 if self._buscarArista(idArista) != -1:
                     nuevaArista.identificador = self._obtenerIdAristaDisponible()
@@ -560,6 +661,7 @@ class GrafoNoDirigido(Grafo):
                 # Se agregan los nodos como vecinos mutuamente
                 self.nodos[p1].agregarVecino(self.nodos[p2])
                 self.nodos[p2].agregarVecino(self.nodos[p1])
+                self._registrarCambio('+a', nuevaArista.identificador, nodo1, nodo2, peso)
                 return True # Se agregó la arista correctamente
             else:
                 return False # No se puedo agregar la arista
@@ -599,6 +701,7 @@ class GrafoNoDirigido(Grafo):
                 self.nodos[self._buscarNodo(arista.b)].eliminarVecino(arista.a)
 
                 self.aristas.pop(posicionArista)
+                self._registrarCambio('-a', arista.identificador)
                 return True 
             return False
             
@@ -0,0 +1,506 @@
+'''
+Grafos guardados en una base de datos SQLite, para grafos que no caben en memoria.
+
+Los nodos y las aristas se guardan en las tablas "nodos" y "aristas" y solamente se leen cuando se consultan. La tabla de aristas tiene índices sobre (a), (b) y (a, b), así obtener los vecinos, los padres o una arista entre dos nodos son consultas indexadas en lugar de recorrer listas.
+
+    nodos(posicion INTEGER PRIMARY KEY, id UNIQUE, tipo, contenido)
+    aristas(posicion INTEGER PRIMARY KEY, id UNIQUE, a, b, peso)
+
+La columna posicion conserva el orden en que se agregaron los nodos y aristas, que es el orden de las listas "nodos", "aristas" y "vecinos" en GrafoDirigido y GrafoNoDirigido.
+
+Las ediciones quedan en una sola transacción hasta que se llama a confirmar (guardarGrafo lo hace) o a descartar, así una sesión de edición se guarda o se deshace completa. Cerrar el grafo sin confirmar descarta las ediciones pendientes.
+'''
+from .grafo import *
+from .binario import CONTENIDO_NINGUNO, CONTENIDO_TEXTO, CONTENIDO_JSON, decodificarContenido
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
+import json
+import os
+import sqlite3
+
+EXTENSION_SQLITE = '.sqlite'
+TAMANO_CACHE_VECINOS = 4096 # Cantidad de nodos cuyos vecinos se guardan en memoria
+FILAS_POR_LOTE = 500 # Filas que se leen o insertan juntas, también es el límite de parámetros de una consulta IN
+CACHE_SQLITE_KIB = 32768 # Caché de páginas de SQLite
+
+ESQUEMA = '''
+CREATE TABLE IF NOT EXISTS propiedades (clave TEXT PRIMARY KEY, valor);
+CREATE TABLE IF NOT EXISTS nodos (posicion INTEGER PRIMARY KEY, id INTEGER NOT NULL UNIQUE, tipo INTEGER NOT NULL, contenido);
+CREATE TABLE IF NOT EXISTS aristas (posicion INTEGER PRIMARY KEY, id INTEGER NOT NULL UNIQUE, a INTEGER NOT NULL, b INTEGER NOT NULL, peso NOT NULL);
+CREATE INDEX IF NOT EXISTS aristasA ON aristas (a);
+CREATE INDEX IF NOT EXISTS aristasB ON aristas (b);
+CREATE INDEX IF NOT EXISTS aristasAB ON aristas (a, b);
+'''
+
+
+def _codificarContenido(contenido: Any) -> Tuple[int, Union[str, None]]:
+    '''
+    Devuelve el tipo y el texto con que se guarda el contenido de un nodo, con los mismos tipos del formato binario.
+    '''
+    if contenido == None:
+        return CONTENIDO_NINGUNO, None
+    if type(contenido) == str:
+        return CONTENIDO_TEXTO, contenido
+    return CONTENIDO_JSON, json.dumps(contenido)
+
+
+def _decodificarContenido(tipo: int, texto: Union[str, None]) -> Any:
+    return decodificarContenido(tipo, texto.encode('utf-8')) if tipo != CONTENIDO_NINGUNO else None
+
+
+def _lotes(elementos: Iterable, tamano: int = FILAS_POR_LOTE) -> Iterator[list]:
+    elementos = iter(elementos)
+    while True:
+        lote = list(islice(elementos, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+class NodoSqlite(Nodo):
+    '''
+    ---
+    NodoSqlite
+    ---
+
+    Nodo de un grafo guardado en SQLite. Solo guarda su identificador; el contenido se lee la primera vez que se consulta y los vecinos se leen cada vez (pasando por la caché de vecinos del grafo).
+    '''
+
+    _SIN_LEER = object()
+
+    def __init__(self, grafo: '_GrafoSqlite', identificador: int, contenido: Any = _SIN_LEER):
+        self._grafo = grafo
+        self.identificador = identificador
+        self._contenido = contenido
+
+    @property
+    def contenido(self):
+        if self._contenido is NodoSqlite._SIN_LEER:
+            self._contenido = self._grafo._leerContenido(self.identificador)
+        return self._contenido
+
+    @property
+    def vecinos(self) -> List['NodoSqlite']:
+        grafo = self._grafo
+        return [NodoSqlite(grafo, idVecino) for idVecino in grafo._idsVecinos(self.identificador)]
+
+
+class SecuenciaSqlite:
+    '''
+    Secuencia de solo lectura sobre una tabla, en el orden de la columna posicion. Se usa para los atributos "nodos" y "aristas" de los grafos SQLite: recorrerla lee la tabla por lotes con un cursor y acceder a un índice hace una consulta.
+    '''
+
+    def __init__(self, grafo: '_GrafoSqlite', tabla: str, columnas: str, crear):
+        self._grafo = grafo
+        self._tabla = tabla
+        self._columnas = columnas
+        self._crear = crear
+
+    def __len__(self) -> int:
+        return self._grafo._cantidades[self._tabla]
+
+    def __getitem__(self, i: int):
+        '''
+        Devuelve el elemento i en O(log n) buscándolo por su posición, que es i + 1 cuando las posiciones no tienen huecos. Si se eliminaron filas primero se numeran de nuevo las posiciones (ver _GrafoSqlite._compactarPosiciones).
+        '''
+        if i < 0:
+            i += len(self)
+        if i < 0 or i >= len(self):
+            raise IndexError('índice fuera de rango')
+        self._grafo._compactarPosiciones(self._tabla)
+        fila = self._grafo._conexion.execute(f'SELECT {self._columnas} FROM {self._tabla} WHERE posicion = ?', (i + 1,)).fetchone()
+        return self._crear(fila)
+
+    def __iter__(self) -> Iterator:
+        cursor = self._grafo._conexion.execute(f'SELECT {self._columnas} FROM {self._tabla} ORDER BY posicion')
+        while True:
+            filas = cursor.fetchmany(FILAS_POR_LOTE)
+            if not filas:
+                return
+            yield from map(self._crear, filas)
+
+    def __repr__(self) -> str:
+        return '[' + ', '.join(map(repr, self)) + ']'
+
+
+class _GrafoSqlite:
+    '''
+    Implementación común de GrafoDirigidoSqlite y GrafoNoDirigidoSqlite. Reemplaza los métodos de Grafo que recorren las listas de nodos y aristas por consultas a la base de datos.
+    '''
+
+    def __init__(self, ruta: str = ':memory:', tamanoCacheVecinos: int = TAMANO_CACHE_VECINOS):
+        '''
+        Args:
+            - ruta: Archivo de la base de datos, se crea si no existe. Con ':memory:' la base de datos solo existe en memoria.
+            - tamanoCacheVecinos: Cantidad de nodos cuyos vecinos se guardan en memoria.
+
+        Lanza ValueError si la base de datos guarda un grafo del otro tipo (dirigido o no dirigido).
+        '''
+        super().__init__()
+        self.ruta = ruta
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False) # Se puede guardar desde otro hilo (como el del servidor), siempre que no se edite al mismo tiempo
+        try:
+            self._conexion.execute(f'PRAGMA cache_size = -{CACHE_SQLITE_KIB}')
+            self._conexion.executescript(ESQUEMA)
+            fila = self._conexion.execute("SELECT valor FROM propiedades WHERE clave = 'dirigido'").fetchone()
+            if fila == None:
+                self._conexion.execute("INSERT INTO propiedades VALUES ('dirigido', ?)", (int(self.esDirigido()),))
+                self._conexion.commit()
+            elif bool(fila[0]) != self.esDirigido():
+                raise ValueError('La base de datos guarda un grafo ' + ('dirigido' if fila[0] else 'no dirigido'))
+        except Exception:
+            self._conexion.close()
+            raise
+        self._contarFilas()
+        self._cacheVecinos: 'OrderedDict[int, Tuple[int, ...]]' = OrderedDict()
+        self.tamanoCacheVecinos = tamanoCacheVecinos
+        self.nodos = SecuenciaSqlite(self, 'nodos', 'id, tipo, contenido', lambda fila: NodoSqlite(self, fila[0], _decodificarContenido(fila[1], fila[2])))
+        self.aristas = SecuenciaSqlite(self, 'aristas', 'id, a, b, peso', lambda fila: Arista(*fila))
+
+    def _contarFilas(self) -> None:
+        '''
+        Lee la cantidad de filas de cada tabla y si sus posiciones tienen huecos, al abrir la base de datos o al descartar las ediciones.
+        '''
+        self._cantidades = {tabla: self._conexion.execute(f'SELECT COUNT(*) FROM {tabla}').fetchone()[0] for tabla in ('nodos', 'aristas')}
+        # Las posiciones son 1..n si la mayor es igual a la cantidad de filas
+        self._conHuecos = {tabla: (self._conexion.execute(f'SELECT MAX(posicion) FROM {tabla}').fetchone()[0] or 0) != self._cantidades[tabla] for tabla in self._cantidades}
+        self._cambiosSinConfirmar = 0
+
+    def _compactarPosiciones(self, tabla: str) -> None:
+        '''
+        Si se eliminaron filas de la tabla, numera de nuevo sus posiciones como 1..n sin cambiar el orden, así el elemento i está en la posición i + 1. Cuesta O(n log n) una vez por cada grupo de eliminaciones, en lugar de O(n) por cada acceso con OFFSET. Es parte de la transacción actual, descartar también lo deshace.
+        '''
+        if not self._conHuecos[tabla]:
+            return
+        # Se pasa primero por posiciones negativas para que ninguna posición nueva choque con una que todavía no se cambia
+        self._conexion.execute(f'UPDATE {tabla} SET posicion = -(SELECT orden.nueva FROM (SELECT posicion AS vieja, ROW_NUMBER() OVER (ORDER BY posicion) AS nueva FROM {tabla}) AS orden WHERE orden.vieja = {tabla}.posicion)')
+        self._conexion.execute(f'UPDATE {tabla} SET posicion = -posicion')
+        self._conHuecos[tabla] = False
+
+    # Consultas
+
+    def _consultarIds(self, consulta: str, parametros: tuple) -> List[int]:
+        return [fila[0] for fila in self._conexion.execute(consulta, parametros)]
+
+    def _consultarVecinos(self, idNodo: int) -> List[int]:
+        return self._consultarIds('SELECT b FROM aristas WHERE a = ? ORDER BY posicion', (idNodo,))
+
+    def _idsVecinos(self, idNodo: int) -> Tuple[int, ...]:
+        '''
+        Devuelve los identificadores de los vecinos del nodo en el mismo orden que Nodo.vecinos, usando la caché de vecinos (LRU).
+        '''
+        cache = self._cacheVecinos
+        vecinos = cache.get(idNodo)
+        if vecinos != None:
+            cache.move_to_end(idNodo)
+            return vecinos
+        vecinos = tuple(self._consultarVecinos(idNodo))
+        if self.tamanoCacheVecinos > 0:
+            cache[idNodo] = vecinos
+            if len(cache) > self.tamanoCacheVecinos:
+                cache.popitem(last=False)
+        return vecinos
+
+    def _leerContenido(self, idNodo: int) -> Any:
+        fila = self._conexion.execute('SELECT tipo, contenido FROM nodos WHERE id = ?', (idNodo,)).fetchone()
+        return _decodificarContenido(*fila) if fila != None else None
+
+    def _buscarNodo(self, idNodo: int) -> int:
+        '''
+        Devuelve la posición del nodo en la tabla, o -1 si no existe.
+        '''
+        fila = self._conexion.execute('SELECT posicion FROM nodos WHERE id = ?', (idNodo,)).fetchone()
+        return fila[0] if fila != None else -1
+
+    def _nodosExisten(self, idsNodo: List[int]) -> bool:
+        return all(self._buscarNodo(i) != -1 for i in idsNodo)
+
+    def _buscarAristasConNodo(self, idNodo: int) -> List[int]:
+        return self._consultarIds('SELECT posicion FROM aristas WHERE a = ? UNION SELECT posicion FROM aristas WHERE b = ?', (idNodo, idNodo))
+
+    def _obtenerIdDisponible(self, tabla: str) -> int:
+        '''
+        Devuelve el menor identificador libre después del menor identificador usado, igual que Grafo._obtenerIdNodoDisponible, sin leer todos los identificadores en memoria.
+        '''
+        ids = f'SELECT id FROM {tabla} UNION SELECT 0'
+        return self._conexion.execute(f'SELECT MIN(id) + 1 FROM ({ids}) WHERE id + 1 NOT IN ({ids})').fetchone()[0]
+
+    def _idLibreDesde(self, tabla: str, desde: int, pendientes: set) -> int:
+        '''
+        Devuelve el menor identificador mayor o igual que desde que no está en la tabla ni en pendientes (identificadores de un lote que todavía no se inserta), sin contar el 0. Recorre el índice de id solo hasta el primer hueco.
+        '''
+        candidato = desde
+        while True:
+            if self._conexion.execute(f'SELECT 1 FROM {tabla} WHERE id = ?', (candidato,)).fetchone() != None:
+                candidato = self._conexion.execute(f'SELECT id + 1 FROM {tabla} WHERE id >= ? AND id + 1 NOT IN (SELECT id FROM {tabla}) ORDER BY id LIMIT 1', (candidato,)).fetchone()[0]
+            if candidato != 0 and candidato not in pendientes:
+                return candidato
+            candidato += 1
+
+    def _obtenerIdNodoDisponible(self) -> int:
+        return self._obtenerIdDisponible('nodos')
+
+    def _obtenerIdAristaDisponible(self) -> int:
+        return self._obtenerIdDisponible('aristas')
+
+    def obtenerNodoPorId(self, idNodo: int) -> Union['NodoSqlite', int]:
+        '''
+        Devuelve el nodo con el identificador dado o -1 si no existe, igual que Grafo.obtenerNodoPorId.
+        '''
+        fila = self._conexion.execute('SELECT tipo, contenido FROM nodos WHERE id = ?', (idNodo,)).fetchone()
+        return NodoSqlite(self, idNodo, _decodificarContenido(*fila)) if fila != None else -1
+
+    # Ediciones
+
+    def _despuesDeEditar(self, cambios: int = 1) -> None:
+        '''
+        Cuenta los cambios de la transacción actual. No se confirman hasta llamar a confirmar, así la sesión de edición se guarda o se descarta completa.
+        '''
+        self._cambiosSinConfirmar += cambios
+
+    def _olvidarVecinos(self, *idsNodo: int) -> None:
+        for idNodo in idsNodo:
+            self._cacheVecinos.pop(idNodo, None)
+
+    def agregarNodo(self, nodo: 'Nodo'):
+        if self._nodosExisten([nodo.identificador]):
+            nodo.identificador = self._obtenerIdNodoDisponible()
+        self._conexion.execute('INSERT INTO nodos (id, tipo, contenido) VALUES (?, ?, ?)', (nodo.identificador, *_codificarContenido(nodo.contenido)))
+        self._cantidades['nodos'] += 1
+        self._registrarCambio('+n', nodo.identificador, nodo.contenido)
+        self._despuesDeEditar()
+
+    def cargarMasivamente(self, nodos: Iterable['Nodo'], aristas: Iterable['Arista']) -> None:
+        '''
+        Igual que Grafo.cargarMasivamente pero insertando por lotes de FILAS_POR_LOTE filas en la transacción actual, que se guarda con confirmar. Los identificadores repetidos se buscan con una consulta por lote y reciben el menor identificador libre, buscado en el índice desde el último asignado, así la memoria usada no depende del tamaño del grafo.
+        '''
+        conexion = self._conexion
+        minIdNodo = libreNodo = min(conexion.execute('SELECT MIN(id) FROM nodos').fetchone()[0] or 0, 0)
+        for lote in _lotes(nodos):
+            existentes = set(self._consultarIds(f'SELECT id FROM nodos WHERE id IN ({",".join("?" * len(lote))})', tuple(n.identificador for n in lote)))
+            pendientes = set()
+            for nodo in lote:
+                if nodo.identificador in existentes or nodo.identificador in pendientes:
+                    libreNodo = self._idLibreDesde('nodos', libreNodo, pendientes)
+                    nodo.identificador = libreNodo
+                elif nodo.identificador < minIdNodo:
+                    minIdNodo = libreNodo = nodo.identificador
+                pendientes.add(nodo.identificador)
+            conexion.executemany('INSERT INTO nodos (id, tipo, contenido) VALUES (?, ?, ?)', [(n.identificador, *_codificarContenido(n.contenido)) for n in lote])
+            self._cantidades['nodos'] += len(lote)
+
+        minIdArista = libreArista = min(conexion.execute('SELECT MIN(id) FROM aristas').fetchone()[0] or 0, 0)
+        for lote in _lotes(aristas):
+            extremos = {a.a for a in lote} | {a.b for a in lote}
+            nodosExistentes = set(self._consultarIds(f'SELECT id FROM nodos WHERE id IN ({",".join("?" * len(extremos))})', tuple(extremos)))
+            lote = [a for a in lote if a.a in nodosExistentes and a.b in nodosExistentes] # Las aristas cuyos nodos no existen se descartan
+            idsUsados = set(self._consultarIds(f'SELECT id FROM aristas WHERE id IN ({",".join("?" * len(lote))})', tuple(a.identificador for a in lote)))
+            pendientes = set()
+            for arista in lote:
+                if arista.identificador in idsUsados or arista.identificador in pendientes:
+                    libreArista = self._idLibreDesde('aristas', libreArista, pendientes)
+                    arista.identificador = libreArista
+                elif arista.identificador < minIdArista:
+                    minIdArista = libreArista = arista.identificador
+                pendientes.add(arista.identificador)
+            conexion.executemany('INSERT INTO aristas (id, a, b, peso) VALUES (?, ?, ?, ?)', [(a.identificador, a.a, a.b, a.peso) for a in lote])
+            self._cantidades['aristas'] += len(lote)
+        self._cacheVecinos.clear()
+
+    def agregarArista(self, nodoOrigen: int, nodoDestino: int, idArista: int = 0, peso: float = 1) -> bool:
+        '''
+        Agrega la arista si existen ambos nodos. Si el identificador ya existe se escoge uno automáticamente.
+
+        Returns:
+            - True: Si se agregó la arista en el grafo exitosamente.
+            - False: Si no se puedo agregar la arista.
+        '''
+        if not self._nodosExisten([nodoOrigen, nodoDestino]):
+            return False
+        if self._buscarArista(idArista) != -1:
+            idArista = self._obtenerIdAristaDisponible()
+        self._conexion.execute('INSERT INTO aristas (id, a, b, peso) VALUES (?, ?, ?, ?)', (idArista, nodoOrigen, nodoDestino, peso))
+        self._cantidades['aristas'] += 1
+        self._olvidarVecinos(nodoOrigen, nodoDestino)
+        self._registrarCambio('+a', idArista, nodoOrigen, nodoDestino, peso)
+        self._despuesDeEditar()
+        return True
+
+    def eliminarNodo(self, idNodo: int) -> bool:
+        '''
+        Elimina el nodo y todas las aristas conectadas a él.
+
+        Returns:
+            - True: Si el nodo se eliminó exitosamente.
+            - False: Si no se encontró ni se eliminó el nodo.
+        '''
+        if self._buscarNodo(idNodo) == -1:
+            return False
+        eliminadas = self._conexion.execute('DELETE FROM aristas WHERE a = ? OR b = ?', (idNodo, idNodo)).rowcount
+        self._conexion.execute('DELETE FROM nodos WHERE id = ?', (idNodo,))
+        self._cantidades['aristas'] -= eliminadas
+        self._cantidades['nodos'] -= 1
+        self._conHuecos['nodos'] = True
+        self._conHuecos['aristas'] = self._conHuecos['aristas'] or eliminadas > 0
+        self._cacheVecinos.clear() # El nodo puede aparecer en los vecinos de cualquier otro
+        self._registrarCambio('-n', idNodo)
+        self._despuesDeEditar(1 + eliminadas)
+        return True
+
+    def eliminarArista(self, *args, **kwargs) -> bool:
+        '''
+        Elimina una arista, buscándola por su identificador o por sus nodos igual que eliminarArista de GrafoDirigido y GrafoNoDirigido.
+
+        Returns:
+            - True: Si eliminó la arista del grafo
+            - False: Si no se pudo eliminar nada
+        '''
+        posicionArista = self._buscarArista(args[0]) if len(args) == 1 else self._buscarArista(args[0], args[1])
+        if posicionArista == -1:
+            return False
+        idArista, a, b = self._conexion.execute('SELECT id, a, b FROM aristas WHERE posicion = ?', (posicionArista,)).fetchone()
+        self._conexion.execute('DELETE FROM aristas WHERE posicion = ?', (posicionArista,))
+        self._cantidades['aristas'] -= 1
+        self._conHuecos['aristas'] = True
+        self._olvidarVecinos(a, b)
+        self._registrarCambio('-a', idArista)
+        self._despuesDeEditar()
+        return True
+
+    def confirmar(self) -> None:
+        '''
+        Confirma en la base de datos las ediciones hechas desde la última confirmación.
+        '''
+        self._conexion.commit()
+        self._cambiosSinConfirmar = 0
+
+    def descartar(self) -> None:
+        '''
+        Deshace las ediciones hechas desde la última confirmación. También se olvidan los cambios registrados para el diario y los vecinos guardados en la caché.
+        '''
+        self._conexion.rollback()
+        self._contarFilas()
+        self._cacheVecinos.clear()
+        if self._cambios != None:
+            self._cambios = []
+
+    def cerrar(self) -> None:
+        '''
+        Cierra la base de datos descartando las ediciones que no se confirmaron. Los nodos obtenidos antes de cerrar dejan de poder consultarse.
+        '''
+        if self._conexion != None:
+            self._conexion.rollback()
+            self._conexion.close()
+            self._conexion = None
+
+
+class GrafoDirigidoSqlite(_GrafoSqlite, GrafoDirigido):
+    '''
+    ---
+    GrafoDirigidoSqlite
+    ---
+
+    GrafoDirigido guardado en una base de datos SQLite. Tiene los mismos métodos que GrafoDirigido, por lo que se puede usar con los menús, AlgoritmoBFS, AlgoritmoDFS y los algoritmos sobre Adyacencia, pero ningún método carga el grafo completo en memoria: los nodos y aristas se leen de la base de datos al consultarlos.
+
+    ---
+    ### Métodos propios:
+
+    - confirmar
+    - descartar
+    - cerrar
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    grafo = GrafoDirigidoSqlite('datos_grafos/grafo1.sqlite')
+    grafo.agregarNodo(Nodo(1, 'A'))
+    grafo.agregarNodo(Nodo(2, 'B'))
+    grafo.agregarArista(1, 2)
+    recorrido = AlgoritmoBFS.obtenerRecorridoEnOrden(grafo, 1)
+    grafo.cerrar()
+    ```
+
+    ---
+    Notas:
+    ---
+    - Las ediciones quedan en una transacción hasta llamar a confirmar o descartar. Al cerrar sin confirmar se descartan.
+    - Los vecinos de los últimos TAMANO_CACHE_VECINOS nodos consultados se guardan en memoria, así un recorrido no repite la consulta de un nodo visitado varias veces.
+    - Agregar o eliminar nodos y aristas devuelve True o False en lugar de 1 o 0.
+    '''
+
+    def _buscarArista(self, *args, **kwargs) -> int:
+        '''
+        Devuelve la posición de la arista buscándola por su identificador o por su nodo origen y destino, o -1 si no existe.
+        '''
+        if len(args) == 1:
+            fila = self._conexion.execute('SELECT posicion FROM aristas WHERE id = ?', args).fetchone()
+        elif len(args) == 2:
+            fila = self._conexion.execute('SELECT posicion FROM aristas WHERE a = ? AND b = ? ORDER BY posicion LIMIT 1', args).fetchone()
+        else:
+            fila = None
+        return fila[0] if fila != None else -1
+
+    @staticmethod
+    def obtenerPadresNodo(idNodo: int, grafo: 'GrafoDirigidoSqlite') -> List[int]:
+        return grafo._consultarIds('SELECT a FROM aristas WHERE b = ? ORDER BY posicion', (idNodo,))
+
+    @staticmethod
+    def obtenerHijosNodo(idNodo: int, grafo: 'GrafoDirigidoSqlite') -> List[int]:
+        return list(grafo._idsVecinos(idNodo))
+
+    @staticmethod
+    def obtenerIndegreeNodo(idNodo: int, grafo: 'GrafoDirigidoSqlite') -> int:
+        return grafo._conexion.execute('SELECT COUNT(*) FROM aristas WHERE b = ?', (idNodo,)).fetchone()[0]
+
+    @staticmethod
+    def obtenerOutdegreeNodo(idNodo: int, grafo: 'GrafoDirigidoSqlite') -> int:
+        return grafo._conexion.execute('SELECT COUNT(*) FROM aristas WHERE a = ?', (idNodo,)).fetchone()[0]
+
+
+class GrafoNoDirigidoSqlite(_GrafoSqlite, GrafoNoDirigido):
+    '''
+    ---
+    GrafoNoDirigidoSqlite
+    ---
+
+    GrafoNoDirigido guardado en una base de datos SQLite, con las mismas características que GrafoDirigidoSqlite. Cada arista se guarda una sola vez y los vecinos de un nodo se obtienen con los índices de ambos extremos.
+    '''
+
+    def _consultarVecinos(self, idNodo: int) -> List[int]:
+        # Un lazo (a == b) aparece dos veces, igual que en GrafoNoDirigido
+        return self._consultarIds('SELECT b, posicion FROM aristas WHERE a = ? UNION ALL SELECT a, posicion FROM aristas WHERE b = ? ORDER BY 2', (idNodo, idNodo))
+
+    def _buscarArista(self, *args, **kwargs) -> int:
+        '''
+        Devuelve la posición de la arista buscándola por su identificador o por sus dos nodos en cualquier orden, o -1 si no existe.
+        '''
+        if len(args) == 1:
+            fila = self._conexion.execute('SELECT posicion FROM aristas WHERE id = ?', args).fetchone()
+        elif len(args) == 2:
+            fila = self._conexion.execute('SELECT MIN(posicion) FROM aristas WHERE (a = ? AND b = ?) OR (a = ? AND b = ?)', (args[0], args[1], args[1], args[0])).fetchone()
+        else:
+            fila = None
+        return fila[0] if fila != None and fila[0] != None else -1
+
+
+def abrirGrafoSqlite(ruta: str, tamanoCacheVecinos: int = TAMANO_CACHE_VECINOS) -> Union['GrafoDirigidoSqlite', 'GrafoNoDirigidoSqlite']:
+    '''
+    Abre una base de datos existente con la clase que corresponde al tipo de grafo que guarda.
+
+    Lanza ValueError si el archivo no es una base de datos de un grafo.
+    '''
+    fila = None
+    if os.path.isfile(ruta): # sqlite3.connect crearía una base de datos vacía
+        try:
+            conexion = sqlite3.connect(ruta)
+            try:
+                fila = conexion.execute("SELECT valor FROM propiedades WHERE clave = 'dirigido'").fetchone()
+            finally:
+                conexion.close()
+        except sqlite3.Error:
+            pass
+    if fila == None:
+        raise ValueError('El archivo no es una base de datos de un grafo')
+    return (GrafoDirigidoSqlite if fila[0] else GrafoNoDirigidoSqlite)(ruta, tamanoCacheVecinos)
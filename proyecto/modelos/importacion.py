@@ -0,0 +1,416 @@
+'''
+Importación de grafos desde listas de aristas (formato de SNAP) y desde las tablas CSV de Gephi que escribe exportarGrafo.
+
+Los archivos se leen por bloques de líneas completas y las aristas se acumulan en arreglos numéricos (array) en lugar de objetos, así la memoria usada durante la lectura no depende de la cantidad de líneas. Una lista de aristas sin comprimir se puede repartir por rangos de bytes entre varios procesos. Las tablas CSV se leen con un solo csv.reader sobre todo el archivo, porque un campo entre comillas puede contener saltos de línea y no se puede cortar el archivo en cualquier fin de línea. Al final el grafo se construye de una vez con Grafo.cargarMasivamente, sin la validación de agregarArista por cada arista.
+'''
+from .grafo import *
+from .compresion import comprimir, separarCompresion
+from array import array
+from itertools import chain, islice
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+import csv
+import gc
+import io
+import os
+import time
+
+TAMANO_BLOQUE = 1 << 22 # Cantidad de bytes que se leen del archivo en cada paso
+TAMANO_MINIMO_RANGO = 1 << 24 # Un archivo se reparte entre procesos solo en rangos de al menos este tamaño
+FILAS_POR_BLOQUE = 1 << 16 # Filas de una tabla CSV que se leen entre cada reporte de progreso
+COMENTARIOS = (b'#', b'%') # Inicio de las líneas de comentario en las listas de aristas
+
+NOMBRE_NODOS = 'nodos.csv'
+NOMBRE_ARISTAS = 'aristas.csv'
+
+
+class ResultadoImportacion:
+    '''
+    ---
+    ResultadoImportacion
+    ---
+
+    Resultado de importar un grafo.
+
+    ### Atributos:
+        - grafo: el grafo importado.
+        - filas: cantidad de filas de nodos y aristas leídas correctamente.
+        - descartadas: cantidad de filas que no se pudieron interpretar.
+        - tiempo: segundos que tomó la importación, incluida la construcción del grafo.
+    '''
+
+    def __init__(self, grafo: Union['GrafoDirigido', 'GrafoNoDirigido'], filas: int, descartadas: int, tiempo: float):
+        self.grafo = grafo
+        self.filas = filas
+        self.descartadas = descartadas
+        self.tiempo = tiempo
+
+    @property
+    def filasPorSegundo(self) -> float:
+        return self.filas / self.tiempo if self.tiempo > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f'ResultadoImportacion(nodos={len(self.grafo.nodos)}, aristas={len(self.grafo.aristas)}, filas={self.filas}, descartadas={self.descartadas}, tiempo={self.tiempo:.4f}s, filasPorSegundo={self.filasPorSegundo:.0f})'
+
+
+class _AristasLeidas:
+    '''
+    Aristas leídas de un archivo o de un rango de él, guardadas en arreglos paralelos. Es lo que devuelve cada proceso trabajador.
+    '''
+
+    def __init__(self, conIdentificadores: bool = False):
+        self.origenes = array('q')
+        self.destinos = array('q')
+        self.pesos = array('d')
+        self.identificadores = array('q') if conIdentificadores else None # Sin identificadores se numeran al construir el grafo
+        self.dirigido: Union[bool, None] = None # Solo se conoce si el archivo tiene la columna Type
+        self.descartadas = 0
+
+    def __len__(self) -> int:
+        return len(self.origenes)
+
+    def extender(self, otras: '_AristasLeidas') -> None:
+        self.origenes.extend(otras.origenes)
+        self.destinos.extend(otras.destinos)
+        self.pesos.extend(otras.pesos)
+        if self.identificadores != None:
+            self.identificadores.extend(otras.identificadores)
+        if self.dirigido == None:
+            self.dirigido = otras.dirigido
+        self.descartadas += otras.descartadas
+
+
+def _bloquesDeLineas(archivo: BinaryIO, fin: Union[int, None] = None, tamanoBloque: int = TAMANO_BLOQUE) -> Iterator[bytes]:
+    '''
+    Lee el archivo desde la posición actual en bloques que terminan en un fin de línea. Si se indica fin, se leen solamente las líneas que empiezan antes de esa posición; la última se lee completa aunque termine después.
+    '''
+    posicion = archivo.tell() if fin != None else 0
+    pendiente = b''
+    while fin == None or posicion < fin:
+        datos = archivo.read(tamanoBloque if fin == None else min(tamanoBloque, fin - posicion))
+        if not datos:
+            break
+        posicion += len(datos)
+        if fin != None and posicion >= fin and not datos.endswith(b'\n'):
+            datos += archivo.readline() # La última línea del rango pertenece a este rango
+        datos = pendiente + datos
+        corte = datos.rfind(b'\n') + 1
+        pendiente = datos[corte:]
+        if corte > 0:
+            yield datos[:corte]
+    if pendiente:
+        yield pendiente
+
+
+def _analizarListaAristas(bloque: bytes, leidas: '_AristasLeidas') -> None:
+    '''
+    Agrega las aristas de un bloque de una lista de aristas: una arista por línea con el origen, el destino y opcionalmente el peso separados por espacios o tabulaciones. Las líneas vacías y los comentarios se saltan y las líneas que no se pueden leer se cuentan como descartadas.
+
+    >>> leidas = _AristasLeidas()
+    >>> _analizarListaAristas(b'1 2\\n3\\n4 5 6\\n', leidas)
+    >>> list(leidas.origenes), list(leidas.destinos), list(leidas.pesos), leidas.descartadas
+    ([1, 4], [2, 5], [1.0, 6.0], 1)
+    >>> leidas = _AristasLeidas()
+    >>> _analizarListaAristas(b'1 2\\n\\n3 4 5 6\\n', leidas)
+    >>> list(leidas.origenes), list(leidas.destinos), list(leidas.pesos), leidas.descartadas
+    ([1, 3], [2, 4], [1.0, 5.0], 0)
+    '''
+    lineas = bloque.splitlines()
+    # Si todas las líneas tienen la misma cantidad de columnas y no hay comentarios, los números se convierten de una sola vez
+    cantidadColumnas = len(lineas[0].split()) if lineas else 0
+    if cantidadColumnas >= 2 and COMENTARIOS[0] not in bloque and COMENTARIOS[1] not in bloque and set(map(len, map(bytes.split, lineas))) == {cantidadColumnas}:
+        valores = bloque.split()
+        try:
+            origenes = array('q', map(int, valores[0::cantidadColumnas]))
+            destinos = array('q', map(int, valores[1::cantidadColumnas]))
+            if cantidadColumnas > 2:
+                pesos = array('d', map(float, valores[2::cantidadColumnas]))
+            else:
+                pesos = array('d', [1.0]) * len(lineas)
+        except ValueError:
+            pass
+        else:
+            leidas.origenes.extend(origenes)
+            leidas.destinos.extend(destinos)
+            leidas.pesos.extend(pesos)
+            return
+
+    for linea in lineas:
+        partes = linea.split()
+        if not partes or partes[0][:1] in COMENTARIOS:
+            continue
+        try:
+            origen, destino = int(partes[0]), int(partes[1])
+            peso = float(partes[2]) if len(partes) > 2 else 1.0
+        except (ValueError, IndexError):
+            leidas.descartadas += 1
+            continue
+        leidas.origenes.append(origen)
+        leidas.destinos.append(destino)
+        leidas.pesos.append(peso)
+
+
+def _analizarCsvAristas(filas: Iterable[List[str]], leidas: '_AristasLeidas', columnas: Dict[str, int]) -> None:
+    '''
+    Agrega las aristas de unas filas de una tabla de aristas de Gephi. Las columnas se ubican por nombre con _leerCsv.
+    '''
+    columnaOrigen, columnaDestino = columnas['source'], columnas['target']
+    columnaId, columnaPeso, columnaTipo = columnas.get('id'), columnas.get('weight'), columnas.get('type')
+    for fila in filas:
+        if not fila:
+            continue
+        try:
+            origen, destino = int(fila[columnaOrigen]), int(fila[columnaDestino])
+            peso = float(fila[columnaPeso]) if columnaPeso != None and fila[columnaPeso] != '' else 1.0
+            idArista = int(fila[columnaId]) if columnaId != None else 0
+        except (ValueError, IndexError):
+            leidas.descartadas += 1
+            continue
+        if leidas.dirigido == None and columnaTipo != None and columnaTipo < len(fila):
+            leidas.dirigido = fila[columnaTipo].strip().lower() != 'undirected'
+        leidas.origenes.append(origen)
+        leidas.destinos.append(destino)
+        leidas.pesos.append(peso)
+        if leidas.identificadores != None:
+            leidas.identificadores.append(idArista)
+
+
+def _leerCsv(comprimido: BinaryIO) -> Tuple[Dict[str, int], Iterator[List[str]]]:
+    '''
+    Devuelve la posición de cada columna de una tabla CSV por su nombre en minúsculas y un csv.reader con las filas restantes. Todo el archivo se lee con el mismo csv.reader, así los campos entre comillas con saltos de línea se interpretan bien sin importar dónde termina cada bloque leído del archivo.
+    '''
+    texto = io.TextIOWrapper(comprimido, encoding='utf-8-sig', newline='')
+    filas = csv.reader(texto)
+    encabezado = next(filas, [])
+    return {nombre.strip().lower(): i for i, nombre in enumerate(encabezado)}, filas
+
+
+def _leerRango(argumentos: Tuple[str, int, int]) -> '_AristasLeidas':
+    '''
+    Lee las aristas de las líneas que empiezan entre inicio y fin de una lista de aristas sin comprimir. Se ejecuta en los procesos trabajadores.
+    '''
+    ruta, inicio, fin = argumentos
+    leidas = _AristasLeidas()
+    with open(ruta, 'rb') as archivo:
+        if inicio > 0:
+            # Se descarta la línea que empezó en el rango anterior, si el byte anterior es un fin de línea no se descarta nada
+            archivo.seek(inicio - 1)
+            archivo.readline()
+        for bloque in _bloquesDeLineas(archivo, fin):
+            _analizarListaAristas(bloque, leidas)
+    return leidas
+
+
+def _leerCsvAristas(ruta: str, progreso: Union[Callable[[int, int], None], None]) -> '_AristasLeidas':
+    '''
+    Lee todas las aristas de una tabla CSV de Gephi en el proceso actual, por bloques de FILAS_POR_BLOQUE filas de un solo csv.reader.
+    '''
+    bytesTotales = os.path.getsize(ruta)
+    with open(ruta, 'rb') as archivo, comprimir(archivo, separarCompresion(ruta)[1], 'rb') as comprimido:
+        columnas, filas = _leerCsv(comprimido)
+        if 'source' not in columnas or 'target' not in columnas:
+            raise ValueError('La tabla de aristas debe tener las columnas Source y Target')
+        leidas = _AristasLeidas('id' in columnas)
+        while True:
+            bloque = list(islice(filas, FILAS_POR_BLOQUE))
+            if not bloque:
+                return leidas
+            _analizarCsvAristas(bloque, leidas, columnas)
+            if progreso != None:
+                progreso(archivo.tell(), bytesTotales)
+
+
+def _leerAristas(ruta: str, formato: str, procesos: Union[int, None], progreso: Union[Callable[[int, int], None], None]) -> '_AristasLeidas':
+    '''
+    Lee todas las aristas del archivo. Si es una lista de aristas sin comprimir y suficientemente grande se reparte en rangos de bytes entre los procesos. Las tablas CSV siempre se leen en el proceso actual, porque un corte en un fin de línea podría caer dentro de un campo entre comillas.
+    '''
+    if formato == 'csv':
+        return _leerCsvAristas(ruta, progreso)
+    compresion = separarCompresion(ruta)[1]
+    bytesTotales = os.path.getsize(ruta)
+    with open(ruta, 'rb') as archivo, comprimir(archivo, compresion, 'rb') as comprimido:
+        procesos = procesos or os.cpu_count() or 1
+        cantidadRangos = min(procesos * 4, bytesTotales // TAMANO_MINIMO_RANGO) # Varios rangos por proceso para reportar el progreso
+        if compresion != '' or procesos == 1 or cantidadRangos < 2:
+            leidas = _AristasLeidas()
+            for bloque in _bloquesDeLineas(comprimido):
+                _analizarListaAristas(bloque, leidas)
+                if progreso != None:
+                    progreso(archivo.tell(), bytesTotales)
+            return leidas
+
+    tamanoRango = -(-bytesTotales // cantidadRangos)
+    rangos = [(ruta, i, min(i + tamanoRango, bytesTotales)) for i in range(0, bytesTotales, tamanoRango)]
+    leidas = _AristasLeidas()
+    from multiprocessing import Pool
+    with Pool(min(procesos, len(rangos))) as pool:
+        # imap conserva el orden de los rangos, así las aristas quedan en el mismo orden que en el archivo
+        for (_, _, fin), parcial in zip(rangos, pool.imap(_leerRango, rangos)):
+            leidas.extender(parcial)
+            if progreso != None:
+                progreso(fin, bytesTotales)
+    return leidas
+
+
+def _leerNodos(ruta: str) -> Tuple['array', List[Any], int]:
+    '''
+    Lee una tabla de nodos de Gephi con las columnas Id y Label. Las etiquetas vacías se convierten en None.
+
+    Returns:
+        - Tuple[array, List[Any], int]: Identificadores, contenidos y cantidad de filas descartadas.
+    '''
+    identificadores = array('q')
+    contenidos = []
+    descartadas = 0
+    with open(ruta, 'rb') as archivo, comprimir(archivo, separarCompresion(ruta)[1], 'rb') as comprimido:
+        columnas, filas = _leerCsv(comprimido)
+        if 'id' not in columnas:
+            raise ValueError('La tabla de nodos debe tener la columna Id')
+        columnaId, columnaEtiqueta = columnas['id'], columnas.get('label')
+        for fila in filas:
+            if not fila:
+                continue
+            try:
+                identificadores.append(int(fila[columnaId]))
+            except (ValueError, IndexError):
+                descartadas += 1
+                continue
+            etiqueta = fila[columnaEtiqueta] if columnaEtiqueta != None and columnaEtiqueta < len(fila) else ''
+            contenidos.append(etiqueta if etiqueta != '' else None)
+    return identificadores, contenidos, descartadas
+
+
+def _construirGrafo(leidas: '_AristasLeidas', dirigido: bool, identificadores: 'array', contenidos: List[Any]) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+    '''
+    Construye el grafo con cargarMasivamente. Los nodos que aparecen en las aristas pero no en la tabla de nodos se agregan sin contenido, en orden de identificador.
+    '''
+    faltantes = set(leidas.origenes)
+    faltantes.update(leidas.destinos)
+    faltantes.difference_update(identificadores)
+    identificadoresAristas = leidas.identificadores if leidas.identificadores != None else range(1, len(leidas) + 1)
+    grafo = GrafoDirigido() if dirigido else GrafoNoDirigido()
+    # Mientras se crean millones de nodos y aristas el recolector de ciclos se ejecutaría una y otra vez sin liberar nada, pausarlo reduce el tiempo a la mitad
+    recolectorActivo = gc.isenabled()
+    gc.disable()
+    try:
+        grafo.cargarMasivamente(
+            chain(map(Nodo, identificadores, contenidos), map(Nodo, sorted(faltantes))),
+            map(Arista, identificadoresAristas, leidas.origenes, leidas.destinos, leidas.pesos)
+        )
+    finally:
+        if recolectorActivo:
+            gc.enable()
+    return grafo
+
+
+class ImportadorGrafos:
+    '''
+    ---
+    ImportadorGrafos
+    ---
+
+    Clase que proporciona métodos para importar grafos grandes desde archivos de otras aplicaciones.
+
+    Los formatos aceptados son:
+        - Lista de aristas (SNAP): una arista por línea con el identificador del origen, el del destino y opcionalmente el peso, separados por espacios o tabulaciones. Las líneas que empiezan con # o % son comentarios.
+        - CSV de Gephi: la tabla de aristas con las columnas Source, Target y opcionalmente Type, Id y Weight, y la tabla de nodos con Id y Label. Es el mismo formato de nodos.csv y aristas.csv que escribe exportarGrafo.
+
+    Cualquiera de los archivos puede estar comprimido con gzip, bz2 o xz (aristas.csv.gz).
+
+    ---
+    ### Métodos:
+
+    - importar
+    - importarListaAristas
+    - importarCsv
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    resultado = ImportadorGrafos.importar('web-Google.txt', dirigido=True, procesos=4)
+    print(f'{resultado.filasPorSegundo:.0f} filas por segundo')
+    grafo = resultado.grafo
+    ```
+
+    ---
+    Notas:
+    ---
+    - Solo las listas de aristas sin comprimir se pueden repartir entre procesos. Los archivos comprimidos y las tablas CSV se leen en el proceso actual.
+    - Las filas que no se pueden interpretar se descartan y se cuentan en el resultado.
+    '''
+
+    @staticmethod
+    def importarListaAristas(ruta: str, dirigido: bool = True, procesos: Union[int, None] = 1, progreso: Union[Callable[[int, int], None], None] = None) -> 'ResultadoImportacion':
+        '''
+        ---
+        Importa un grafo desde una lista de aristas.
+
+        ---
+        Args:
+        ---
+        - ruta: Archivo con la lista de aristas.
+        - dirigido: Si el grafo es dirigido, la lista de aristas no lo indica.
+        - procesos: Cantidad de procesos que leen el archivo. Con None se usa la cantidad de CPUs y con 1 se lee en el proceso actual.
+        - progreso: Función que se llama con los bytes leídos y los bytes totales del archivo.
+
+        ---
+        Returns:
+        ---
+        - ResultadoImportacion: El grafo y las estadísticas de la importación. Los nodos se crean sin contenido.
+        '''
+        inicio = time.perf_counter()
+        leidas = _leerAristas(ruta, 'lista', procesos, progreso)
+        grafo = _construirGrafo(leidas, dirigido, array('q'), [])
+        return ResultadoImportacion(grafo, len(leidas), leidas.descartadas, time.perf_counter() - inicio)
+
+    @staticmethod
+    def importarCsv(rutaAristas: str, rutaNodos: Union[str, None] = None, dirigido: bool = True, procesos: Union[int, None] = 1, progreso: Union[Callable[[int, int], None], None] = None) -> 'ResultadoImportacion':
+        '''
+        ---
+        Importa un grafo desde las tablas CSV de nodos y aristas de Gephi.
+
+        ---
+        Args:
+        ---
+        - rutaAristas: Tabla de aristas.
+        - rutaNodos: Tabla de nodos, si es None los nodos se crean sin contenido a partir de las aristas.
+        - dirigido: Se usa solo si la tabla de aristas no tiene la columna Type.
+        - procesos: Se acepta igual que en importarListaAristas, pero las tablas CSV se leen siempre en el proceso actual porque sus campos entre comillas pueden contener saltos de línea.
+        - progreso: Función que se llama con los bytes leídos y los bytes totales de la tabla de aristas.
+
+        ---
+        Returns:
+        ---
+        - ResultadoImportacion: El grafo y las estadísticas de la importación.
+        '''
+        inicio = time.perf_counter()
+        identificadores, contenidos, descartadas = _leerNodos(rutaNodos) if rutaNodos != None else (array('q'), [], 0)
+        leidas = _leerAristas(rutaAristas, 'csv', procesos, progreso)
+        grafo = _construirGrafo(leidas, leidas.dirigido if leidas.dirigido != None else dirigido, identificadores, contenidos)
+        return ResultadoImportacion(grafo, len(identificadores) + len(leidas), descartadas + leidas.descartadas, time.perf_counter() - inicio)
+
+    @staticmethod
+    def importar(ruta: str, dirigido: bool = True, procesos: Union[int, None] = 1, progreso: Union[Callable[[int, int], None], None] = None) -> 'ResultadoImportacion':
+        '''
+        ---
+        Importa un grafo escogiendo el formato por la ruta.
+
+        ---
+        Descripción:
+        ---
+        - Una carpeta debe tener aristas.csv y opcionalmente nodos.csv, comprimidos o no, como las que crea exportarGrafo.
+        - Un archivo .csv se importa como tabla de aristas de Gephi.
+        - Cualquier otro archivo se importa como lista de aristas.
+
+        Los demás argumentos son los de importarListaAristas e importarCsv.
+
+        Lanza ValueError si la carpeta no tiene la tabla de aristas o si falta una columna obligatoria.
+        '''
+        if os.path.isdir(ruta):
+            archivos = {separarCompresion(nombre)[0]: os.path.join(ruta, nombre) for nombre in os.listdir(ruta)}
+            if NOMBRE_ARISTAS not in archivos:
+                raise ValueError(f'La carpeta no tiene el archivo {NOMBRE_ARISTAS}')
+            return ImportadorGrafos.importarCsv(archivos[NOMBRE_ARISTAS], archivos.get(NOMBRE_NODOS), dirigido, procesos, progreso)
+        if separarCompresion(ruta)[0].lower().endswith('.csv'):
+            return ImportadorGrafos.importarCsv(ruta, None, dirigido, procesos, progreso)
+        return ImportadorGrafos.importarListaAristas(ruta, dirigido, procesos, progreso)
@@ -0,0 +1,275 @@
+'''
+Instrumentación opcional para saber en qué se va el tiempo de una acción: llamadas y tiempo de cada método de los grafos y algoritmos, fases marcadas con fase(), pico de memoria con tracemalloc y, si se pide, un perfil de cProfile de cada ejecución envuelta con perfilado().
+
+Mientras está desactivada los métodos son los originales, sin envolver, así que no agrega ningún costo. Al activarla se reemplazan los métodos de las clases de OBJETIVOS por versiones que cuentan sus llamadas, y al desactivarla se restauran.
+
+Se activa desde el menú de instrumentación o con la variable de entorno PROYECTO_INSTRUMENTACION, que acepta "1" (solo contadores) o una lista separada por comas con "memoria" y "perfil":
+
+    PROYECTO_INSTRUMENTACION=memoria,perfil python -m proyecto bfs --grafo grafo1 --desde 1
+
+Con la variable de entorno el reporte se muestra en la salida de errores al terminar el programa.
+'''
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+import functools
+import importlib
+import io
+import os
+import sys
+import threading
+import time
+import types
+
+VARIABLE_ENTORNO = 'PROYECTO_INSTRUMENTACION'
+
+# (módulo, clase, métodos). Con None se envuelven todos los métodos y métodos estáticos definidos en la clase, salvo los especiales (__x__)
+OBJETIVOS: List[Tuple[str, str, Union[Tuple[str, ...], None]]] = [
+    ('.grafo', 'Grafo', None),
+    ('.grafo', 'GrafoDirigido', None),
+    ('.grafo', 'GrafoNoDirigido', None),
+    ('.mapeado', 'GrafoMapeado', None),
+    ('.grafoSqlite', '_GrafoSqlite', None),
+    ('.grafoSqlite', 'GrafoDirigidoSqlite', None),
+    ('.grafoSqlite', 'GrafoNoDirigidoSqlite', None),
+    ('.adyacencia', 'Adyacencia', None),
+    ('.bfs', 'AlgoritmoBFS', None),
+    ('.dfs', 'AlgoritmoDFS', None),
+    ('.rutas', 'AlgoritmoDijkstra', None),
+    ('.rutas', 'AlgoritmoAEstrella', None),
+    ('.centralidad', 'AnalisisCentralidad', None),
+    ('.triangulos', 'AlgoritmoTriangulos', None),
+    ('.lectorJson', 'LectorGrafoJson', ('leer',)), # Sus métodos internos se llaman una vez por carácter
+    ('.diario', 'DiarioEdicion', None),
+    ('.cache', 'CacheGrafos', None),
+    ('.catalogo', 'CatalogoGrafos', None),
+    ('.importacion', 'ImportadorGrafos', None),
+    ('.compartido', 'ArreglosCompartidos', None),
+]
+
+_activa = False
+_originales: List[Tuple[type, str, Any]] = [] # (clase, nombre, atributo original) para restaurar al desactivar
+_contadores: Dict[str, List] = {} # nombre -> [llamadas, tiempo total, tiempo propio]
+_cerrojo = threading.Lock()
+_local = threading.local() # Pila de tiempos de los hijos de cada llamada en curso, una por hilo
+_memoria = False
+_memoriaFinal: Union[Tuple[int, int], None] = None # (actual, pico) al desactivar
+_perfil = False
+_estadisticasPerfil: Any = None # pstats.Stats con todas las ejecuciones perfiladas
+_perfilEnCurso = False
+
+
+def _registrar(nombre: str, total: float, propio: float) -> None:
+    with _cerrojo:
+        contador = _contadores.get(nombre)
+        if contador == None:
+            contador = _contadores[nombre] = [0, 0.0, 0.0]
+        contador[0] += 1
+        contador[1] += total
+        contador[2] += propio
+
+
+def _medir(nombre: str, funcion: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    '''
+    Ejecuta la función y registra su tiempo total y su tiempo propio (sin contar las llamadas instrumentadas que hace).
+    '''
+    pila = getattr(_local, 'pila', None)
+    if pila == None:
+        pila = _local.pila = []
+    pila.append(0.0)
+    inicio = time.perf_counter()
+    try:
+        return funcion(*args, **kwargs)
+    finally:
+        total = time.perf_counter() - inicio
+        hijos = pila.pop()
+        if pila:
+            pila[-1] += total
+        _registrar(nombre, total, total - hijos)
+
+
+def _envolver(nombre: str, funcion: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(funcion)
+    def envuelta(*args, **kwargs):
+        return _medir(nombre, funcion, args, kwargs)
+    return envuelta
+
+
+def _instrumentarClase(clase: type, metodos: Union[Tuple[str, ...], None]) -> None:
+    for nombre, atributo in list(vars(clase).items()):
+        if (metodos != None and nombre not in metodos) or (nombre.startswith('__') and nombre.endswith('__')):
+            continue
+        if getattr(atributo, '__isabstractmethod__', False):
+            continue
+        etiqueta = f'{clase.__name__}.{nombre}'
+        if isinstance(atributo, staticmethod):
+            nuevo = staticmethod(_envolver(etiqueta, atributo.__func__))
+        elif isinstance(atributo, types.FunctionType):
+            nuevo = _envolver(etiqueta, atributo)
+        else: # Propiedades, métodos de clase y atributos
+            continue
+        _originales.append((clase, nombre, atributo))
+        setattr(clase, nombre, nuevo)
+
+
+def estaActiva() -> bool:
+    return _activa
+
+
+def activar(memoria: bool = False, perfil: bool = False) -> None:
+    '''
+    ---
+    Empieza a contar las llamadas de los métodos de OBJETIVOS y de las fases.
+
+    ---
+    Args:
+    ---
+    - memoria: Registra el pico de memoria con tracemalloc. Hace bastante más lentas las asignaciones de memoria.
+    - perfil: Las funciones envueltas con perfilado() se ejecutan con cProfile y sus estadísticas se suman en el reporte.
+
+    ---
+    Notas:
+    ---
+    - Si ya estaba activa solo se agregan la memoria o el perfil pedidos.
+    '''
+    global _activa, _memoria, _memoriaFinal, _perfil
+    if memoria and not _memoria:
+        import tracemalloc
+        tracemalloc.start()
+        _memoria = True
+        _memoriaFinal = None
+    _perfil = _perfil or perfil
+    if _activa:
+        return
+    for modulo, clase, metodos in OBJETIVOS:
+        _instrumentarClase(getattr(importlib.import_module(modulo, __package__), clase), metodos)
+    _activa = True
+
+
+def desactivar() -> None:
+    '''
+    Restaura los métodos originales y detiene tracemalloc. Los contadores se conservan para el reporte hasta llamar a reiniciar.
+    '''
+    global _activa, _memoria, _memoriaFinal, _perfil
+    for clase, nombre, atributo in reversed(_originales):
+        setattr(clase, nombre, atributo)
+    _originales.clear()
+    if _memoria:
+        import tracemalloc
+        _memoriaFinal = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    _activa = _memoria = _perfil = False
+
+
+def reiniciar() -> None:
+    '''
+    Borra los contadores, el perfil acumulado y el pico de memoria.
+    '''
+    global _estadisticasPerfil, _memoriaFinal
+    with _cerrojo:
+        _contadores.clear()
+    _estadisticasPerfil = None
+    _memoriaFinal = None
+    if _memoria:
+        import tracemalloc
+        tracemalloc.reset_peak()
+
+
+@contextmanager
+def fase(nombre: str) -> Iterator[None]:
+    '''
+    Cuenta el bloque como una llamada más de nombre, por ejemplo una etapa de una función que no es un método de OBJETIVOS. Si la instrumentación está desactivada no hace nada.
+
+    ```python
+    with fase('leer JSON'):
+        grafo = LectorGrafoJson(archivo).leer()
+    ```
+    '''
+    if not _activa:
+        yield
+        return
+    pila = getattr(_local, 'pila', None)
+    if pila == None:
+        pila = _local.pila = []
+    pila.append(0.0)
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        total = time.perf_counter() - inicio
+        hijos = pila.pop()
+        if pila:
+            pila[-1] += total
+        _registrar(f'[fase] {nombre}', total, total - hijos)
+
+
+def perfilado(funcion: Callable[..., Any]) -> Callable[..., Any]:
+    '''
+    Devuelve una función que ejecuta funcion con cProfile si el perfil está activo y suma sus estadísticas al reporte. Si el perfil no está activo, o ya hay otra ejecución perfilándose, la ejecuta normalmente.
+    '''
+    @functools.wraps(funcion)
+    def ejecutar(*args, **kwargs):
+        global _estadisticasPerfil, _perfilEnCurso
+        with _cerrojo:
+            perfilar = _perfil and not _perfilEnCurso
+            _perfilEnCurso = _perfilEnCurso or perfilar
+        if not perfilar:
+            return funcion(*args, **kwargs)
+        import cProfile
+        import pstats
+        perfil = cProfile.Profile()
+        try:
+            return perfil.runcall(funcion, *args, **kwargs)
+        finally:
+            with _cerrojo:
+                if _estadisticasPerfil == None:
+                    _estadisticasPerfil = pstats.Stats(perfil)
+                else:
+                    _estadisticasPerfil.add(perfil)
+                _perfilEnCurso = False
+    return ejecutar
+
+
+def reporte(limite: int = 25) -> str:
+    '''
+    Devuelve el reporte en texto: las operaciones con más tiempo propio, la memoria actual y el pico, y las funciones con más tiempo acumulado según el perfil.
+    '''
+    lineas = []
+    with _cerrojo:
+        filas = sorted(_contadores.items(), key=lambda fila: fila[1][2], reverse=True)
+    if filas:
+        lineas.append(f'{"Operación":<48}{"Llamadas":>10}{"Total (s)":>12}{"Propio (s)":>12}{"Promedio (µs)":>15}')
+        for nombre, (llamadas, total, propio) in filas[:limite]:
+            lineas.append(f'{nombre:<48}{llamadas:>10}{total:>12.4f}{propio:>12.4f}{total / llamadas * 1e6:>15.1f}')
+        if len(filas) > limite:
+            lineas.append(f'... y {len(filas) - limite} operaciones más')
+    else:
+        lineas.append('No hay operaciones registradas.' if _activa else 'La instrumentación no está activa.')
+
+    memoria = _memoriaFinal
+    if _memoria:
+        import tracemalloc
+        memoria = tracemalloc.get_traced_memory()
+    if memoria != None:
+        lineas.append(f'\nMemoria: actual {memoria[0] / 2**20:.1f} MiB, pico {memoria[1] / 2**20:.1f} MiB')
+
+    if _estadisticasPerfil != None:
+        texto = io.StringIO()
+        _estadisticasPerfil.stream = texto
+        _estadisticasPerfil.sort_stats('cumulative').print_stats(limite)
+        lineas.append(f'\nPerfil ({limite} funciones con más tiempo acumulado):')
+        lineas.append(texto.getvalue().strip())
+    return '\n'.join(lineas)
+
+
+def activarDesdeEntorno() -> bool:
+    '''
+    Activa la instrumentación si está definida la variable de entorno PROYECTO_INSTRUMENTACION y muestra el reporte en la salida de errores al terminar el programa. Devuelve True si se activó.
+    '''
+    valor = os.environ.get(VARIABLE_ENTORNO, '').strip().lower()
+    if valor in ('', '0', 'no') or _activa:
+        return False
+    opciones = {opcion.strip() for opcion in valor.split(',')}
+    activar('memoria' in opciones, 'perfil' in opciones)
+    import atexit
+    atexit.register(lambda: print('\n' + reporte(), file=sys.stderr))
+    return True
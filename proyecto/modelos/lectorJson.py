@@ -0,0 +1,202 @@
+from .grafo import *
+from collections import deque
+from typing import Any, BinaryIO, Callable, Deque, Iterator, Tuple, Union
+import codecs
+import json
+import os
+import re
+
+TAMANO_BLOQUE = 1 << 20 # Cantidad de bytes que se leen del archivo en cada paso
+ESPACIOS = re.compile(r'[ \t\n\r]*')
+
+
+class LectorGrafoJson:
+    '''
+    ---
+    LectorGrafoJson
+    ---
+
+    Lector incremental de los grafos guardados en JSON por guardarGrafo. A diferencia de json.load, no carga todo el texto del archivo ni construye la lista completa de diccionarios de nodos y aristas: lee el archivo por bloques, decodifica cada nodo y cada arista por separado con json.JSONDecoder.raw_decode y los entrega inmediatamente al grafo con Grafo.cargarMasivamente. Así la memoria máxima queda cerca del tamaño del grafo final más un bloque de texto.
+
+    El formato del archivo no cambia, se espera un objeto con las claves "dirigido", "nodos" y "aristas". Si las aristas aparecen antes que los nodos se guardan temporalmente hasta terminar de leer los nodos.
+
+    ---
+    ### Métodos:
+
+    - leer
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    with open('grafo1.json', 'rb') as archivo:
+        grafo = LectorGrafoJson(archivo, progreso=lambda leidos, total: print(leidos, total)).leer()
+    ```
+    '''
+
+    def __init__(self, archivo: BinaryIO, progreso: Union[Callable[[int, int], None], None] = None, bytesTotales: Union[int, None] = None, tamanoBloque: int = TAMANO_BLOQUE):
+        '''
+        Args:
+            - archivo: Archivo abierto en modo binario ('rb').
+            - progreso: Función que se llama después de leer cada bloque con los bytes leídos y los bytes totales.
+            - bytesTotales: Tamaño del archivo para reportar el progreso, si es None se intenta obtener del archivo.
+            - tamanoBloque: Cantidad de bytes que se leen en cada paso.
+        '''
+        self.archivo = archivo
+        self.progreso = progreso
+        self.tamanoBloque = tamanoBloque
+        self.bytesLeidos = 0
+        if bytesTotales == None:
+            try:
+                bytesTotales = os.fstat(archivo.fileno()).st_size
+            except (AttributeError, OSError, ValueError):
+                bytesTotales = 0
+        self.bytesTotales = bytesTotales
+        self._decodificadorTexto = codecs.getincrementaldecoder('utf-8')()
+        self._decodificadorJson = json.JSONDecoder()
+        self._texto = ''
+        self._posicion = 0
+        self._finArchivo = False
+
+    def _leerBloque(self) -> bool:
+        '''
+        Agrega un bloque del archivo al texto pendiente. Devuelve False si ya no queda nada por leer.
+        '''
+        if self._finArchivo:
+            return False
+        datos = self.archivo.read(self.tamanoBloque)
+        self.bytesLeidos += len(datos)
+        if not datos:
+            self._finArchivo = True
+            self._texto = self._texto[self._posicion:] + self._decodificadorTexto.decode(b'', final=True)
+        else:
+            # Se descarta el texto ya procesado para no acumular el archivo completo en memoria
+            self._texto = self._texto[self._posicion:] + self._decodificadorTexto.decode(datos)
+        self._posicion = 0
+        if self.progreso != None:
+            self.progreso(self.bytesLeidos, self.bytesTotales)
+        return True
+
+    def _siguienteCaracter(self) -> str:
+        '''
+        Salta los espacios en blanco y devuelve el siguiente caracter sin consumirlo, o una cadena vacía al final del archivo.
+        '''
+        while True:
+            posicion = ESPACIOS.match(self._texto, self._posicion).end()
+            self._posicion = posicion
+            if posicion < len(self._texto):
+                return self._texto[posicion]
+            if not self._leerBloque():
+                return ''
+
+    def _consumir(self, caracter: str) -> None:
+        if self._siguienteCaracter() != caracter:
+            raise ValueError(f"Se esperaba '{caracter}' en el archivo del grafo")
+        self._posicion += 1
+
+    def _leerValor(self) -> Any:
+        '''
+        Decodifica el siguiente valor JSON completo, leyendo más bloques si el valor quedó cortado al final del texto pendiente.
+        '''
+        self._siguienteCaracter()
+        while True:
+            try:
+                valor, fin = self._decodificadorJson.raw_decode(self._texto, self._posicion)
+                # Un número al final del texto podría continuar en el siguiente bloque
+                if fin < len(self._texto) or self._finArchivo:
+                    self._posicion = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self._finArchivo:
+                    raise
+            self._leerBloque()
+
+    def _eventos(self) -> Iterator[Tuple]:
+        '''
+        Recorre el objeto principal del archivo y genera una tupla por cada dato encontrado: ('dirigido', valor), ('nodo', dict), ('finNodos',), ('arista', dict) y ('finAristas',).
+        '''
+        self._consumir('{')
+        if self._siguienteCaracter() == '}':
+            return
+        while True:
+            clave = self._leerValor()
+            self._consumir(':')
+            if clave in ('nodos', 'aristas') and self._siguienteCaracter() == '[':
+                tipo = 'nodo' if clave == 'nodos' else 'arista'
+                self._consumir('[')
+                if self._siguienteCaracter() == ']':
+                    self._posicion += 1
+                else:
+                    while True:
+                        yield (tipo, self._leerValor())
+                        if self._siguienteCaracter() == ',':
+                            self._posicion += 1
+                        else:
+                            self._consumir(']')
+                            break
+                yield ('finNodos',) if clave == 'nodos' else ('finAristas',)
+            else:
+                valor = self._leerValor()
+                if clave == 'dirigido':
+                    yield ('dirigido', valor)
+            if self._siguienteCaracter() == ',':
+                self._posicion += 1
+            else:
+                self._consumir('}')
+                return
+
+    def leer(self) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+        '''
+        ---
+        Lee el archivo completo y devuelve el grafo reconstruido.
+
+        ---
+        Returns:
+        ---
+        - GrafoDirigido | GrafoNoDirigido: El grafo guardado en el archivo.
+
+        Lanza ValueError si el archivo no tiene el formato esperado.
+        '''
+        eventos = self._eventos()
+        anteriores: Deque[Tuple] = deque() # Eventos que aparecieron antes de saber si el grafo es dirigido
+        dirigido = None
+        for evento in eventos:
+            if evento[0] == 'dirigido':
+                dirigido = evento[1]
+                break
+            anteriores.append(evento)
+        if dirigido == None:
+            raise ValueError('El archivo del grafo no indica si es dirigido')
+
+        def siguiente() -> Union[Tuple, None]:
+            if anteriores:
+                return anteriores.popleft()
+            return next(eventos, None)
+
+        aristasPendientes: Deque[Tuple] = deque()
+
+        def nodos() -> Iterator['Nodo']:
+            while True:
+                evento = siguiente()
+                if evento == None or evento[0] == 'finNodos':
+                    return
+                if evento[0] == 'nodo':
+                    yield Nodo(evento[1]['identificador'], evento[1]['contenido'])
+                else:
+                    aristasPendientes.append(evento) # Aristas escritas antes que los nodos
+
+        def aristas() -> Iterator['Arista']:
+            while True:
+                evento = aristasPendientes.popleft() if aristasPendientes else siguiente()
+                if evento == None or evento[0] == 'finAristas':
+                    return
+                if evento[0] == 'arista':
+                    datos = evento[1]
+                    # Los grafos guardados antes de existir los pesos no tienen la clave 'peso'
+                    yield Arista(datos['identificador'], datos['a'], datos['b'], datos.get('peso', 1))
+
+        grafo = GrafoDirigido() if dirigido else GrafoNoDirigido()
+        grafo.cargarMasivamente(nodos(), aristas())
+        for _ in eventos: # Se verifica que el resto del archivo sea válido
+            pass
+        return grafo
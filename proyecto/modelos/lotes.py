@@ -0,0 +1,234 @@
+'''
+Ejecución de muchas consultas de recorridos y rutas sobre un mismo grafo, leídas de un archivo JSONL (una consulta por línea):
+
+    {"op": "bfs", "desde": 1, "hasta": 9}           ruta más corta en saltos (sin "hasta": recorrido BFS)
+    {"op": "dfs", "desde": 1, "hasta": 9}           ruta DFS (sin "hasta": recorrido DFS)
+    {"op": "ruta", "desde": 1, "hasta": 9}          ruta de menor costo con Dijkstra
+    {"op": "ruta_corta", "desde": 1, "hasta": 9}    igual que bfs con "hasta", que en este caso es obligatorio
+
+Las consultas se procesan por bloques de TAMANO_LOTE líneas. En cada bloque las consultas repetidas se resuelven una sola vez y las que salen del mismo nodo se agrupan, así un solo recorrido desde ese nodo responde todas sus rutas. Los resultados se escriben en el mismo orden de las consultas a medida que termina cada bloque, por lo que la memoria usada depende del tamaño del bloque y no de la cantidad de consultas.
+'''
+from .grafo import *
+from .adyacencia import Adyacencia
+from .compartido import adyacenciaTrabajador, compartirAdyacencia, iniciarTrabajador
+from .bfs import AlgoritmoBFS
+from .dfs import AlgoritmoDFS
+from .rutas import AlgoritmoDijkstra
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, TextIO, Tuple, Union
+import json
+import os
+import time
+
+TAMANO_LOTE = 100000 # Consultas que se leen, agrupan y responden juntas
+OPERACIONES = ('bfs', 'dfs', 'ruta')
+ALIAS = {'ruta_corta': 'bfs'} # Otros nombres aceptados en el campo op
+
+def _rutaHasta(adyacencia: 'Adyacencia', padres: Union['array', Dict[int, int]], fin: int) -> List[int]:
+    ruta = []
+    while fin >= 0:
+        ruta.append(adyacencia.ids[fin])
+        fin = padres[fin]
+    return ruta[::-1]
+
+
+def _resolverGrupo(grupo: Tuple[str, int, List[Union[int, None]]], adyacencia: Union['Adyacencia', None] = None) -> List[Tuple[tuple, Dict[str, Any]]]:
+    '''
+    Responde con un solo recorrido todas las consultas de una operación que salen del mismo nodo. Si no se pasa la adyacencia se utiliza la del proceso trabajador.
+
+    Returns:
+        - List[Tuple[tuple, Dict[str, Any]]]: ((op, desde, hasta), resultado) de cada destino del grupo.
+    '''
+    if adyacencia == None:
+        adyacencia = adyacenciaTrabajador()
+    operacion, desde, destinos = grupo
+    posiciones = adyacencia.posiciones
+    inicio = posiciones.get(desde, -1)
+    if inicio == -1:
+        return [((operacion, desde, hasta), {'error': f'No existe el nodo {desde}'}) for hasta in destinos]
+
+    resultados = []
+    if operacion == 'ruta':
+        # Con un solo destino la búsqueda se detiene al llegar a él
+        fin = posiciones.get(destinos[0], -1) if len(destinos) == 1 else -1
+        try:
+            distancias, padres = AlgoritmoDijkstra.calcularArbolPorPosicion(adyacencia, inicio, fin)
+        except ValueError as e:
+            return [((operacion, desde, hasta), {'error': str(e)}) for hasta in destinos]
+        for hasta in destinos:
+            posicion = posiciones.get(hasta, -1)
+            if posicion not in distancias: # Solo tiene las posiciones alcanzadas
+                resultados.append(((operacion, desde, hasta), {'ruta': None}))
+            else:
+                resultados.append(((operacion, desde, hasta), {'ruta': _rutaHasta(adyacencia, padres, posicion), 'costo': distancias[posicion]}))
+        return resultados
+
+    orden, padres = (AlgoritmoBFS if operacion == 'bfs' else AlgoritmoDFS).calcularArbolPorPosicion(adyacencia, inicio)
+    for hasta in destinos:
+        if hasta == None:
+            resultados.append(((operacion, desde, hasta), {'recorrido': [adyacencia.ids[i] for i in orden]}))
+            continue
+        posicion = posiciones.get(hasta, -1)
+        if posicion == -1 or padres[posicion] == -2:
+            resultados.append(((operacion, desde, hasta), {'ruta': None}))
+        else:
+            resultados.append(((operacion, desde, hasta), {'ruta': _rutaHasta(adyacencia, padres, posicion)}))
+    return resultados
+
+
+def _leerConsulta(linea: str) -> Tuple[Dict[str, Any], Union[tuple, None]]:
+    '''
+    Interpreta una línea y devuelve los campos que se repiten en la respuesta y la clave (op, desde, hasta) de la consulta. Lanza ValueError si la consulta no es válida.
+    '''
+    consulta = json.loads(linea)
+    if type(consulta) != dict:
+        raise ValueError('La consulta debe ser un objeto JSON')
+    respuesta = {'id': consulta['id']} if 'id' in consulta else {}
+    operacion = consulta.get('op')
+    desde = consulta.get('desde')
+    hasta = consulta.get('hasta')
+    if operacion not in OPERACIONES and operacion not in ALIAS:
+        raise ValueError(f'Operación desconocida: {operacion}')
+    if type(desde) != int or (hasta != None and type(hasta) != int):
+        raise ValueError('Los campos desde y hasta deben ser identificadores enteros')
+    if operacion in ('ruta', 'ruta_corta') and hasta == None:
+        raise ValueError(f'La operación {operacion} necesita el campo hasta')
+    respuesta['op'] = operacion # La respuesta repite el nombre usado en la consulta, aunque sea un alias
+    respuesta['desde'] = desde
+    if hasta != None:
+        respuesta['hasta'] = hasta
+    return respuesta, (ALIAS.get(operacion, operacion), desde, hasta)
+
+
+class ResultadoLote:
+    '''
+    ---
+    ResultadoLote
+    ---
+
+    Resumen de una ejecución de ConsultasPorLotes.ejecutar.
+
+    ### Atributos:
+        - consultas: cantidad de consultas leídas (sin contar las líneas vacías).
+        - unicas: consultas distintas que se resolvieron, las repetidas de un mismo bloque se resuelven una vez.
+        - recorridos: recorridos o búsquedas que se hicieron, uno por cada nodo de inicio y operación de cada bloque.
+        - errores: consultas que no se pudieron interpretar o responder.
+        - tiempo: segundos que tomó la ejecución.
+    '''
+
+    def __init__(self, consultas: int, unicas: int, recorridos: int, errores: int, tiempo: float):
+        self.consultas = consultas
+        self.unicas = unicas
+        self.recorridos = recorridos
+        self.errores = errores
+        self.tiempo = tiempo
+
+    @property
+    def consultasPorSegundo(self) -> float:
+        return self.consultas / self.tiempo if self.tiempo > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f'ResultadoLote(consultas={self.consultas}, unicas={self.unicas}, recorridos={self.recorridos}, errores={self.errores}, tiempo={self.tiempo:.4f}s, consultasPorSegundo={self.consultasPorSegundo:.0f})'
+
+
+class ConsultasPorLotes:
+    '''
+    ---
+    ConsultasPorLotes
+    ---
+
+    Clase que ejecuta archivos de consultas sobre la adyacencia de un grafo ya cargado.
+
+    ---
+    ### Métodos:
+
+    - ejecutar
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    adyacencia = Adyacencia.obtener(grafo)
+    with open('consultas.jsonl') as entrada, open('resultados.jsonl', 'w') as salida:
+        resultado = ConsultasPorLotes.ejecutar(adyacencia, entrada, salida, procesos=4)
+    print(resultado.consultasPorSegundo)
+    ```
+    '''
+
+    @staticmethod
+    def ejecutar(adyacencia: 'Adyacencia', lineas: Iterable[str], salida: TextIO, procesos: Union[int, None] = 1, progreso: Union[Callable[[int], None], None] = None) -> 'ResultadoLote':
+        '''
+        ---
+        Responde las consultas de cada línea y escribe una respuesta JSON por línea en salida.
+
+        ---
+        Args:
+        ---
+        - adyacencia: Adyacencia del grafo sobre el que se hacen las consultas.
+        - lineas: Líneas JSONL con las consultas, por ejemplo un archivo abierto o sys.stdin.
+        - salida: Archivo de texto donde se escriben las respuestas.
+        - procesos: Procesos que resuelven los grupos de cada bloque, None para usar todos los núcleos. La adyacencia se les pasa por memoria compartida, sin copiarla a cada proceso.
+        - progreso: Función que recibe la cantidad de consultas respondidas después de cada bloque.
+
+        ---
+        Descripción:
+        ---
+        Cada respuesta tiene el número de línea de la consulta ("linea"), su "id" si lo tenía, la operación, los nodos y el resultado ("ruta", "costo" o "recorrido") o un "error". Las respuestas de un bloque se escriben en el orden de sus consultas.
+        '''
+        inicio = time.perf_counter()
+        procesos = procesos or os.cpu_count() or 1
+        consultas = unicas = recorridos = errores = 0
+        numeradas = enumerate(lineas, 1)
+        pool = compartidos = None
+        if procesos > 1:
+            from multiprocessing import Pool
+            compartidos = compartirAdyacencia(adyacencia)
+            pool = Pool(procesos, initializer=iniciarTrabajador, initargs=(compartidos.descriptor,))
+        try:
+            while True:
+                bloque = list(islice(numeradas, TAMANO_LOTE))
+                if not bloque:
+                    break
+
+                # Se interpretan las consultas y se agrupan por operación y nodo de inicio sin repetir destinos
+                leidas = []
+                grupos: Dict[Tuple[str, int], Dict[Union[int, None], None]] = {}
+                for numero, linea in bloque:
+                    if not linea.strip():
+                        continue
+                    try:
+                        respuesta, clave = _leerConsulta(linea)
+                        grupos.setdefault(clave[:2], {})[clave[2]] = None
+                    except (ValueError, KeyError) as e: # json.JSONDecodeError es un ValueError
+                        respuesta, clave = {'error': str(e)}, None
+                    leidas.append((numero, respuesta, clave))
+                tareas = [(operacion, desde, list(destinos)) for (operacion, desde), destinos in grupos.items()]
+
+                resultados: Dict[tuple, Dict[str, Any]] = {}
+                if pool != None:
+                    partes = pool.imap_unordered(_resolverGrupo, tareas, chunksize=max(1, len(tareas) // (procesos * 4)))
+                else:
+                    partes = (_resolverGrupo(tarea, adyacencia) for tarea in tareas)
+                for parte in partes:
+                    resultados.update(parte)
+
+                textos = []
+                for numero, respuesta, clave in leidas:
+                    if clave != None:
+                        respuesta.update(resultados[clave])
+                    errores += 'error' in respuesta
+                    textos.append(json.dumps({'linea': numero, **respuesta}, ensure_ascii=False))
+                textos.append('')
+                salida.write('\n'.join(textos))
+
+                consultas += len(leidas)
+                unicas += len(resultados)
+                recorridos += len(tareas)
+                if progreso != None:
+                    progreso(consultas)
+        finally:
+            if pool != None:
+                pool.terminate()
+                pool.join()
+                compartidos.cerrar()
+        return ResultadoLote(consultas, unicas, recorridos, errores, time.perf_counter() - inicio)
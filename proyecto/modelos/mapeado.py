@@ -0,0 +1,229 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from .binario import BANDERA_CSR, BANDERA_DIRIGIDO, leerCabecera, ubicarSecciones, decodificarContenido
+from array import array
+from typing import Iterator, List, Union
+import mmap
+import sys
+
+
+class NodoMapeado(Nodo):
+    '''
+    ---
+    NodoMapeado
+    ---
+
+    Nodo de solo lectura de un GrafoMapeado. Únicamente guarda su posición en el archivo; el contenido y los vecinos se leen del archivo cada vez que se consultan, por lo que crear un NodoMapeado no cuesta más que leer su identificador.
+    '''
+
+    def __init__(self, grafo: 'GrafoMapeado', posicion: int):
+        self._grafo = grafo
+        self._posicion = posicion
+        self.identificador = grafo._ids[posicion]
+
+    @property
+    def contenido(self):
+        return self._grafo._leerContenido(self._posicion)
+
+    @property
+    def vecinos(self) -> List['NodoMapeado']:
+        grafo = self._grafo
+        inicio, fin = grafo._offsetsVecinos[self._posicion], grafo._offsetsVecinos[self._posicion + 1]
+        return [NodoMapeado(grafo, p) for p in grafo._vecinos[inicio:fin]]
+
+
+class SecuenciaMapeada:
+    '''
+    Secuencia perezosa de solo lectura que crea cada elemento al accederlo. Se usa para los atributos "nodos" y "aristas" de GrafoMapeado, así los menús pueden recorrerlos o mostrarlos sin que existan todos los objetos a la vez.
+    '''
+
+    def __init__(self, cantidad: int, crear):
+        self._cantidad = cantidad
+        self._crear = crear
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __getitem__(self, i: int):
+        if i < 0:
+            i += self._cantidad
+        if not 0 <= i < self._cantidad:
+            raise IndexError('índice fuera de rango')
+        return self._crear(i)
+
+    def __iter__(self) -> Iterator:
+        return map(self._crear, range(self._cantidad))
+
+    def __repr__(self) -> str:
+        return '[' + ', '.join(map(repr, self)) + ']'
+
+
+class PosicionesOrdenadas:
+    '''
+    Diccionario de solo lectura identificador -> posición que busca con búsqueda binaria sobre las posiciones ordenadas por identificador (la sección ordenIds del formato binario), en O(log V) por consulta. Se puede usar como Adyacencia.posiciones sin construir el diccionario, que cuesta O(V).
+    '''
+
+    def __init__(self, ids, ordenIds):
+        self._ids = ids
+        self._orden = ordenIds
+
+    def __len__(self) -> int:
+        return len(self._orden)
+
+    def get(self, idNodo: int, defecto=None):
+        ids, orden = self._ids, self._orden
+        inferior, superior = 0, len(orden)
+        while inferior < superior:
+            medio = (inferior + superior) // 2
+            if ids[orden[medio]] < idNodo:
+                inferior = medio + 1
+            else:
+                superior = medio
+        if inferior < len(orden) and ids[orden[inferior]] == idNodo:
+            return orden[inferior]
+        return defecto
+
+    def __getitem__(self, idNodo: int) -> int:
+        posicion = self.get(idNodo)
+        if posicion == None:
+            raise KeyError(idNodo)
+        return posicion
+
+    def __contains__(self, idNodo: int) -> bool:
+        return self.get(idNodo) != None
+
+    def __iter__(self) -> Iterator[int]:
+        return (self._ids[p] for p in self._orden)
+
+
+class GrafoMapeado:
+    '''
+    ---
+    GrafoMapeado
+    ---
+
+    Vista de solo lectura de un grafo guardado en formato binario (.grafo) con la adyacencia CSR incluida. El archivo se abre con mmap y los arreglos de la adyacencia se usan directamente sobre el archivo, así que abrir el grafo cuesta O(1) sin importar su tamaño y el sistema operativo carga las páginas del archivo solo cuando se consultan.
+
+    Ofrece los métodos de consulta de Grafo que usan AlgoritmoBFS, AlgoritmoDFS y los menús de listado, por lo que se puede usar en su lugar cuando no se va a modificar el grafo.
+
+    ---
+    ### Métodos:
+
+    - esDirigido
+    - obtenerNodoPorId
+    - obtenerAdyacencia
+    - cerrar
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    grafo = GrafoMapeado('datos_grafos/grafo1.grafo')
+    recorrido = AlgoritmoBFS.obtenerRecorridoEnOrden(grafo, 1)
+    grafo.cerrar()
+    ```
+
+    ---
+    Notas:
+    ---
+    - Buscar un nodo por identificador cuesta O(log V) con búsqueda binaria sobre los identificadores ordenados.
+    - Lanza ValueError si el archivo no incluye la adyacencia o si la máquina no es little-endian.
+    '''
+
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            self._abrirDatos(memoryview(self._mapa))
+        except Exception:
+            self.cerrar()
+            raise
+
+    def _abrirDatos(self, datos: memoryview) -> None:
+        '''
+        Interpreta datos, el contenido completo de un archivo binario, y crea las vistas de cada sección sin copiarlas. Lo usan GrafoMapeado con el mmap del archivo y GrafoCompartido con un bloque de memoria compartida.
+        '''
+        if sys.byteorder != 'little':
+            raise ValueError('Los grafos mapeados solo se pueden abrir en máquinas little-endian')
+        self._datos = datos
+        cabecera = leerCabecera(self._datos)
+        if not cabecera['banderas'] & BANDERA_CSR:
+            raise ValueError('El archivo no incluye la adyacencia, vuelva a guardarlo para poder mapearlo')
+        self._dirigido = bool(cabecera['banderas'] & BANDERA_DIRIGIDO)
+        secciones = ubicarSecciones(cabecera)
+
+        def seccion(nombre: str, tipo: Union[str, None]) -> memoryview:
+            inicio, fin = secciones[nombre]
+            return self._datos[inicio:fin].cast(tipo) if tipo else self._datos[inicio:fin]
+
+        self._ids = seccion('idsNodos', 'q')
+        self._offsetsContenido = seccion('offsetsContenido', 'q')
+        self._idsAristas = seccion('idsAristas', 'q')
+        self._origenes = seccion('origenes', 'q')
+        self._destinos = seccion('destinos', 'q')
+        self._pesos = seccion('pesos', 'd')
+        self._ordenIds = seccion('ordenIds', 'q')
+        self._offsetsVecinos = seccion('offsetsVecinos', 'q')
+        self._vecinos = seccion('vecinos', 'q')
+        self._pesosVecinos = seccion('pesosVecinos', 'd')
+        self._tiposContenido = seccion('tiposContenido', None)
+        self._contenido = seccion('contenido', None)
+        self._posiciones = PosicionesOrdenadas(self._ids, self._ordenIds)
+
+        self.nodos = SecuenciaMapeada(len(self._ids), lambda i: NodoMapeado(self, i))
+        self.aristas = SecuenciaMapeada(len(self._idsAristas), lambda i: Arista(self._idsAristas[i], self._origenes[i], self._destinos[i], self._pesos[i]))
+
+    def __str__(self) -> str:
+        retorno = ''
+        for n in self.nodos:
+            retorno += f'{n} -> {[i.identificador for i in n.vecinos]}\n'
+        return retorno
+
+    def _leerContenido(self, posicion: int):
+        inicio, fin = self._offsetsContenido[posicion], self._offsetsContenido[posicion + 1]
+        return decodificarContenido(self._tiposContenido[posicion], self._contenido[inicio:fin])
+
+    def _buscarNodo(self, idNodo: int) -> int:
+        '''
+        Devuelve la posición del nodo con búsqueda binaria sobre los identificadores ordenados, o -1 si no existe.
+        '''
+        return self._posiciones.get(idNodo, -1)
+
+    def _nodosExisten(self, idsNodo: List[int]) -> bool:
+        return all(self._buscarNodo(i) != -1 for i in idsNodo)
+
+    def esDirigido(self) -> bool:
+        return self._dirigido
+
+    def obtenerNodoPorId(self, idNodo: int) -> Union['NodoMapeado', int]:
+        '''
+        Devuelve el nodo con el identificador dado o -1 si no existe, igual que Grafo.obtenerNodoPorId.
+        '''
+        posicion = self._buscarNodo(idNodo)
+        return NodoMapeado(self, posicion) if posicion >= 0 else -1
+
+    def obtenerAdyacencia(self) -> 'Adyacencia':
+        '''
+        Devuelve la Adyacencia del grafo copiando los arreglos del archivo, sin recorrer nodos ni aristas. La usa Adyacencia.obtener para que los demás algoritmos funcionen con grafos mapeados.
+        '''
+        def copia(vista: memoryview) -> 'array':
+            arreglo = array(vista.format)
+            arreglo.frombytes(vista.cast('B'))
+            return arreglo
+        return Adyacencia(copia(self._ids), copia(self._offsetsVecinos), copia(self._vecinos), copia(self._pesosVecinos), self._dirigido)
+
+    def _liberarVistas(self) -> None:
+        for atributo in ('_ids', '_offsetsContenido', '_idsAristas', '_origenes', '_destinos', '_pesos', '_ordenIds', '_offsetsVecinos', '_vecinos', '_pesosVecinos', '_tiposContenido', '_contenido', '_datos'):
+            vista = self.__dict__.pop(atributo, None)
+            if vista != None:
+                vista.release()
+
+    def cerrar(self) -> None:
+        '''
+        Libera el mmap y cierra el archivo. Los nodos obtenidos antes de cerrar dejan de poder consultarse.
+        '''
+        self._liberarVistas()
+        if getattr(self, '_mapa', None) != None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
@@ -1,5 +1,4 @@
 from typing import List 
-from art import *
 from .fuentes import *
 from abc import ABC,abstractclassmethod
 
@@ -107,7 +106,7 @@ class MenuSinGrafo(Menu):
         if fuente == FUENTE_NORMAL:
             return self.__str__()
         else:
-            titulo = text2art(self.titulo,fuente)
+            titulo = renderizarTitulo(self.titulo,fuente)
             retorno = titulo + "\n\n"
             for i, opcion in enumerate(self.opciones):
                 retorno += f'{i}. {opcion}\n'
@@ -139,7 +138,7 @@ class MenuConGrafo(Menu):
         if fuente == FUENTE_NORMAL:
             return self.__str__()
         else:
-            titulo = text2art(self.titulo,fuente)
+            titulo = renderizarTitulo(self.titulo,fuente)
             retorno = f'{titulo}\n\nNombre del grafo: {self.nombreGrafo}\n\n'
             for i, opcion in enumerate(self.opciones):
                 retorno += f'{i}. {opcion}\n'
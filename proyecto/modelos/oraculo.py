@@ -0,0 +1,175 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from .bfs import AlgoritmoBFS
+from .rutas import AlgoritmoAEstrella
+from array import array
+from typing import Callable, List, Tuple, Union
+
+# Estrategias para escoger los nodos de referencia (landmarks)
+ESTRATEGIA_GRADO = 'grado'
+ESTRATEGIA_LEJANO = 'lejano'
+
+
+class OraculoDistancias:
+    '''
+    ---
+    OraculoDistancias
+    ---
+
+    Oráculo de distancias basado en nodos de referencia (landmarks). Al construirse calcula con BFS la distancia en saltos desde (y, en grafos dirigidos, hacia) k nodos de referencia y la guarda en arreglos compactos de enteros de 32 bits, es decir 4 bytes por nodo y por referencia.
+
+    Con esas distancias y la desigualdad triangular se obtiene en O(k) una cota inferior y una cota superior de la distancia entre cualquier par de nodos sin recorrer el grafo. La cota inferior sirve además como heurística admisible para A* (técnica ALT: A*, Landmarks y desigualdad Triangular).
+
+    ---
+    ### Métodos:
+
+    - estimarDistancia
+    - heuristica
+    - encontrarRutaMasCorta
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    oraculo = OraculoDistancias(grafo, cantidadLandmarks=16, estrategia=ESTRATEGIA_LEJANO)
+    inferior, superior = oraculo.estimarDistancia(1, 500)
+    ruta, costo = oraculo.encontrarRutaMasCorta(1, 500)
+    ```
+    '''
+
+    def __init__(self, grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], cantidadLandmarks: int = 8, estrategia: str = ESTRATEGIA_GRADO):
+        '''
+        Args:
+            - grafo: Es el grafo (o su Adyacencia) sobre el que se responderán las consultas.
+            - cantidadLandmarks: Es la cantidad k de nodos de referencia, más referencias dan cotas más ajustadas a cambio de k BFS al construir y k operaciones por consulta.
+            - estrategia: ESTRATEGIA_GRADO escoge los nodos de mayor grado, ESTRATEGIA_LEJANO escoge cada referencia lo más lejos posible de las anteriores (farthest-point), lo cual suele cubrir mejor el grafo.
+        '''
+        self.adyacencia = Adyacencia.obtener(grafo)
+        self.transpuesta = self.adyacencia.transpuesta()
+        self.landmarks: List[int] = [] # Posiciones de los nodos de referencia
+        self.distanciasDesde: List['array'] = [] # distanciasDesde[j][v] = d(landmark j, v)
+        self.distanciasHacia: List['array'] = [] # distanciasHacia[j][v] = d(v, landmark j)
+
+        n = self.adyacencia.cantidadNodos()
+        cantidadLandmarks = min(cantidadLandmarks, n)
+        if estrategia == ESTRATEGIA_LEJANO:
+            self._escogerLejanos(cantidadLandmarks)
+        else:
+            porGrado = sorted(range(n), key=lambda i: self.adyacencia.grado(i), reverse=True)
+            for posicion in porGrado[:cantidadLandmarks]:
+                self._agregarLandmark(posicion)
+
+    def _agregarLandmark(self, posicion: int) -> None:
+        self.landmarks.append(posicion)
+        desde = AlgoritmoBFS.calcularDistanciasPorPosicion(self.adyacencia, posicion)
+        self.distanciasDesde.append(desde)
+        if self.adyacencia.dirigido:
+            self.distanciasHacia.append(AlgoritmoBFS.calcularDistanciasPorPosicion(self.transpuesta, posicion))
+        else:
+            self.distanciasHacia.append(desde) # En grafos no dirigidos ambas distancias son iguales
+
+    def _escogerLejanos(self, cantidadLandmarks: int) -> None:
+        '''
+        Selección farthest-point: la primera referencia es el nodo de mayor grado y cada referencia siguiente es el nodo cuya distancia mínima a las referencias ya escogidas es la mayor. Los nodos que ninguna referencia alcanza se consideran infinitamente lejanos, así se cubren también otras componentes del grafo.
+        '''
+        n = self.adyacencia.cantidadNodos()
+        if cantidadLandmarks == 0:
+            return
+        infinito = 2**31 - 1
+        masCercana = array('i', [infinito]) * n # Distancia a la referencia más cercana
+        siguiente = max(range(n), key=lambda i: self.adyacencia.grado(i))
+        while len(self.landmarks) < cantidadLandmarks:
+            self._agregarLandmark(siguiente)
+            desde = self.distanciasDesde[-1]
+            hacia = self.distanciasHacia[-1]
+            for v in range(n):
+                # Se toma la menor distancia conocida en cualquiera de los dos sentidos
+                d = desde[v] if hacia[v] == -1 else (hacia[v] if desde[v] == -1 else min(desde[v], hacia[v]))
+                if d != -1 and d < masCercana[v]:
+                    masCercana[v] = d
+            siguiente = max(range(n), key=masCercana.__getitem__)
+            if masCercana[siguiente] == 0:
+                break # Todos los nodos ya son referencias
+
+    def _cotasPorPosicion(self, a: int, b: int) -> Tuple[float, float]:
+        '''
+        Devuelve (inferior, superior) de la distancia de la posición a hasta la posición b.
+        '''
+        if a == b:
+            return 0, 0
+        infinito = float('inf')
+        inferior = 0
+        superior = infinito
+        for desde, hacia in zip(self.distanciasDesde, self.distanciasHacia):
+            dLa, dLb = desde[a], desde[b]
+            daL, dbL = hacia[a], hacia[b]
+            # Cota superior: ir de a hasta la referencia y de la referencia hasta b
+            if daL != -1 and dLb != -1 and daL + dLb < superior:
+                superior = daL + dLb
+            # Cotas inferiores: d(L,b) <= d(L,a) + d(a,b)  y  d(a,L) <= d(a,b) + d(b,L)
+            if dLa != -1:
+                if dLb == -1:
+                    return infinito, infinito # La referencia llega hasta a pero no hasta b, entonces a no llega hasta b
+                inferior = max(inferior, dLb - dLa)
+            if dbL != -1:
+                if daL == -1:
+                    return infinito, infinito # b llega hasta la referencia pero a no, entonces a no llega hasta b
+                inferior = max(inferior, daL - dbL)
+        return inferior, superior
+
+    def estimarDistancia(self, nodoInicio: int, nodoFin: int) -> Union[Tuple[float, float], None]:
+        '''
+        ---
+        Estima la distancia en saltos entre dos nodos en O(k) sin recorrer el grafo.
+
+        ---
+        Returns:
+        ---
+        - Tuple[float, float] | None: (cotaInferior, cotaSuperior), la distancia real está en ese intervalo. Ambas cotas son infinitas si se detecta que no existe ruta y la superior es infinita si ninguna referencia conecta los nodos. Devuelve None si algún nodo no existe.
+        '''
+        a = self.adyacencia.posiciones.get(nodoInicio, -1)
+        b = self.adyacencia.posiciones.get(nodoFin, -1)
+        if a == -1 or b == -1:
+            return None
+        return self._cotasPorPosicion(a, b)
+
+    def heuristica(self, nodoFin: int, escala: float = 1) -> Callable[[int], float]:
+        '''
+        ---
+        Devuelve una heurística ALT para AlgoritmoAEstrella hacia nodoFin.
+
+        ---
+        Args:
+        ---
+        - nodoFin (int): El identificador del nodo de destino.
+        - escala (float): Factor por el que se multiplica la cota en saltos. La heurística es admisible si la escala no supera el menor peso de las aristas, con pesos unitarios la escala es 1.
+
+        ---
+        Returns:
+        ---
+        - Callable[[int], float]: Función que recibe el identificador de un nodo y devuelve una cota inferior del costo restante hasta nodoFin.
+        '''
+        posiciones = self.adyacencia.posiciones
+        fin = posiciones[nodoFin]
+        return lambda idNodo: self._cotasPorPosicion(posiciones[idNodo], fin)[0] * escala
+
+    def encontrarRutaMasCorta(self, nodoInicio: int, nodoFin: int) -> Union[Tuple[List[int], float], None]:
+        '''
+        ---
+        Busca la ruta exacta de menor costo con A* guiado por la heurística ALT.
+
+        ---
+        Returns:
+        ---
+        - Tuple[List[int], float] | None: La lista de identificadores de la ruta y su costo total, o None si no existe ruta o algún nodo no existe.
+
+        ---
+        Nota:
+        ---
+        - Se utilizan los pesos de las aristas. Como las distancias de las referencias se miden en saltos, la heurística se escala por el menor peso del grafo para seguir siendo admisible.
+        '''
+        if nodoFin not in self.adyacencia.posiciones:
+            return None
+        pesos = self.adyacencia.pesos
+        escala = max(min(pesos), 0) if len(pesos) > 0 else 1
+        return AlgoritmoAEstrella.encontrarRutaMasCorta(self.adyacencia, nodoInicio, nodoFin, self.heuristica(nodoFin, escala))
@@ -0,0 +1,237 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from heapq import heappush, heappop
+from typing import Callable, Dict, List, Tuple, Union
+
+
+def _busquedaConMonticulo(adyacencia: 'Adyacencia', inicio: int, fin: int = -1, heuristica: Union[Callable[[int], float], None] = None) -> Tuple[Dict[int, float], Dict[int, int]]:
+    '''
+    Búsqueda de costo mínimo sobre la adyacencia utilizando un montículo binario (heapq).
+
+    Args:
+        - adyacencia: Adyacencia sobre la que se busca.
+        - inicio: posición del nodo de inicio.
+        - fin: posición del nodo de destino, la búsqueda termina al extraerlo del montículo. Con -1 se calculan las distancias a todos los nodos alcanzables.
+        - heuristica: función que recibe una posición y devuelve una cota inferior del costo hasta el destino (A*). Con None se comporta como Dijkstra.
+
+    Returns:
+        - (distancias, padres): diccionarios con solo las posiciones alcanzadas. distancias[i] es el costo mínimo conocido hasta la posición i y padres[i] es la posición anterior en la ruta (-1 para el inicio). Las posiciones que no aparecen no se alcanzaron.
+
+    Los diccionarios crecen con los nodos visitados en lugar de reservar dos arreglos de n casillas, así una ruta entre nodos cercanos no cuesta O(V) aunque el grafo sea grande.
+
+    En lugar de actualizar prioridades dentro del montículo se inserta una nueva entrada cada vez que mejora la distancia de un nodo y las entradas obsoletas se descartan al extraerlas (eliminación perezosa). Así cada arista produce a lo sumo una inserción y el costo total es O((V+E) log V).
+    '''
+    infinito = float('inf')
+    distancias = {inicio: 0.0}
+    padres = {inicio: -1}
+    distanciaConocida = distancias.get
+    offsets = adyacencia.offsets
+    vecinos = adyacencia.vecinos
+    pesos = adyacencia.pesos
+
+    # Cada entrada es (prioridad, costo acumulado, posicion)
+    monticulo = [(heuristica(inicio) if heuristica else 0.0, 0.0, inicio)]
+    while monticulo:
+        _, costo, u = heappop(monticulo)
+        if costo > distancias[u]:
+            continue # Entrada obsoleta, ya se encontró un camino más corto hacia u
+        if u == fin:
+            break # Al extraer el destino su distancia ya es definitiva
+        for k in range(offsets[u], offsets[u + 1]):
+            v = vecinos[k]
+            nuevoCosto = costo + pesos[k]
+            if nuevoCosto < distanciaConocida(v, infinito):
+                distancias[v] = nuevoCosto
+                padres[v] = u
+                prioridad = nuevoCosto + heuristica(v) if heuristica else nuevoCosto
+                heappush(monticulo, (prioridad, nuevoCosto, v))
+    return distancias, padres
+
+
+def _reconstruirRuta(adyacencia: 'Adyacencia', padres: Dict[int, int], fin: int) -> List[int]:
+    '''
+    Reconstruye la lista de identificadores desde el inicio hasta la posición fin siguiendo los padres.
+    '''
+    ruta = []
+    aux = fin
+    while aux != -1:
+        ruta.append(adyacencia.ids[aux])
+        aux = padres[aux]
+    return ruta[::-1]
+
+
+class AlgoritmoDijkstra:
+    '''
+    ---
+    AlgoritmoDijkstra
+    ---
+
+    Clase que proporciona métodos para calcular rutas de costo mínimo en grafos con aristas ponderadas utilizando el algoritmo de Dijkstra con un montículo binario.
+
+    Todos los métodos aceptan un grafo (GrafoDirigido o GrafoNoDirigido) o una Adyacencia construida previamente con Adyacencia.desdeGrafo, lo cual evita reconstruirla en cada consulta cuando se hacen varias sobre el mismo grafo.
+
+    ---
+    ### Métodos:
+
+    - calcularDistancias
+    - encontrarRutaMasCorta
+    - calcularArbolPorPosicion
+    '''
+
+    @staticmethod
+    def calcularDistancias(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], nodoInicio: int) -> Dict[int, float]:
+        '''
+        ---
+        Calcula el costo mínimo desde un nodo hacia todos los nodos alcanzables.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se realizará la búsqueda.
+        - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+
+        ---
+        Returns:
+        ---
+        - Dict[int, float]: Diccionario identificador -> costo mínimo desde el nodo de inicio. Solo contiene los nodos alcanzables.
+
+        ---
+        Ejemplo de uso:
+        ---
+        ```python
+        grafo = GrafoDirigido()
+        # Agregar nodos y aristas con peso al grafo...
+        distancias = AlgoritmoDijkstra.calcularDistancias(grafo, nodoInicio=1)
+        print(distancias)
+        ```
+
+        ---
+        Notas:
+        ---
+        - Si el nodo de inicio no existe o el grafo tiene pesos negativos, el diccionario devuelto estará vacío.
+        '''
+        adyacencia = Adyacencia.obtener(grafo)
+        inicio = adyacencia.posiciones.get(nodoInicio, -1)
+        if inicio == -1 or adyacencia.tienePesosNegativos():
+            return {}
+        distancias, _ = _busquedaConMonticulo(adyacencia, inicio)
+        ids = adyacencia.ids
+        return {ids[i]: distancias[i] for i in sorted(distancias)} # En el orden de los nodos del grafo
+
+    @staticmethod
+    def encontrarRutaMasCorta(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], nodoInicio: int, nodoFin: int) -> Union[Tuple[List[int], float], None]:
+        '''
+        ---
+        Encuentra la ruta de menor costo entre dos nodos utilizando el algoritmo de Dijkstra.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se realizará la búsqueda.
+        - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+        - nodoFin (int): El identificador del nodo al cual se desea llegar.
+
+        ---
+        Returns:
+        ---
+        - Tuple[List[int], float] | None: La lista de identificadores de la ruta y su costo total. Si no hay ruta, devuelve None.
+
+        ---
+        Descripción:
+        ---
+        La búsqueda se detiene en cuanto el nodo de destino sale del montículo, por lo que no se exploran los nodos más lejanos que el destino.
+
+        ---
+        Ejemplo de uso:
+        ---
+        ```python
+        grafo1 = GrafoNoDirigido()
+        # Agregar nodos y aristas con peso al grafo...
+        ruta, costo = AlgoritmoDijkstra.encontrarRutaMasCorta(grafo=grafo1, nodoInicio=1, nodoFin=5)
+        print(ruta, costo)
+        ```
+
+        ---
+        Notas:
+        ---
+        - Si alguno de los nodos no existe en el grafo o el grafo tiene pesos negativos, la función devuelve None.
+        - Si el nodo de inicio y el nodo de destino son el mismo, la ruta contiene únicamente ese nodo y su costo es 0.
+        '''
+        return AlgoritmoAEstrella.encontrarRutaMasCorta(grafo, nodoInicio, nodoFin)
+
+    @staticmethod
+    def calcularArbolPorPosicion(adyacencia: 'Adyacencia', inicio: int, fin: int = -1) -> Tuple[Dict[int, float], Dict[int, int]]:
+        '''
+        Dijkstra sobre posiciones de la Adyacencia. Devuelve (distancias, padres) como _busquedaConMonticulo: con fin=-1 se calculan las rutas hacia todos los nodos alcanzables, lo que permite responder con una sola búsqueda varias rutas que salen del mismo nodo. Lanza ValueError si el grafo tiene pesos negativos.
+        '''
+        if adyacencia.tienePesosNegativos():
+            raise ValueError('Dijkstra no admite pesos negativos')
+        return _busquedaConMonticulo(adyacencia, inicio, fin)
+
+
+class AlgoritmoAEstrella:
+    '''
+    ---
+    AlgoritmoAEstrella
+    ---
+
+    Clase que proporciona la búsqueda A*, una variante de Dijkstra dirigida hacia el destino mediante una heurística.
+
+    ---
+    ### Métodos:
+
+    - encontrarRutaMasCorta
+    '''
+
+    @staticmethod
+    def encontrarRutaMasCorta(grafo: Union['GrafoDirigido', 'GrafoNoDirigido', 'Adyacencia'], nodoInicio: int, nodoFin: int, heuristica: Union[Callable[[int], float], None] = None) -> Union[Tuple[List[int], float], None]:
+        '''
+        ---
+        Encuentra la ruta de menor costo entre dos nodos utilizando el algoritmo A*.
+
+        ---
+        Args:
+        ---
+        - grafo (Grafo | Adyacencia): El grafo sobre el cual se realizará la búsqueda.
+        - nodoInicio (int): El identificador del nodo desde el cual comenzará la búsqueda.
+        - nodoFin (int): El identificador del nodo al cual se desea llegar.
+        - heuristica (Callable[[int], float] | None): Función que recibe el identificador de un nodo y devuelve una estimación del costo restante hasta nodoFin. Si es None se comporta igual que Dijkstra.
+
+        ---
+        Returns:
+        ---
+        - Tuple[List[int], float] | None: La lista de identificadores de la ruta y su costo total. Si no hay ruta, devuelve None.
+
+        ---
+        Ejemplo de uso:
+        ---
+        ```python
+        coordenadas = {1: (0, 0), 2: (3, 4), ...}
+        def distanciaRecta(idNodo):
+            (x1, y1), (x2, y2) = coordenadas[idNodo], coordenadas[5]
+            return ((x1 - x2)**2 + (y1 - y2)**2) ** 0.5
+        ruta, costo = AlgoritmoAEstrella.encontrarRutaMasCorta(grafo1, 1, 5, distanciaRecta)
+        ```
+
+        ---
+        Notas:
+        ---
+        - La ruta es óptima si la heurística nunca sobreestima el costo real hasta el destino (heurística admisible).
+        - Si alguno de los nodos no existe en el grafo o el grafo tiene pesos negativos, la función devuelve None.
+        '''
+        adyacencia = Adyacencia.obtener(grafo)
+        inicio = adyacencia.posiciones.get(nodoInicio, -1)
+        fin = adyacencia.posiciones.get(nodoFin, -1)
+        if inicio == -1 or fin == -1 or adyacencia.tienePesosNegativos():
+            return None
+
+        # La heuristica se expresa con identificadores, internamente se trabaja con posiciones
+        heuristicaPosiciones = None
+        if heuristica != None:
+            ids = adyacencia.ids
+            heuristicaPosiciones = lambda posicion: heuristica(ids[posicion])
+
+        distancias, padres = _busquedaConMonticulo(adyacencia, inicio, fin, heuristicaPosiciones)
+        if fin not in distancias:
+            return None
+        return _reconstruirRuta(adyacencia, padres, fin), distancias[fin]
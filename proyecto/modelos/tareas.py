@@ -0,0 +1,115 @@
+from threading import Event, Thread
+from typing import Any, Callable, Union
+import time
+
+
+class TareaCancelada(BaseException):
+    '''
+    Se lanza dentro del algoritmo, desde su función de progreso, cuando la tarea se canceló o pasó su tiempo límite. Hereda de BaseException para que los bloques "except Exception" de los algoritmos no la detengan.
+    '''
+
+    def __init__(self, motivo: str):
+        super().__init__(motivo)
+        self.motivo = motivo
+
+
+class Tarea:
+    '''
+    ---
+    Tarea
+    ---
+
+    Ejecuta un algoritmo en un hilo de fondo, con su avance, cancelación y tiempo límite.
+
+    ---
+    Descripción:
+    ---
+    El algoritmo debe aceptar el argumento progreso y llamarlo con (visitados, frontera, parcial) cada vez que avanza, como lo hacen los recorridos, rutas y árboles de AlgoritmoBFS y AlgoritmoDFS. En cada llamada se guarda el avance y, si se pidió cancelar o se pasó el tiempo límite, se lanza TareaCancelada para detener el algoritmo. El resultado parcial (el recorrido o el árbol construido hasta ese momento) queda disponible en parcial.
+
+    ### Atributos:
+        - estado: 'ejecutando', 'terminada', 'cancelada', 'vencida' (pasó el tiempo límite) o 'fallida'.
+        - visitados: nodos visitados hasta el último aviso.
+        - frontera: nodos en la cola (BFS) o en la pila (DFS) en el último aviso.
+        - parcial: resultado parcial del último aviso.
+        - resultado: resultado del algoritmo si terminó.
+        - error: excepción que lanzó el algoritmo si falló.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    tarea = Tarea(AlgoritmoBFS.obtenerRecorridoEnOrden, grafo, 1, limite=60)
+    while not tarea.esperar(0.5):
+        print(tarea.visitados, tarea.frontera, tarea.tiempo)
+        if debeCancelarse:
+            tarea.cancelar()
+    recorrido = tarea.obtenerResultado() # El parcial si se canceló
+    ```
+    '''
+
+    def __init__(self, funcion: Callable[..., Any], *args, limite: Union[float, None] = None, **kwargs):
+        self.limite = limite
+        self.estado = 'ejecutando'
+        self.visitados = 0
+        self.frontera = 0
+        self.parcial: Any = None
+        self.resultado: Any = None
+        self.error: Union[Exception, None] = None
+        self.inicio = time.perf_counter()
+        self.fin: Union[float, None] = None
+        self._cancelar = Event()
+        kwargs['progreso'] = self.informar
+        self._hilo = Thread(target=self._ejecutar, args=(funcion, args, kwargs), daemon=True)
+        self._hilo.start()
+
+    def _ejecutar(self, funcion: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        try:
+            self.resultado = funcion(*args, **kwargs)
+            self.estado = 'terminada'
+        except TareaCancelada as e:
+            self.estado = e.motivo
+        except Exception as e:
+            self.error = e
+            self.estado = 'fallida'
+        self.fin = time.perf_counter()
+
+    def informar(self, visitados: int, frontera: int, parcial: Any = None) -> None:
+        '''
+        Función de progreso que recibe el algoritmo. Lanza TareaCancelada si la tarea se canceló o pasó su tiempo límite.
+        '''
+        self.visitados = visitados
+        self.frontera = frontera
+        if parcial is not None:
+            self.parcial = parcial
+        if self._cancelar.is_set():
+            raise TareaCancelada('cancelada')
+        if self.limite != None and time.perf_counter() - self.inicio > self.limite:
+            raise TareaCancelada('vencida')
+
+    def cancelar(self) -> None:
+        '''
+        Pide detener el algoritmo, que se detiene en su siguiente aviso de progreso.
+        '''
+        self._cancelar.set()
+
+    def esperar(self, segundos: Union[float, None] = None) -> bool:
+        '''
+        Espera a que la tarea termine, como máximo los segundos indicados. Devuelve True si ya terminó (por cualquier motivo).
+        '''
+        self._hilo.join(segundos)
+        return not self._hilo.is_alive()
+
+    @property
+    def tiempo(self) -> float:
+        return (self.fin if self.fin != None else time.perf_counter()) - self.inicio
+
+    def obtenerResultado(self) -> Any:
+        '''
+        Devuelve el resultado si la tarea terminó o el resultado parcial si se canceló o venció. Si el algoritmo falló vuelve a lanzar su excepción.
+        '''
+        if self.estado == 'fallida':
+            raise self.error
+        return self.resultado if self.estado == 'terminada' else self.parcial
+
+    def __repr__(self) -> str:
+        return f'Tarea(estado={self.estado}, visitados={self.visitados}, frontera={self.frontera}, tiempo={self.tiempo:.4f}s)'
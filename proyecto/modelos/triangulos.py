@@ -0,0 +1,209 @@
+from .grafo import *
+from .adyacencia import Adyacencia
+from .compartido import ArreglosCompartidos, arreglosTrabajador, iniciarTrabajador
+from array import array
+from typing import Dict, List, Tuple, Union
+import os
+import time
+
+
+def _contarEnRango(rango: Tuple[int, int], offsets: Union['array', None] = None, vecinos: Union['array', None] = None) -> 'array':
+    '''
+    Cuenta los triángulos cuyo vértice de menor rango está en [inicio, fin). Si no se pasa la adyacencia orientada se utiliza la del proceso trabajador.
+
+    Returns:
+        - array: triángulos de cada rango encontrados en este intervalo.
+    '''
+    if offsets == None:
+        arreglos = arreglosTrabajador()
+        offsets, vecinos = arreglos['offsets'], arreglos['vecinos']
+    inicio, fin = rango
+    triangulos = array('q', [0]) * (len(offsets) - 1)
+    for u in range(inicio, fin):
+        iniU, finU = offsets[u], offsets[u + 1]
+        for k in range(iniU, finU):
+            v = vecinos[k]
+            # Interseccion por mezcla de los vecinos de u mayores que v con los vecinos de v, ambas listas están ordenadas
+            i, j = k + 1, offsets[v]
+            finV = offsets[v + 1]
+            while i < finU and j < finV:
+                a, b = vecinos[i], vecinos[j]
+                if a < b:
+                    i += 1
+                elif a > b:
+                    j += 1
+                else:
+                    triangulos[u] += 1
+                    triangulos[v] += 1
+                    triangulos[a] += 1
+                    i += 1
+                    j += 1
+    return triangulos
+
+
+class ResultadoTriangulos:
+    '''
+    ---
+    ResultadoTriangulos
+    ---
+
+    Resultado del conteo de triángulos de un grafo no dirigido.
+
+    ### Atributos:
+        - total: cantidad de triángulos del grafo.
+        - porNodo: diccionario identificador -> cantidad de triángulos de los que forma parte el nodo.
+        - clustering: diccionario identificador -> coeficiente de agrupamiento local del nodo.
+        - tiempo: segundos que tomó el cálculo.
+
+    ### Métodos:
+        - promedioClustering
+        - transitividad
+    '''
+
+    def __init__(self, total: int, porNodo: Dict[int, int], clustering: Dict[int, float], tripletas: int, tiempo: float):
+        self.total = total
+        self.porNodo = porNodo
+        self.clustering = clustering
+        self.tripletas = tripletas # Cantidad de caminos de longitud 2, necesaria para la transitividad
+        self.tiempo = tiempo
+
+    def __repr__(self) -> str:
+        return f'ResultadoTriangulos(total={self.total}, nodos={len(self.porNodo)}, tiempo={self.tiempo:.4f}s)'
+
+    def promedioClustering(self) -> float:
+        '''
+        Devuelve el promedio de los coeficientes de agrupamiento locales.
+        '''
+        return sum(self.clustering.values()) / len(self.clustering) if self.clustering else 0.0
+
+    def transitividad(self) -> float:
+        '''
+        Devuelve el coeficiente de agrupamiento global: 3 * triángulos / tripletas conectadas.
+        '''
+        return 3 * self.total / self.tripletas if self.tripletas else 0.0
+
+
+class AlgoritmoTriangulos:
+    '''
+    ---
+    AlgoritmoTriangulos
+    ---
+
+    Clase que proporciona el conteo de triángulos y los coeficientes de agrupamiento (clustering) de un GrafoNoDirigido.
+
+    ---
+    ### Métodos:
+
+    - contarTriangulos
+    '''
+
+    @staticmethod
+    def _orientarPorGrado(adyacencia: 'Adyacencia') -> Tuple['array', 'array', 'array', List[int]]:
+        '''
+        Numera los nodos por rango (grado y luego posición) y deja a cada nodo únicamente sus vecinos de mayor rango, ordenados. Se descartan lazos y aristas repetidas.
+
+        Returns:
+            - (offsets, vecinos, posicionDeRango, grados): adyacencia orientada indexada por rango, la posición original de cada rango y el grado sin repeticiones de cada posición.
+        '''
+        n = adyacencia.cantidadNodos()
+        conjuntos = []
+        for u in range(n):
+            vecinosU = set(adyacencia.vecinos[adyacencia.offsets[u]:adyacencia.offsets[u + 1]])
+            vecinosU.discard(u)
+            conjuntos.append(vecinosU)
+        grados = [len(c) for c in conjuntos]
+
+        posicionDeRango = array('q', sorted(range(n), key=lambda u: (grados[u], u)))
+        rangoDePosicion = array('q', [0]) * n
+        for r, u in enumerate(posicionDeRango):
+            rangoDePosicion[u] = r
+
+        offsets = array('q', [0]) * (n + 1)
+        vecinos = array('q')
+        for r, u in enumerate(posicionDeRango):
+            vecinos.extend(sorted(rangoDePosicion[v] for v in conjuntos[u] if rangoDePosicion[v] > r))
+            offsets[r + 1] = len(vecinos)
+        return offsets, vecinos, posicionDeRango, grados
+
+    @staticmethod
+    def contarTriangulos(grafo: Union['GrafoNoDirigido', 'Adyacencia'], procesos: Union[int, None] = 1) -> Union['ResultadoTriangulos', None]:
+        '''
+        ---
+        Cuenta los triángulos del grafo y calcula el coeficiente de agrupamiento local de cada nodo.
+
+        ---
+        Args:
+        ---
+        - grafo (GrafoNoDirigido | Adyacencia): El grafo no dirigido sobre el cual se contarán los triángulos.
+        - procesos (int | None): Cantidad de procesos entre los que se reparten los rangos de nodos. Con 1 se calcula en el proceso actual y con None se usa la cantidad de CPUs.
+
+        ---
+        Returns:
+        ---
+        - ResultadoTriangulos | None: El total de triángulos, los triángulos y el coeficiente de agrupamiento de cada nodo. Si el grafo es dirigido devuelve None.
+
+        ---
+        Descripción:
+        ---
+        Cada arista se orienta del nodo de menor grado al de mayor grado, así cada nodo conserva a lo sumo O(sqrt(E)) vecinos. Para cada arista orientada (u, v) los triángulos son la intersección de los vecinos ordenados de u y de v, que se obtiene mezclando ambas listas como en merge sort. Cada triángulo se encuentra exactamente una vez, desde su vértice de menor rango, y el costo total es O(E^1.5) en lugar de buscar cada arista con _buscarArista.
+
+        ---
+        Ejemplo de uso:
+        ---
+        ```python
+        resultado = AlgoritmoTriangulos.contarTriangulos(grafoNoDirigido, procesos=4)
+        print(resultado.total, resultado.clustering[1], resultado.promedioClustering())
+        ```
+
+        ---
+        Notas:
+        ---
+        - Los lazos y las aristas repetidas no se toman en cuenta.
+        - El coeficiente de agrupamiento de los nodos con menos de dos vecinos es 0.
+        '''
+        inicioTiempo = time.perf_counter()
+        adyacencia = Adyacencia.obtener(grafo)
+        if adyacencia.dirigido:
+            return None
+        n = adyacencia.cantidadNodos()
+        offsets, vecinos, posicionDeRango, grados = AlgoritmoTriangulos._orientarPorGrado(adyacencia)
+
+        procesos = procesos or os.cpu_count() or 1
+        if procesos <= 1 or n < 2:
+            porRango = _contarEnRango((0, n), offsets, vecinos)
+        else:
+            # Los rangos se cortan para que cada uno tenga un trabajo parecido, medido como la suma de los cuadrados de los grados orientados
+            trabajo = [(offsets[r + 1] - offsets[r]) ** 2 + 1 for r in range(n)]
+            objetivo = sum(trabajo) / (procesos * 4)
+            rangos = []
+            inicio = 0
+            acumulado = 0
+            for r in range(n):
+                acumulado += trabajo[r]
+                if acumulado >= objetivo:
+                    rangos.append((inicio, r + 1))
+                    inicio = r + 1
+                    acumulado = 0
+            if inicio < n:
+                rangos.append((inicio, n))
+
+            porRango = array('q', [0]) * n
+            from multiprocessing import Pool
+            with ArreglosCompartidos.crear({'offsets': offsets, 'vecinos': vecinos}) as compartidos, \
+                    Pool(procesos, initializer=iniciarTrabajador, initargs=(compartidos.descriptor,)) as pool:
+                for parcial in pool.imap_unordered(_contarEnRango, rangos):
+                    for r in range(n):
+                        porRango[r] += parcial[r]
+
+        porNodo = {}
+        clustering = {}
+        tripletas = 0
+        for r, u in enumerate(posicionDeRango):
+            idNodo = adyacencia.ids[u]
+            g = grados[u]
+            porNodo[idNodo] = porRango[r]
+            clustering[idNodo] = 2 * porRango[r] / (g * (g - 1)) if g > 1 else 0.0
+            tripletas += g * (g - 1) // 2
+
+        total = sum(porRango) // 3
+        return ResultadoTriangulos(total, porNodo, clustering, tripletas, time.perf_counter() - inicioTiempo)
@@ -0,0 +1,289 @@
+'''
+Servidor de consultas que mantiene los grafos cargados en memoria entre solicitudes, para no volver a leer el archivo del grafo en cada consulta como la línea de comandos.
+
+    python -m proyecto serve [--puerto 8765 | --socket /tmp/proyecto.sock] [--procesos 2]
+
+El protocolo es una solicitud JSON por línea y una respuesta JSON por línea. Si la solicitud tiene un campo "id" la respuesta lo repite, porque las solicitudes de una misma conexión se atienden al mismo tiempo y sus respuestas pueden llegar en otro orden:
+
+    {"id": 1, "op": "bfs", "grafo": "grafo1", "desde": 1, "hasta": 5}
+    {"id": 1, "grafo": "grafo1", "desde": 1, "hasta": 5, "ruta": [1, 3, 5], "segundos": 0.0002}
+
+Operaciones:
+    - bfs, dfs: {grafo, desde, hasta?} recorrido o ruta, como en la línea de comandos.
+    - ruta: {grafo, desde, hasta} ruta de menor costo con Dijkstra.
+    - centralidad: {grafo, medida} con medida 'pagerank', 'vectorPropio' o 'intermediacion'. Se calcula en el grupo de procesos.
+    - triangulos: {grafo} triángulos y coeficientes de agrupamiento de un grafo no dirigido. Se calcula en el grupo de procesos.
+    - agregarNodo {grafo, contenido?, idNodo?}, agregarArista {grafo, a, b, peso?}, eliminarNodo {grafo, idNodo}, eliminarArista {grafo, idArista} o {grafo, a, b}: ediciones con los métodos de Grafo, se guardan con guardarGrafo antes de responder.
+    - descargar: {grafo} libera el grafo cargado.
+    - stats: {grafo?} datos de un grafo cargado o, sin grafo, las latencias de cada operación, los grafos cargados y la caché de grafos.
+'''
+from .almacenamiento import *
+from .cli import recorrer
+from .modelos.rutas import AlgoritmoDijkstra
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque
+import asyncio
+import json
+import time
+
+MUESTRAS_LATENCIA = 1000 # Latencias recientes que se guardan por operación para calcular los percentiles
+LIMITE_LINEA = 1 << 20 # Tamaño máximo de una solicitud en bytes
+OPERACIONES = ('bfs', 'dfs', 'ruta', 'centralidad', 'triangulos', 'agregarNodo', 'agregarArista', 'eliminarNodo', 'eliminarArista', 'descargar', 'stats')
+
+
+def _calcularEnProceso(operacion: str, adyacencia: 'Adyacencia', medida: Union[str, None]) -> Dict[str, Any]:
+    '''
+    Se ejecuta en un proceso del grupo con una copia de la adyacencia del grafo. Devuelve el resultado listo para convertir a JSON.
+    '''
+    if operacion == 'triangulos':
+        resultado = AlgoritmoTriangulos.contarTriangulos(adyacencia)
+        if resultado == None:
+            raise ValueError('Los triángulos solo se cuentan en grafos no dirigidos')
+        return {'total': resultado.total, 'porNodo': resultado.porNodo, 'clustering': resultado.clustering, 'transitividad': resultado.transitividad()}
+    if medida == 'pagerank':
+        resultado = AnalisisCentralidad.calcularPageRank(adyacencia)
+    elif medida == 'vectorPropio':
+        resultado = AnalisisCentralidad.calcularCentralidadVectorPropio(adyacencia)
+    elif medida == 'intermediacion':
+        resultado = AnalisisCentralidad.calcularIntermediacion(adyacencia, procesos=1) # Ya se está en un proceso del grupo
+    else:
+        raise ValueError(f'Medida desconocida: {medida}')
+    return {'medida': medida, 'valores': resultado.valores, 'iteraciones': resultado.iteraciones, 'convergio': resultado.convergio}
+
+
+class MetricasLatencia:
+    '''
+    ---
+    MetricasLatencia
+    ---
+
+    Guarda cuántas solicitudes de cada operación se atendieron, cuántas terminaron con error y las últimas MUESTRAS_LATENCIA latencias, con las que se calculan la mediana, el percentil 95 y el máximo.
+    '''
+
+    def __init__(self):
+        self._operaciones: Dict[str, Tuple[List[int], Deque[float]]] = {} # operacion -> ([solicitudes, errores], latencias)
+
+    def registrar(self, operacion: str, segundos: float, error: bool) -> None:
+        contadores, latencias = self._operaciones.setdefault(operacion, ([0, 0], deque(maxlen=MUESTRAS_LATENCIA)))
+        contadores[0] += 1
+        contadores[1] += error
+        latencias.append(segundos)
+
+    def resumen(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        resumen = {}
+        for operacion, ((solicitudes, errores), latencias) in self._operaciones.items():
+            ordenadas = sorted(latencias)
+            resumen[operacion] = {
+                'solicitudes': solicitudes,
+                'errores': errores,
+                'promedio': sum(ordenadas) / len(ordenadas),
+                'p50': ordenadas[len(ordenadas) // 2],
+                'p95': ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.95))],
+                'maximo': ordenadas[-1],
+            }
+        return resumen
+
+
+class ServidorGrafos:
+    '''
+    ---
+    ServidorGrafos
+    ---
+
+    Atiende solicitudes JSON sobre grafos que se mantienen cargados mientras el servidor está activo.
+
+    ---
+    Descripción:
+    ---
+    Las consultas rápidas (BFS, DFS, rutas) y las ediciones se ejecutan en el bucle de asyncio, una a la vez, así una consulta nunca ve un grafo a medio editar. Las consultas pesadas (centralidades y triángulos) se ejecutan en un grupo de procesos sobre una copia de la adyacencia del grafo, que se construye una sola vez y se descarta cuando el grafo se edita.
+
+    Cargar y guardar grafos usa el catálogo, la caché y los diarios de almacenamiento, que no están pensados para usarse desde varios hilos, así que se hace siempre en un único hilo aparte para no detener las demás consultas mientras se lee un grafo grande. Las ediciones de un grafo esperan a que se guarde la anterior.
+
+    ---
+    Ejemplo de uso:
+    ---
+    ```python
+    servidor = ServidorGrafos(procesos=2)
+    asyncio.run(servidor.servir(puerto=8765))
+    ```
+    '''
+
+    def __init__(self, procesos: Union[int, None] = None):
+        '''
+        Args:
+            - procesos: Procesos del grupo para las consultas pesadas, None para usar todos los núcleos.
+        '''
+        self.procesos = procesos
+        self.metricas = MetricasLatencia()
+        self._grafos: Dict[str, Union['GrafoDirigido', 'GrafoNoDirigido']] = {}
+        self._adyacencias: Dict[str, 'Adyacencia'] = {}
+        self._cerrojos: Dict[str, asyncio.Lock] = {}
+        self._almacenamiento = ThreadPoolExecutor(1)
+        self._grupo: Union[ProcessPoolExecutor, None] = None # Se crea con la primera consulta pesada
+
+    def _cerrojo(self, nombreGrafo: str) -> asyncio.Lock:
+        return self._cerrojos.setdefault(nombreGrafo, asyncio.Lock())
+
+    async def _almacenar(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._almacenamiento, funcion, *args)
+
+    async def _obtenerGrafo(self, nombreGrafo: str) -> Union['GrafoDirigido', 'GrafoNoDirigido']:
+        '''
+        Devuelve el grafo cargado o lo carga con obtenerGrafo en el hilo de almacenamiento. Si varias solicitudes piden el mismo grafo mientras se carga, se carga una sola vez.
+        '''
+        grafo = self._grafos.get(nombreGrafo)
+        if grafo != None:
+            return grafo
+        if type(nombreGrafo) != str:
+            raise ValueError('Falta el nombre del grafo')
+        async with self._cerrojo(nombreGrafo):
+            if nombreGrafo not in self._grafos:
+                if not existeGrafo(nombreGrafo):
+                    raise ValueError(f'No existe el grafo {nombreGrafo}')
+                self._grafos[nombreGrafo] = await self._almacenar(obtenerGrafo, nombreGrafo)
+            return self._grafos[nombreGrafo]
+
+    def _obtenerAdyacencia(self, nombreGrafo: str) -> 'Adyacencia':
+        adyacencia = self._adyacencias.get(nombreGrafo)
+        if adyacencia == None:
+            adyacencia = self._adyacencias[nombreGrafo] = Adyacencia.obtener(self._grafos[nombreGrafo])
+        return adyacencia
+
+    async def _editar(self, nombreGrafo: str, editar: Callable[['Grafo'], Dict[str, Any]]) -> Dict[str, Any]:
+        '''
+        Aplica la edición al grafo en el bucle y guarda sus cambios con guardarGrafo en el hilo de almacenamiento.
+        '''
+        grafo = await self._obtenerGrafo(nombreGrafo)
+        async with self._cerrojo(nombreGrafo):
+            resultado = editar(grafo)
+            self._adyacencias.pop(nombreGrafo, None)
+            await self._almacenar(guardarGrafo, grafo, nombreGrafo)
+        return resultado
+
+    async def _calcular(self, nombreGrafo: str, operacion: str, medida: Union[str, None] = None) -> Dict[str, Any]:
+        await self._obtenerGrafo(nombreGrafo)
+        if self._grupo == None:
+            self._grupo = ProcessPoolExecutor(self.procesos)
+        return await asyncio.get_running_loop().run_in_executor(self._grupo, _calcularEnProceso, operacion, self._obtenerAdyacencia(nombreGrafo), medida)
+
+    async def _descargar(self, nombreGrafo: str) -> Dict[str, Any]:
+        async with self._cerrojo(nombreGrafo):
+            grafo = self._grafos.pop(nombreGrafo, None)
+            self._adyacencias.pop(nombreGrafo, None)
+            if grafo != None:
+                await self._almacenar(cerrarGrafo, grafo)
+        return {'descargado': grafo != None}
+
+    def _estadisticas(self, nombreGrafo: Union[str, None]) -> Dict[str, Any]:
+        if nombreGrafo != None:
+            grafo = self._grafos.get(nombreGrafo)
+            if grafo == None:
+                raise ValueError(f'El grafo {nombreGrafo} no está cargado')
+            return {'dirigido': grafo.esDirigido(), 'nodos': len(grafo.nodos), 'aristas': len(grafo.aristas)}
+        return {
+            'operaciones': self.metricas.resumen(),
+            'grafos': {nombre: {'nodos': len(grafo.nodos), 'aristas': len(grafo.aristas)} for nombre, grafo in self._grafos.items()},
+            'cache': cacheGrafos.estadisticas(),
+        }
+
+    async def atender(self, solicitud: Dict[str, Any]) -> Dict[str, Any]:
+        '''
+        Ejecuta una solicitud y devuelve su resultado. Los errores de la solicitud se lanzan como ValueError.
+        '''
+        operacion = solicitud.get('op')
+        nombreGrafo = solicitud.get('grafo')
+        if operacion in ('bfs', 'dfs'):
+            grafo = await self._obtenerGrafo(nombreGrafo)
+            return recorrer(grafo, operacion, solicitud['desde'], solicitud.get('hasta'))
+        if operacion == 'ruta':
+            await self._obtenerGrafo(nombreGrafo)
+            resultado = AlgoritmoDijkstra.encontrarRutaMasCorta(self._obtenerAdyacencia(nombreGrafo), solicitud['desde'], solicitud['hasta'])
+            return {'ruta': resultado[0], 'costo': resultado[1]} if resultado != None else {'ruta': None}
+        if operacion == 'centralidad':
+            return await self._calcular(nombreGrafo, operacion, solicitud.get('medida', 'pagerank'))
+        if operacion == 'triangulos':
+            return await self._calcular(nombreGrafo, operacion)
+        if operacion == 'agregarNodo':
+            def agregarNodo(grafo):
+                nodo = Nodo(solicitud['idNodo'], solicitud.get('contenido')) if 'idNodo' in solicitud else Nodo(contenido=solicitud.get('contenido'))
+                grafo.agregarNodo(nodo)
+                return {'idNodo': nodo.identificador}
+            return await self._editar(nombreGrafo, agregarNodo)
+        if operacion == 'agregarArista':
+            return await self._editar(nombreGrafo, lambda grafo: {'agregada': bool(grafo.agregarArista(solicitud['a'], solicitud['b'], peso=solicitud.get('peso', 1)))})
+        if operacion == 'eliminarNodo':
+            return await self._editar(nombreGrafo, lambda grafo: {'eliminado': bool(grafo.eliminarNodo(solicitud['idNodo']))})
+        if operacion == 'eliminarArista':
+            if 'idArista' in solicitud:
+                return await self._editar(nombreGrafo, lambda grafo: {'eliminada': bool(grafo.eliminarArista(solicitud['idArista']))})
+            return await self._editar(nombreGrafo, lambda grafo: {'eliminada': bool(grafo.eliminarArista(solicitud['a'], solicitud['b']))})
+        if operacion == 'descargar':
+            return await self._descargar(nombreGrafo)
+        if operacion == 'stats':
+            return self._estadisticas(nombreGrafo)
+        raise ValueError(f'Operación desconocida: {operacion}')
+
+    async def _responder(self, linea: bytes, escritor: asyncio.StreamWriter) -> None:
+        inicio = time.perf_counter()
+        operacion = None
+        respuesta: Dict[str, Any] = {}
+        try:
+            solicitud = json.loads(linea)
+            if type(solicitud) != dict:
+                raise ValueError('La solicitud debe ser un objeto JSON')
+            if 'id' in solicitud:
+                respuesta['id'] = solicitud['id']
+            operacion = solicitud.get('op')
+            if 'grafo' in solicitud:
+                respuesta['grafo'] = solicitud['grafo']
+            respuesta.update(await self.atender(solicitud))
+        except KeyError as e:
+            respuesta['error'] = f'Falta el campo {e}'
+        except Exception as e: # La respuesta siempre se envía, aunque falle un proceso del grupo
+            respuesta['error'] = str(e) or type(e).__name__
+        segundos = time.perf_counter() - inicio
+        self.metricas.registrar(operacion if operacion in OPERACIONES else 'desconocida', segundos, 'error' in respuesta)
+        respuesta['segundos'] = segundos
+        escritor.write(json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    async def _atenderConexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        pendientes = set()
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                if linea.strip():
+                    tarea = asyncio.create_task(self._responder(linea, escritor))
+                    pendientes.add(tarea)
+                    tarea.add_done_callback(pendientes.discard)
+                    await escritor.drain()
+            if pendientes:
+                await asyncio.wait(pendientes)
+            await escritor.drain()
+        except (ConnectionError, ValueError): # ValueError si la línea supera LIMITE_LINEA
+            pass
+        except asyncio.CancelledError: # Se detuvo el servidor con la conexión abierta
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self, puerto: int = 8765, socket: Union[str, None] = None) -> None:
+        '''
+        Atiende conexiones en localhost:puerto, o en el socket UNIX indicado, hasta que se cancela la tarea (Ctrl+C). Al terminar se cierran los grafos cargados y los grupos de procesos.
+        '''
+        obtenerCatalogo() # Se crea antes de que lo use el hilo de almacenamiento
+        if socket != None:
+            servidor = await asyncio.start_unix_server(self._atenderConexion, socket, limit=LIMITE_LINEA)
+        else:
+            servidor = await asyncio.start_server(self._atenderConexion, '127.0.0.1', puerto, limit=LIMITE_LINEA)
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            self._almacenamiento.shutdown()
+            for nombreGrafo in list(self._grafos):
+                cerrarGrafo(self._grafos.pop(nombreGrafo))
+            if self._grupo != None:
+                self._grupo.shutdown()
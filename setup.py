@@ -1,6 +1,7 @@
 from setuptools import setup 
 
-setup(name='proyecto', version='1.0.0', packages=['proyecto'],
+setup(name='proyecto', version='1.0.0', packages=['proyecto', 'proyecto.modelos', 'proyecto.bench'],
+install_requires=['art'],
 entry_points={
-    'console_scripts': ['proyecto = proyecto.__main__:main']
-})
\ No newline at end of file
+    'console_scripts': ['proyecto = proyecto.cli:main']
+})